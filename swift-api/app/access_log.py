@@ -0,0 +1,65 @@
+"""
+Opt-in access log (ACCESS_LOG_ENABLED), one line per request in logs/access.log:
+
+    <time> - swiftapi.access - INFO - POST /v1/swift-codes/lookup 200 3.52 ms "{\"swiftCodes\": [...]}"
+
+Request bodies up to ACCESS_LOG_MAX_BODY bytes are kept as a JSON string ("-" when
+empty or larger), so benchmarks/replay.py can send the same requests again.
+"""
+
+import json
+import os
+import time
+from app.logger import get_logger
+
+access_logger = get_logger("access")
+
+ACCESS_LOG_ENABLED = os.getenv("ACCESS_LOG_ENABLED", "false").lower() in ("1", "true", "yes")
+ACCESS_LOG_MAX_BODY = int(os.getenv("ACCESS_LOG_MAX_BODY", "65536"))
+
+
+def request_target(scope) -> str:
+    query = scope["query_string"].decode("latin-1")
+    return scope["path"] + (f"?{query}" if query else "")
+
+
+class AccessLogMiddleware:
+    def __init__(self, app, max_body: int = ACCESS_LOG_MAX_BODY):
+        self.app = app
+        self.max_body = max_body
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        body = []
+        status_code = 500
+        start = time.perf_counter()
+
+        async def receive_wrapper():
+            message = await receive()
+            if message["type"] == "http.request":
+                body.append(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            content = b"".join(body)
+            access_logger.info(
+                "%s %s %s %.2f ms %s",
+                scope["method"],
+                request_target(scope),
+                status_code,
+                (time.perf_counter() - start) * 1000,
+                json.dumps(content.decode("utf-8", "replace"))
+                if content and len(content) <= self.max_body
+                else "-",
+            )
@@ -1,24 +1,114 @@
 import os
-from sqlmodel import create_engine, SQLModel, Session
+import time
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlmodel import create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import Depends
 from typing import Annotated
 from dotenv import load_dotenv
 
 load_dotenv()
 
-DATABASE_URL = f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
+DATABASE_URL = os.getenv("DATABASE_URL") or (
+    f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
+)
 
-engine = create_engine(DATABASE_URL)
+# Async drivers used by API request handlers for each supported database
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
 
-def create_db_and_tables():
-    # SQLModel.metadata.drop_all(engine)
-    SQLModel.metadata.create_all(engine)
+def to_async_url(url: str) -> str:
+    """Returns the same database URL with the async driver of its backend"""
+    url = make_url(url)
+    return url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()]).render_as_string(
+        hide_password=False
+    )
 
 
-def get_session():
-    with Session(engine) as session:
+# Connection pool settings, defaults are SQLAlchemy's own
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))  # Seconds, -1 never recycles
+POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+
+POOL_OPTIONS = {
+    "pool_size": POOL_SIZE,
+    "max_overflow": POOL_MAX_OVERFLOW,
+    "pool_timeout": POOL_TIMEOUT,
+    "pool_recycle": POOL_RECYCLE,
+    "pool_pre_ping": POOL_PRE_PING,
+}
+
+
+def uses_queue_pool(url: str) -> bool:
+    """Whether SQLAlchemy pools connections to `url` in a queue (not e.g. in-memory SQLite)"""
+    url = make_url(url)
+    return issubclass(url.get_dialect().get_pool_class(url), QueuePool)
+
+
+def pool_options(url: str) -> dict:
+    """POOL_OPTIONS accepted by the default pool of `url`, size and timeout only apply to queues"""
+    if uses_queue_pool(url):
+        return POOL_OPTIONS
+    return {"pool_recycle": POOL_RECYCLE, "pool_pre_ping": POOL_PRE_PING}
+
+
+class PoolStats:
+    """Cumulative connection checkout statistics of the request handlers' pool"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_checkout(self, wait: float, timed_out: bool = False):
+        self.checkouts += 1
+        self.timeouts += timed_out
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool measuring how long checkouts wait for a free connection"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_stats.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+# Sync engine for migrations, scripts and background work (snapshot loading)
+engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL))
+
+# Async engine for request handlers, queries don't block the event loop
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+if uses_queue_pool(ASYNC_DATABASE_URL):
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, **POOL_OPTIONS
+    )
+else:
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_options(ASYNC_DATABASE_URL))
+
+
+async def get_session():
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
         yield session
 
 
-SessionDep = Annotated[Session, Depends(get_session)]
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
@@ -0,0 +1,54 @@
+import hashlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+from sqlalchemy import Connection, delete, insert, select
+from app.models import LoadCheckpoint
+
+checkpoints = LoadCheckpoint.__table__
+
+
+def file_hash(file_path: Path) -> str:
+    """SHA-256 of file content, identifies the source of a checkpoint"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_checkpoint(connection: Connection, source_hash: str, table_name: str) -> Optional[LoadCheckpoint]:
+    row = connection.execute(
+        select(checkpoints).where(
+            checkpoints.c.fileHash == source_hash, checkpoints.c.tableName == table_name
+        )
+    ).first()
+    return LoadCheckpoint(**row._mapping) if row else None
+
+
+def save_checkpoint(
+    connection: Connection,
+    source_hash: str,
+    table_name: str,
+    rows_processed: int,
+    rows_loaded: int,
+):
+    """Records progress, commit it in the same transaction as the rows it covers"""
+    clear_checkpoint(connection, source_hash, table_name)
+    connection.execute(
+        insert(checkpoints).values(
+            fileHash=source_hash,
+            tableName=table_name,
+            rowsProcessed=rows_processed,
+            rowsLoaded=rows_loaded,
+            updatedAt=datetime.now(timezone.utc).replace(tzinfo=None),
+        )
+    )
+
+
+def clear_checkpoint(connection: Connection, source_hash: str, table_name: str):
+    connection.execute(
+        delete(checkpoints).where(
+            checkpoints.c.fileHash == source_hash, checkpoints.c.tableName == table_name
+        )
+    )
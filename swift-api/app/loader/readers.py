@@ -0,0 +1,62 @@
+from pathlib import Path
+from typing import Iterator
+import pandas as pd
+from openpyxl import load_workbook
+
+CHUNK_SIZE = 50_000
+
+
+def read_chunks(file_path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Reads input file in chunks of at most `chunk_size` rows, so memory use doesn't depend
+    on file size. Supports .xlsx, .csv and .parquet (requires pyarrow).
+
+    Index of every chunk is the row position in the file (0 = first row after header).
+    """
+    suffix = file_path.suffix.lower()
+    if suffix in (".xlsx", ".xlsm"):
+        return read_excel_chunks(file_path, chunk_size)
+    if suffix == ".csv":
+        # String dtype everywhere, codes like "00000000XXX" must not turn into numbers
+        return iter(pd.read_csv(file_path, dtype=str, keep_default_na=False, chunksize=chunk_size))
+    if suffix == ".parquet":
+        return read_parquet_chunks(file_path, chunk_size)
+    raise ValueError(f"Unsupported input file type: {suffix}")
+
+
+def read_excel_chunks(file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        chunk, index = [], []
+        for position, row in enumerate(rows):
+            if all(value is None for value in row):
+                continue  # read-only mode may report trailing empty rows
+            chunk.append(row)
+            index.append(position)
+            if len(chunk) == chunk_size:
+                yield pd.DataFrame(chunk, columns=header, index=index, dtype=str)
+                chunk, index = [], []
+        if chunk:
+            yield pd.DataFrame(chunk, columns=header, index=index, dtype=str)
+    finally:
+        workbook.close()
+
+
+def read_parquet_chunks(file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Reading Parquet files requires pyarrow (pip install pyarrow)")
+
+    start = 0
+    for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunk_size):
+        chunk = batch.to_pandas()
+        chunk = chunk.astype(str).where(chunk.notna())
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        start += len(chunk)
+        yield chunk
@@ -0,0 +1,103 @@
+from typing import List
+from sqlalchemy import Connection, MetaData, Table, and_, delete, func, inspect, select
+from sqlalchemy.schema import CreateTable
+from app.models import SwiftCode
+
+# Blue/green generations of the SwiftCode table. The loader fills the staging table
+# while the API keeps reading the live one, then both are swapped by renaming.
+LIVE_TABLE = SwiftCode.__tablename__
+STAGING_TABLE = f"{LIVE_TABLE}_staging"
+PREVIOUS_TABLE = f"{LIVE_TABLE}_previous"
+
+
+def generation_table(name: str) -> Table:
+    """
+    Copy of the SwiftCode table named `name`. Index and primary key names follow the table
+    name like the live ones do (ix_swiftcode_bankCode -> ix_swiftcode_staging_bankCode),
+    as index names must be unique in the whole schema.
+    """
+    table = SwiftCode.__table__.to_metadata(MetaData(), name=name)
+    table.primary_key.name = f"{name}_pkey"
+    for index in table.indexes:
+        # Names of column-level indexes (index=True) already come from the new table name
+        if not index.name.startswith(f"ix_{name}_"):
+            index.name = index.name.replace(f"ix_{LIVE_TABLE}_", f"ix_{name}_", 1)
+    return table
+
+
+def create_staging_table(connection: Connection) -> Table:
+    """
+    Creates an empty staging table, dropping leftovers of an interrupted load.
+    Indexes are built later by build_indexes(), once rows are in.
+    """
+    staging = generation_table(STAGING_TABLE)
+    staging.drop(connection, checkfirst=True)
+    connection.execute(CreateTable(staging))
+    return staging
+
+
+def build_indexes(connection: Connection, table: Table):
+    for index in table.indexes:
+        index.create(connection)
+    if connection.dialect.name == "postgresql":
+        # Fresh planner statistics, so the first queries after swap get the same plans
+        connection.exec_driver_sql(f'ANALYZE "{table.name}"')
+
+
+def remove_orphaned_branches(connection: Connection, table: Table) -> List[str]:
+    """Deletes branches whose headquarter is not in the table, returns their codes"""
+    headquarters = select(table.c.bankCode).where(table.c.isHeadquarter.is_(True))
+    orphaned = and_(table.c.isHeadquarter.is_(False), table.c.bankCode.not_in(headquarters))
+
+    codes = connection.execute(
+        select(table.c.swiftCode).where(orphaned).order_by(table.c.swiftCode)
+    ).scalars().all()
+    if codes:
+        connection.execute(delete(table).where(orphaned))
+    return list(codes)
+
+
+def count_rows(connection: Connection, table: Table) -> int:
+    return connection.execute(select(func.count()).select_from(table)).scalar_one()
+
+
+def rename_generation(connection: Connection, old: str, new: str):
+    """Renames table `old` to `new` together with its indexes and primary key"""
+    old_table, new_table = generation_table(old), generation_table(new)
+    connection.exec_driver_sql(f'ALTER TABLE "{old}" RENAME TO "{new}"')
+
+    if connection.dialect.name == "postgresql":
+        new_indexes = {index.name.replace(new, old, 1): index.name for index in new_table.indexes}
+        renames = [(old_table.primary_key.name, new_table.primary_key.name)]
+        renames += [(index.name, new_indexes[index.name]) for index in old_table.indexes]
+        for old_name, new_name in renames:
+            connection.exec_driver_sql(f'ALTER INDEX "{old_name}" RENAME TO "{new_name}"')
+    else:
+        # SQLite can't rename indexes, they are small enough to rebuild
+        for index in old_table.indexes:
+            connection.exec_driver_sql(f'DROP INDEX "{index.name}"')
+        for index in new_table.indexes:
+            index.create(connection)
+
+
+def swap_tables(connection: Connection):
+    """
+    Makes staging the live table and keeps the live one as previous generation,
+    dropping the one before. Run in a single transaction - atomic on PostgreSQL,
+    where readers wait only for the renames, not for the load.
+    """
+    tables = inspect(connection).get_table_names()
+    if PREVIOUS_TABLE in tables:
+        generation_table(PREVIOUS_TABLE).drop(connection)
+    rename_generation(connection, LIVE_TABLE, PREVIOUS_TABLE)
+    rename_generation(connection, STAGING_TABLE, LIVE_TABLE)
+
+
+def rollback_tables(connection: Connection):
+    """Swaps previous generation back in, the current one becomes previous"""
+    if PREVIOUS_TABLE not in inspect(connection).get_table_names():
+        raise RuntimeError(f"No previous generation to roll back to ({PREVIOUS_TABLE} not found)")
+    generation_table(STAGING_TABLE).drop(connection, checkfirst=True)
+    rename_generation(connection, LIVE_TABLE, STAGING_TABLE)
+    rename_generation(connection, PREVIOUS_TABLE, LIVE_TABLE)
+    rename_generation(connection, STAGING_TABLE, PREVIOUS_TABLE)
@@ -0,0 +1,91 @@
+from typing import Dict, Iterable, List, Set
+import pandas as pd
+from sqlalchemy import Connection, Table, select
+from app.loader.validation import COLUMNS
+from app.models import SwiftCode
+
+# Columns compared between input and database, the rest is derived from swiftCode
+HASHED_COLUMNS = ["bankName", "address", "countryISO2", "countryName"]
+
+
+def content_hashes(rows: pd.DataFrame) -> pd.Series:
+    """Hash of compared columns for each row, indexed by SWIFT code"""
+    hashes = pd.util.hash_pandas_object(rows[HASHED_COLUMNS], index=False)
+    hashes.index = rows["swiftCode"]
+    return hashes
+
+
+def existing_hashes(connection: Connection, table: Table = SwiftCode.__table__) -> Dict[str, int]:
+    """Content hashes of all rows currently in the table"""
+    result = connection.execute(select(table.c.swiftCode, *(table.c[c] for c in HASHED_COLUMNS)))
+    rows = pd.DataFrame(result.all(), columns=["swiftCode", *HASHED_COLUMNS])
+    return content_hashes(rows).to_dict() if len(rows) else {}
+
+
+class SyncPlan:
+    """
+    Changes turning the database into a copy of the input file.
+    Feed validated input chunks to add_chunk(), then call finalize().
+    """
+
+    def __init__(self, existing: Dict[str, int]):
+        self.existing = existing
+        self.input_codes: Set[str] = set()
+        self.rejected_codes: Set[str] = set()  # Codes of input rows that failed validation
+        self.changed: List[pd.DataFrame] = []  # Input rows new or different from the database
+
+        # Filled in by finalize()
+        self.upserts = pd.DataFrame(columns=COLUMNS)
+        self.deletes: List[str] = []
+        self.inserted = self.updated = self.unchanged = 0
+
+    def add_chunk(self, rows: pd.DataFrame, rejected: Iterable[str] = ()):
+        hashes = content_hashes(rows)
+        is_changed = [self.existing.get(code) != value for code, value in hashes.items()]
+
+        self.input_codes.update(rows["swiftCode"])
+        self.changed.append(rows[is_changed])
+        self.rejected_codes.update(rejected)
+
+    def kept_codes(self) -> Set[str]:
+        """
+        Existing codes of rejected input rows and the existing HQs of those branches.
+        The file has them, it's just not readable, so they keep their database state.
+        """
+        kept = self.rejected_codes & self.existing.keys()
+        headquarters = {code[:8] + "XXX" for code in kept if not code.endswith("XXX")}
+        return kept | (headquarters & self.existing.keys())
+
+    def orphaned_branches(self, kept: Set[str] = frozenset()) -> Set[str]:
+        """Input branches whose HQ is not in the input, same rule as POST /v1/swift-codes"""
+        return {
+            code
+            for code in self.input_codes
+            if not code.endswith("XXX")
+            and code[:8] + "XXX" not in self.input_codes
+            and code[:8] + "XXX" not in kept
+        }
+
+    def finalize(self) -> Set[str]:
+        """
+        Computes upserts and deletes. Orphaned branches are left out of the database
+        like any other code missing from the input; they are returned for reporting.
+        Codes of rejected rows are never deleted (see kept_codes), so a malformed HQ row
+        doesn't take its branches with it.
+        """
+        kept = self.kept_codes()
+        orphans = self.orphaned_branches(kept)
+        self.input_codes -= orphans
+
+        if self.changed:
+            upserts = pd.concat(self.changed)
+            self.upserts = upserts[~upserts["swiftCode"].isin(orphans)]
+
+        self.updated = int(self.upserts["swiftCode"].isin(self.existing.keys()).sum())
+        self.inserted = len(self.upserts) - self.updated
+        self.unchanged = len(self.input_codes & self.existing.keys()) - self.updated
+
+        # Every code staying is in the input or kept together with its HQ,
+        # so no HQ is deleted while its branches stay
+        self.deletes = sorted(self.existing.keys() - self.input_codes - kept)
+        return orphans
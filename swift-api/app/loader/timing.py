@@ -0,0 +1,61 @@
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List
+
+# Report order, stages are entered nested (validate pulls chunks from read)
+STAGES = ["read", "validate", "write", "index"]
+
+
+class StageTimer:
+    """
+    Wall time and row counts per loader stage (read, validate, write, index).
+    Stages may nest, time spent in the inner stage is not counted in the outer one.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.rows: Dict[str, int] = {}
+        self._stack: List[str] = []
+        self._mark = 0.0
+
+    def _add(self, name: str, seconds: float):
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str):
+        now = time.perf_counter()
+        if self._stack:
+            self._add(self._stack[-1], now - self._mark)
+        self._stack.append(name)
+        self._mark = now
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._add(self._stack.pop(), now - self._mark)
+            self._mark = now
+
+    def count(self, name: str, rows: int):
+        self.rows[name] = self.rows.get(name, 0) + rows
+
+    def timed(self, items: Iterable, name: str, size: Callable = len) -> Iterator:
+        """Passes items through, counting time spent producing them and their rows"""
+        items = iter(items)
+        while True:
+            with self.stage(name):
+                item = next(items, None)
+            if item is None:
+                return
+            self.count(name, size(item))
+            yield item
+
+    def report(self) -> str:
+        lines = [f"{'Stage':<10}{'Time':>10}{'Rows':>12}{'Rows/s':>12}"]
+        order = STAGES + [name for name in self.seconds if name not in STAGES]
+        for name in (name for name in order if name in self.seconds):
+            seconds = self.seconds[name]
+            rows = self.rows.get(name, 0)
+            rate = f"{rows / seconds:,.0f}" if seconds > 0 else "-"
+            lines.append(f"{name:<10}{seconds:>9.2f}s{rows:>12,}{rate:>12}")
+        lines.append(f"{'total':<10}{sum(self.seconds.values()):>9.2f}s")
+        return "\n".join(lines)
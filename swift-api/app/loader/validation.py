@@ -0,0 +1,147 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+import pandas as pd
+
+# Column names in the source file -> SwiftCode fields
+SOURCE_COLUMNS = {
+    "SWIFT CODE": "swiftCode",
+    "NAME": "bankName",
+    "ADDRESS": "address",
+    "COUNTRY ISO2 CODE": "countryISO2",
+    "COUNTRY NAME": "countryName",
+}
+
+# Column order of rows passed to writers
+COLUMNS = [
+    "swiftCode",
+    "bankName",
+    "address",
+    "countryISO2",
+    "countryName",
+    "isHeadquarter",
+    "bankCode",
+]
+
+# Text columns are stored as in the file (see SwiftCode), only their length is limited
+MAX_LENGTHS = {
+    "bankName": (100, "Bank name"),
+    "address": (250, "Address"),
+    "countryName": (60, "Country name"),
+}
+
+
+class ValidatedChunk(NamedTuple):
+    size: int  # Source rows in the chunk
+    end: int  # Position of the row after the chunk
+    rows: pd.DataFrame
+    errors: List[Tuple[int, str]]
+    # Normalized SWIFT codes of rejected rows, whatever they are
+    rejected: FrozenSet[str] = frozenset()
+
+
+def excel_row(index: int) -> int:
+    return index + 2  # Excel rows are 1-indexed + header row
+
+
+def rejected_codes(swift_codes: pd.Series, errors: List[Tuple[int, str]]) -> FrozenSet[str]:
+    """SWIFT codes (source column of a chunk) of the rows reported in `errors`"""
+    rejected = swift_codes.loc[[row - 2 for row, _ in errors]]
+    return frozenset(rejected.fillna("").astype(str).str.strip().str.upper())
+
+
+def validate_frame(
+    df: pd.DataFrame, seen: Optional[Set[str]] = None
+) -> Tuple[pd.DataFrame, List[Tuple[int, str]]]:
+    """
+    Applies rules from app.validators to whole columns at once.
+
+    Returns valid rows with SwiftCode columns (see COLUMNS) and (Excel row, error)
+    for every rejected row. Frame index must be the row position in the source file.
+    `seen` - SWIFT codes accepted from previous chunks of the same file, updated in place.
+    """
+    values = {field: df[column].fillna("").astype(str) for column, field in SOURCE_COLUMNS.items()}
+    # Codes are normalized like app.validators does, other values are kept as they are
+    for field in ("swiftCode", "countryISO2"):
+        values[field] = values[field].str.strip().str.upper()
+    swift_code = values["swiftCode"]
+    country_code = values["countryISO2"]
+
+    # First failing rule of a row is reported, same order as the per-value validators
+    checks = [
+        (swift_code.str.len() != 11, "SWIFT code must be 11 characters long"),
+        (~swift_code.str[:6].str.isalpha(), "First 6 characters must be alphabetic"),
+        (~swift_code.str[6:].str.isalnum(), "Characters 7-11 must be alphanumeric"),
+        (country_code.str.len() != 2, "Country code must be exactly 2 characters long"),
+        (~country_code.str.isalpha(), "Country code must contain only alphabetic characters"),
+        (values["bankName"].str.strip() == "", "Bank name cannot be empty"),
+        (values["countryName"].str.strip() == "", "Country name cannot be empty"),
+    ]
+    checks += [
+        (values[field].str.len() > limit, f"{name} must be at most {limit} characters long")
+        for field, (limit, name) in MAX_LENGTHS.items()
+    ]
+    error = pd.Series(None, index=df.index, dtype=object)
+    for failed, message in checks:
+        error = error.mask(failed & error.isna(), message)
+    # Only a valid earlier copy makes a row a duplicate
+    duplicated = swift_code[error.isna()].duplicated()
+    error.loc[duplicated.index[duplicated]] = "Duplicate SWIFT code in file"
+
+    valid = error.isna()
+    rows = pd.DataFrame({field: column[valid] for field, column in values.items()})
+    rows["isHeadquarter"] = rows["swiftCode"].str.endswith("XXX")
+    rows["bankCode"] = rows["swiftCode"].str[:8]
+
+    errors = [(excel_row(idx), message) for idx, message in error[~valid].items()]
+    if seen is not None:
+        rows, duplicates = drop_seen(rows, seen)
+        errors = sorted(errors + duplicates)
+    return rows[COLUMNS], errors
+
+
+def drop_seen(rows: pd.DataFrame, seen: Set[str]) -> Tuple[pd.DataFrame, List[Tuple[int, str]]]:
+    """
+    Rejects valid rows whose SWIFT code was accepted from an earlier chunk
+    and adds the remaining codes to `seen`.
+    """
+    duplicated = rows["swiftCode"].isin(seen)
+    errors = [(excel_row(idx), "Duplicate SWIFT code in file") for idx in rows.index[duplicated]]
+    rows = rows[~duplicated]
+    seen.update(rows["swiftCode"])
+    return rows, errors
+
+
+def validate_chunks(
+    chunks: Iterable[pd.DataFrame], seen: Set[str], workers: int = 1
+) -> Iterator[ValidatedChunk]:
+    """
+    Validates chunks with validate_frame() and yields results in input order.
+
+    With `workers` > 1 chunks are validated in a process pool. At most two chunks per worker
+    are in flight, so memory use stays bounded by chunk size. Duplicates across chunks are
+    checked here, in order, as they depend on all previous chunks.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            rows, errors = validate_frame(chunk, seen)
+            rejected = rejected_codes(chunk["SWIFT CODE"], errors)
+            yield ValidatedChunk(len(chunk), chunk.index[-1] + 1, rows, errors, rejected)
+        return
+
+    def merge(swift_codes, end, future):
+        rows, errors = future.result()
+        rows, duplicates = drop_seen(rows, seen)
+        errors = sorted(errors + duplicates)
+        return ValidatedChunk(len(swift_codes), end, rows, errors, rejected_codes(swift_codes, errors))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(
+                (chunk["SWIFT CODE"], chunk.index[-1] + 1, pool.submit(validate_frame, chunk))
+            )
+            if len(pending) >= workers * 2:
+                yield merge(*pending.popleft())
+        while pending:
+            yield merge(*pending.popleft())
@@ -0,0 +1,83 @@
+import io
+from typing import List
+import pandas as pd
+from sqlalchemy import Connection, Table, delete, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from app.loader.validation import COLUMNS
+from app.models import SwiftCode
+
+BATCH_SIZE = 10_000
+COPY_NULL = r"\N"
+
+
+def write_rows(
+    connection: Connection,
+    rows: pd.DataFrame,
+    table: Table = SwiftCode.__table__,
+    batch_size: int = BATCH_SIZE,
+):
+    """
+    Inserts validated rows (see validation.COLUMNS) in batches.
+    Uses COPY on PostgreSQL and executemany elsewhere. Transaction is up to the caller.
+    """
+    if connection.dialect.name == "postgresql":
+        copy_rows(connection, rows, table, batch_size)
+    else:
+        insert_rows(connection, rows, table, batch_size)
+
+
+def copy_rows(connection: Connection, rows: pd.DataFrame, table: Table, batch_size: int):
+    columns = ", ".join(f'"{column}"' for column in COLUMNS)
+    # CSV COPY reads unquoted empty fields as NULL by default, but empty text
+    # (e.g. a missing address) must stay an empty string
+    statement = f"""COPY "{table.name}" ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"""
+
+    cursor = connection.connection.cursor()
+    try:
+        for start in range(0, len(rows), batch_size):
+            buffer = io.StringIO()
+            rows.iloc[start : start + batch_size].to_csv(
+                buffer, index=False, header=False, na_rep=COPY_NULL
+            )
+            buffer.seek(0)
+            cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+
+
+def insert_rows(connection: Connection, rows: pd.DataFrame, table: Table, batch_size: int):
+    for start in range(0, len(rows), batch_size):
+        batch = rows.iloc[start : start + batch_size]
+        connection.execute(insert(table), batch.to_dict(orient="records"))
+
+
+def upsert_rows(
+    connection: Connection,
+    rows: pd.DataFrame,
+    table: Table = SwiftCode.__table__,
+    batch_size: int = BATCH_SIZE,
+):
+    """Inserts rows, replacing existing ones with the same SWIFT code (ON CONFLICT DO UPDATE)"""
+    dialect_insert = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}[
+        connection.dialect.name
+    ]
+    statement = dialect_insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.swiftCode],
+        set_={column: statement.excluded[column] for column in COLUMNS if column != "swiftCode"},
+    )
+    for start in range(0, len(rows), batch_size):
+        connection.execute(statement, rows.iloc[start : start + batch_size].to_dict(orient="records"))
+
+
+def delete_codes(
+    connection: Connection,
+    swift_codes: List[str],
+    table: Table = SwiftCode.__table__,
+    batch_size: int = BATCH_SIZE,
+):
+    for start in range(0, len(swift_codes), batch_size):
+        connection.execute(
+            delete(table).where(table.c.swiftCode.in_(swift_codes[start : start + batch_size]))
+        )
@@ -1,16 +1,77 @@
+import atexit
 import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Dict
 
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# Per-logger levels, e.g. "swiftapi.routers=WARNING,sqlalchemy.engine=INFO"
+LOG_LEVELS = os.getenv("LOG_LEVELS", "")
+
+
+def parse_levels(spec: str) -> Dict[str, str]:
+    """Parses "name=LEVEL,name=LEVEL" into {name: LEVEL}"""
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, level = item.partition("=")
+        if not level:
+            raise ValueError(f"Invalid LOG_LEVELS entry {item!r}, expected name=LEVEL")
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def exclude(name: str):
+    """Handler filter dropping records of logger `name` and its children"""
+    only = logging.Filter(name)
+    return lambda record: not only.filter(record)
+
+
+def setup_logging() -> QueueListener:
+    """
+    Request handlers only put records on a queue, a background thread of the
+    QueueListener writes them to the file and console.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [
         logging.FileHandler(LOG_DIR / "app.log"),  # File
-        logging.StreamHandler()  # Console
+        logging.StreamHandler(),  # Console
     ]
-)
+    # One line per request would drown everything else, it only goes to access.log
+    for handler in handlers:
+        handler.addFilter(exclude("swiftapi.access"))
+    # Slow queries (app.query_log) and access log (app.access_log) also get files of
+    # their own, created with the first record
+    for name in ("slow_queries", "access"):
+        handler = logging.FileHandler(LOG_DIR / f"{name}.log", delay=True)
+        handler.addFilter(logging.Filter(f"swiftapi.{name}"))
+        handlers.append(handler)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(LOG_LEVEL)
+    for name, level in parse_levels(LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+
+    listener.start()
+    atexit.register(listener.stop)  # Flushes records still in the queue
+    return listener
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    """Logger of an app module under "swiftapi", e.g. app.routers.swift_codes -> swiftapi.routers.swift_codes"""
+    return logging.getLogger(f"swiftapi.{module_name.removeprefix('app.')}")
+
 
+listener = setup_logging()
 logger = logging.getLogger("swiftapi")
@@ -1,19 +1,62 @@
+import asyncio
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
-from app.database import create_db_and_tables
-from app.routers import messages, swift_codes
+from app.access_log import ACCESS_LOG_ENABLED, AccessLogMiddleware
+from app.database import async_engine, engine
+from app.metrics import METRICS_ENABLED, MetricsMiddleware, instrument_engine
+from app.profiler import PROFILER_ENABLED, ProfilerMiddleware
+from app.query_log import SQL_INSTRUMENTATION_ENABLED, QueryLogMiddleware, instrument_queries
+from app.routers import internal, messages, metrics, swift_codes
+from app.snapshot import (
+    SNAPSHOT_ENABLED,
+    SNAPSHOT_REFRESH_SECONDS,
+    refresh_snapshot_periodically,
+    snapshot,
+    warm_up_snapshot,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    create_db_and_tables()
+    # Schema is managed by Alembic migrations (alembic upgrade head), not created on startup
+    refresh_task = None
+    if SNAPSHOT_ENABLED:
+        warm_up_snapshot()
+        if SNAPSHOT_REFRESH_SECONDS > 0:
+            refresh_task = asyncio.create_task(
+                refresh_snapshot_periodically(SNAPSHOT_REFRESH_SECONDS)
+            )
+
     yield
 
+    if refresh_task:
+        refresh_task.cancel()
+    if snapshot.loaded:
+        snapshot.invalidate()
+
 
 app = FastAPI(lifespan=lifespan)
 
 app.include_router(messages.router)
 app.include_router(swift_codes.router)
+app.include_router(internal.router)
+
+if METRICS_ENABLED:
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics.router)
+
+if SQL_INSTRUMENTATION_ENABLED:
+    instrument_queries(engine)
+    instrument_queries(async_engine.sync_engine)
+    app.add_middleware(QueryLogMiddleware)
+
+if ACCESS_LOG_ENABLED:
+    app.add_middleware(AccessLogMiddleware)
+
+if PROFILER_ENABLED:
+    app.add_middleware(ProfilerMiddleware)
 
 
 @app.get("/")
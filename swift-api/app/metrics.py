@@ -0,0 +1,306 @@
+"""
+In-process metrics in the Prometheus text exposition format, served at GET /metrics.
+
+Fed by MetricsMiddleware (HTTP requests) and instrument_engine() (SQLAlchemy
+cursor events). Each observation is a dict lookup and a few additions under a lock.
+"""
+
+import os
+import threading
+from abc import ABC, abstractmethod
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Seconds, suited for API requests and single queries
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Lines of the metric in the text exposition format"""
+
+    @abstractmethod
+    def reset(self):
+        """Drops recorded values"""
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(values)
+        ]
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [count per bucket (non-cumulative, last one is +Inf), sum]
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                series = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._values.get(labels)
+        return sum(series[0]) if series else 0
+
+    def sum(self, *labels: str) -> float:
+        series = self._values.get(labels)
+        return series[1] if series else 0.0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = [(labels, (list(counts), total)) for labels, (counts, total) in self._values.items()]
+
+        lines = self.header()
+        for labels, (counts, total) in sorted(values):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(float(bound))}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class GaugeFunction(Metric):
+    """Gauge read from a callback when metrics are rendered, None skips the sample"""
+
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, function: Callable[[], Optional[float]]):
+        super().__init__(name, documentation)
+        self.function = function
+
+    def render(self) -> List[str]:
+        value = self.function()
+        return self.header() + ([] if value is None else [f"{self.name} {_format_value(value)}"])
+
+    def reset(self):
+        pass
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self.metrics for line in metric.render()) + "\n"
+
+    def reset(self):
+        for metric in self.metrics:
+            metric.reset()
+
+
+registry = Registry()
+
+http_requests = registry.register(
+    Counter("http_requests_total", "HTTP requests by route and status code", ["method", "route", "status"])
+)
+http_request_duration = registry.register(
+    Histogram("http_request_duration_seconds", "HTTP request latency by route", ["method", "route"])
+)
+db_queries = registry.register(
+    Histogram(
+        "db_queries_per_request",
+        "Database queries executed while handling a request",
+        ["route"],
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+)
+db_request_duration = registry.register(
+    Histogram("db_duration_per_request_seconds", "Time spent in database queries per request", ["route"])
+)
+db_query_duration = registry.register(
+    Histogram("db_query_duration_seconds", "Duration of single database queries")
+)
+validation_failures = registry.register(
+    Counter("validation_failures_total", "Rejected input values by field", ["field"])
+)
+cache_lookups = registry.register(
+    Counter(
+        "cache_lookups_total",
+        "Lookups answered from an in-memory cache (hit) or the database (miss)",
+        ["cache", "result"],
+    )
+)
+
+
+def _hit_ratio(cache: str) -> Optional[float]:
+    hits, misses = cache_lookups.value(cache, "hit"), cache_lookups.value(cache, "miss")
+    return hits / (hits + misses) if hits + misses else None
+
+
+registry.register(
+    GaugeFunction(
+        "snapshot_cache_hit_ratio",
+        "Share of SWIFT code lookups served from the in-memory snapshot",
+        lambda: _hit_ratio("snapshot"),
+    )
+)
+
+
+def record_cache_lookup(cache: str, hit: bool, amount: int = 1):
+    cache_lookups.inc(cache, "hit" if hit else "miss", amount=amount)
+
+
+class RequestStats:
+    __slots__ = ("queries", "query_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+
+
+# Stats of the request being handled, queries outside of requests are not attributed
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the statement's execution context, a failed statement leaves nothing behind
+    if context is not None:
+        context._metrics_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_metrics_query_start", None)
+    if start is None:
+        return
+    duration = time.perf_counter() - start
+    db_query_duration.observe(duration)
+    stats = current_request.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += duration
+
+
+def instrument_engine(engine: Engine):
+    """Times every query of `engine` (use async_engine.sync_engine for async engines)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def route_label(scope) -> str:
+    # Route template, not the raw path, keeps the number of label values bounded
+    route = scope.get("route")
+    return getattr(route, "path", "unmatched")
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status code and database usage of every request.
+    Latency covers the whole response, including streamed bodies.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            current_request.reset(token)
+
+            method, route = scope["method"], route_label(scope)
+            http_requests.inc(method, route, str(status_code))
+            http_request_duration.observe(duration, method, route)
+            db_queries.observe(stats.queries, route)
+            db_request_duration.observe(stats.query_seconds, route)
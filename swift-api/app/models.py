@@ -1,4 +1,6 @@
+from datetime import datetime
 from typing import Optional, Self
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 from pydantic import field_validator, model_validator
 from app.validators import (
@@ -16,6 +18,16 @@ class Message(SQLModel, table=True):
     content: str
 
 
+class LoadCheckpoint(SQLModel, table=True):
+    """Progress of a loader run into `tableName`, used by load_swift_codes.py --resume"""
+
+    fileHash: str = Field(primary_key=True, max_length=64, description="SHA-256 of the source file")
+    tableName: str = Field(primary_key=True, max_length=63)
+    rowsProcessed: int = Field(description="Source rows before this position are committed")
+    rowsLoaded: int
+    updatedAt: datetime
+
+
 class SwiftCodeModelBase(SQLModel):
     swiftCode: str = Field(
         primary_key=True, min_length=11, max_length=11, description="SWIFT code"
@@ -80,8 +92,31 @@ class SwiftCodeModelBase(SQLModel):
         return v
 
 
+def bank_code_default(context) -> str:
+    return context.get_current_parameters()["swiftCode"][:8]
+
+
 class SwiftCode(SwiftCodeModelBase, table=True):
-    pass
+    # Keep in sync with migrations/versions (schema is managed by Alembic)
+    __table_args__ = (
+        Index(
+            "ix_swiftcode_countryISO2_swiftCode",
+            "countryISO2",
+            "swiftCode",
+            postgresql_include=["bankName", "address", "countryName", "isHeadquarter"],
+        ),
+    )
+
+    # First 8 characters of swiftCode, shared by HQ and its branches.
+    # Table models skip validators, so it's filled in on INSERT when not given explicitly
+    bankCode: Optional[str] = Field(
+        default=None,
+        max_length=8,
+        index=True,
+        nullable=False,
+        sa_column_kwargs={"default": bank_code_default},
+        description="Bank code (first 8 characters of SWIFT code)",
+    )
 
 
 class SwiftCodeRead(SwiftCodeModelBase):
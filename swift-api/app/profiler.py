@@ -0,0 +1,136 @@
+"""
+Opt-in per-request profiler.
+
+A request is profiled when it carries `X-Profile: <PROFILER_TOKEN>` or when it's
+picked by PROFILER_SAMPLE_RATE. Profiles are written to logs/ next to app.log:
+with pyinstrument installed as speedscope JSON (open on https://www.speedscope.app),
+otherwise as cProfile stats (.prof, e.g. for flameprof or snakeviz).
+The middleware is only added to the app when one of the settings is on.
+"""
+
+import asyncio
+import cProfile
+import hmac
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from app.logger import LOG_DIR, get_logger
+
+logger = get_logger(__name__)
+
+PROFILER_TOKEN = os.getenv("PROFILER_TOKEN", "")
+PROFILER_SAMPLE_RATE = float(os.getenv("PROFILER_SAMPLE_RATE", "0"))
+PROFILER_ENABLED = bool(PROFILER_TOKEN) or PROFILER_SAMPLE_RATE > 0
+
+PROFILE_HEADER = b"x-profile"
+
+
+def profile_path(method: str, path: str, suffix: str, directory: Path = LOG_DIR) -> Path:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", path).strip("_") or "root"
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return directory / f"profile-{stamp}-{method}-{slug}-{uuid.uuid4().hex[:8]}{suffix}"
+
+
+class PyinstrumentSession:
+    suffix = ".speedscope.json"
+
+    def __init__(self):
+        from pyinstrument import Profiler
+
+        self.profiler = Profiler(async_mode="enabled")
+
+    def start(self):
+        self.profiler.start()
+
+    def stop(self):
+        self.profiler.stop()
+
+    def write(self, file_path: Path):
+        from pyinstrument.renderers import SpeedscopeRenderer
+
+        file_path.write_text(self.profiler.output(renderer=SpeedscopeRenderer()))
+
+
+class CProfileSession:
+    """
+    Fallback profiler. It's deterministic, not sampling, so timings are inflated.
+    It sees only the event loop thread (not sync endpoints run in the threadpool)
+    and also records other requests running on the loop meanwhile.
+    """
+
+    suffix = ".prof"
+
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+
+    def start(self):
+        self.profiler.enable()
+
+    def stop(self):
+        self.profiler.disable()
+
+    def write(self, file_path: Path):
+        self.profiler.dump_stats(file_path)
+
+
+def _profiler_class():
+    try:
+        import pyinstrument  # noqa: F401
+    except ImportError:
+        return CProfileSession
+    return PyinstrumentSession
+
+
+class ProfilerMiddleware:
+    """ASGI middleware profiling requests selected by token header or sample rate"""
+
+    def __init__(
+        self,
+        app,
+        token: str = PROFILER_TOKEN,
+        sample_rate: float = PROFILER_SAMPLE_RATE,
+        directory: Path = LOG_DIR,
+    ):
+        self.app = app
+        self.token = token.encode()
+        self.sample_rate = sample_rate
+        self.directory = directory
+        self.session_class = _profiler_class()
+        # Python allows one active profiler at a time, overlapping requests aren't profiled
+        self._lock = threading.Lock()
+
+    def should_profile(self, scope) -> bool:
+        if self.token:
+            header = dict(scope["headers"]).get(PROFILE_HEADER)
+            if header is not None and hmac.compare_digest(header, self.token):
+                return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+        if not self._lock.acquire(blocking=False):
+            logger.debug("Profiler busy, %s %s not profiled", scope["method"], scope["path"])
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            session = self.session_class()
+            session.start()
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                session.stop()
+                file_path = profile_path(
+                    scope["method"], scope["path"], session.suffix, self.directory
+                )
+                # Rendering a big profile takes a while, keep it off the event loop
+                await asyncio.to_thread(session.write, file_path)
+                logger.info("Profile of %s %s written to %s", scope["method"], scope["path"], file_path)
+        finally:
+            self._lock.release()
@@ -0,0 +1,172 @@
+"""
+Opt-in SQL query instrumentation (SQL_INSTRUMENTATION_ENABLED).
+
+Every query is recorded with its parameters and duration under the ID of the
+request that ran it. Queries slower than SLOW_QUERY_MS go to the slow-query log
+(logs/slow_queries.log) together with their EXPLAIN plan.
+"""
+
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, NamedTuple, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+slow_query_logger = get_logger("slow_queries")
+
+SQL_INSTRUMENTATION_ENABLED = os.getenv("SQL_INSTRUMENTATION_ENABLED", "false").lower() in ("1", "true", "yes")
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+
+REQUEST_ID_HEADER = "x-request-id"
+NO_REQUEST = "-"
+
+EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN "}
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+EXPLAIN_SAVEPOINT = "query_log_explain"
+
+
+class QueryRecord(NamedTuple):
+    request_id: str
+    statement: str
+    parameters: Any
+    duration: float  # Seconds
+
+
+request_id: ContextVar[str] = ContextVar("request_id", default=NO_REQUEST)
+# Queries of the request being handled
+request_queries: ContextVar[Optional[List[QueryRecord]]] = ContextVar("request_queries", default=None)
+
+
+def explain(conn, statement: str, parameters) -> Optional[str]:
+    """
+    Plan of a query, run on a raw DBAPI cursor so it doesn't fire engine events.
+    Runs in a savepoint of the request's transaction, on PostgreSQL a failed statement
+    would abort the whole transaction.
+    """
+    prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+    if prefix is None or not statement.lstrip().upper().startswith(EXPLAINABLE):
+        return None
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            return "\n".join(" ".join(str(value) for value in row) for row in cursor.fetchall())
+        except Exception as e:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            return f"EXPLAIN failed: {e}"
+        finally:
+            cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+    except Exception as e:
+        return f"EXPLAIN failed: {e}"
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the statement's execution context, a failed statement leaves nothing behind
+    if context is not None:
+        context._query_log_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_query_log_start", None)
+    if start is None:
+        return
+    duration = time.perf_counter() - start
+    record = QueryRecord(request_id.get(), statement, parameters, duration)
+    queries = request_queries.get()
+    if queries is not None:
+        queries.append(record)
+    logger.debug("[%s] %.2f ms %s %r", record.request_id, duration * 1000, statement, parameters)
+
+    if duration * 1000 >= SLOW_QUERY_MS:
+        plan = None if executemany else explain(conn, statement, parameters)
+        slow_query_logger.warning(
+            "[%s] Slow query (%.2f ms): %s\nParameters: %r\nPlan:\n%s",
+            record.request_id,
+            duration * 1000,
+            statement,
+            parameters,
+            plan or "-",
+        )
+
+
+def instrument_queries(engine: Engine):
+    """Records every query of `engine` (use async_engine.sync_engine for async engines)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def capture_queries(engine: Engine) -> Iterator[List[QueryRecord]]:
+    """
+    Collects queries run by `engine` inside the block from any thread or task,
+    e.g. those of requests sent through TestClient.
+    """
+    queries: List[QueryRecord] = []
+
+    def before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._capture_start = time.perf_counter()
+
+    def after(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - getattr(context, "_capture_start", time.perf_counter())
+        queries.append(QueryRecord(request_id.get(), statement, parameters, duration))
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+        event.remove(engine, "after_cursor_execute", after)
+
+
+class QueryLogMiddleware:
+    """
+    ASGI middleware giving every request an ID (taken from the X-Request-ID header
+    or generated) that its queries are recorded under, and returning it in the response.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header = dict(scope["headers"]).get(REQUEST_ID_HEADER.encode())
+        current_id = header.decode("latin-1") if header else uuid.uuid4().hex
+        queries: List[QueryRecord] = []
+        id_token = request_id.set(current_id)
+        queries_token = request_queries.set(queries)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (REQUEST_ID_HEADER.encode(), current_id.encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_queries.reset(queries_token)
+            request_id.reset(id_token)
+            logger.debug(
+                "[%s] %s %s ran %s queries in %.2f ms",
+                current_id,
+                scope["method"],
+                scope["path"],
+                len(queries),
+                sum(query.duration for query in queries) * 1000,
+            )
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, HTTPException
+from sqlalchemy.pool import QueuePool
+from app.database import (
+    async_engine,
+    pool_stats,
+    POOL_SIZE,
+    POOL_MAX_OVERFLOW,
+    POOL_TIMEOUT,
+    POOL_RECYCLE,
+    POOL_PRE_PING,
+)
+from app.schemas import PoolStatsResponse
+
+# Operational endpoints, not part of the public API
+router = APIRouter(prefix="/internal", include_in_schema=False)
+
+
+@router.get("/pool", response_model=PoolStatsResponse)
+async def get_pool_stats():
+    pool = async_engine.pool
+    if not isinstance(pool, QueuePool):
+        raise HTTPException(status_code=404, detail="Database connections are not pooled in a queue")
+    return PoolStatsResponse(
+        poolSize=POOL_SIZE,
+        maxOverflow=POOL_MAX_OVERFLOW,
+        poolTimeout=POOL_TIMEOUT,
+        poolRecycle=POOL_RECYCLE,
+        prePing=POOL_PRE_PING,
+        checkedOut=pool.checkedout(),
+        checkedIn=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+        checkouts=pool_stats.checkouts,
+        timeouts=pool_stats.timeouts,
+        waitTotalSeconds=pool_stats.wait_total,
+        waitAvgSeconds=pool_stats.wait_total / pool_stats.checkouts if pool_stats.checkouts else 0.0,
+        waitMaxSeconds=pool_stats.wait_max,
+    )
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, HTTPException
-from sqlmodel import select, Session
+from sqlmodel import select
 from app.models import Message
 from app.database import SessionDep
 
@@ -7,15 +7,15 @@ router = APIRouter(prefix="/messages")
 
 
 @router.post("/")
-def create_message(content: str, db: SessionDep):
+async def create_message(content: str, db: SessionDep):
     message = Message(content=content)
     db.add(message)
-    db.commit()
-    db.refresh(message)
+    await db.commit()
+    await db.refresh(message)
     return message
 
 
 @router.get("/")
-def read_messages(db: SessionDep):
-    messages = db.exec(select(Message)).all()
+async def read_messages(db: SessionDep):
+    messages = (await db.exec(select(Message))).all()
     return messages
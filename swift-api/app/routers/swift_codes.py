@@ -1,27 +1,80 @@
-from typing import Union
-from fastapi import APIRouter, HTTPException
-from sqlmodel import select, Session
+import json
+from collections import defaultdict
+from typing import Annotated, AsyncIterator, List, Literal, Optional, Union
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlmodel import delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models import SwiftCode
 from app.schemas import (
     HeadquarterSwiftCodeResponse,
     BranchSwiftCodeResponse,
     CountrySwiftCodesResponse,
+    CountrySwiftCodesPageResponse,
     MessageResponse,
-    SwiftCodeBase,
+    SwiftCodeLookupRequest,
+    SwiftCodeLookupResponse,
+    SwiftCodeBulkCreateRequest,
+    SwiftCodeBulkDeleteRequest,
+    BulkItemResult,
+    BulkOperationResponse,
 )
 from app.database import SessionDep
 from app.validators import (
     validate_countryISO2code_format,
     validate_swift_code_format,
+    validate_swift_codes,
 )
-from app.logger import logger
+from app.logger import get_logger
 from fastapi import status
 from app.schemas import SwiftCodeCreate, SwiftCodeCreateResponse
 from app.models import SwiftCode
-from app.utils import validate_with_logging
+from app.utils import validate_with_logging, encode_cursor, decode_cursor
+from app.snapshot import SNAPSHOT_ENABLED, snapshot
+from app.metrics import record_cache_lookup, validation_failures
+
+logger = get_logger(__name__)
 
 router = APIRouter(prefix="/v1/swift-codes")
 
+MAX_PAGE_SIZE = 1000
+STREAM_BATCH_SIZE = 500  # Rows fetched from server-side cursor and sent per chunk
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "json": "application/json"}
+
+# SwiftCodeBase fields, read as plain tuples when no ORM object is needed
+CODE_COLUMNS = (
+    SwiftCode.address,
+    SwiftCode.bankName,
+    SwiftCode.countryISO2,
+    SwiftCode.isHeadquarter,
+    SwiftCode.swiftCode,
+)
+
+
+def code_fields(row) -> dict:
+    """SwiftCodeBase content of a SwiftCode or a row with CODE_COLUMNS"""
+    return {
+        "address": row.address,
+        "bankName": row.bankName,
+        "countryISO2": row.countryISO2,
+        "isHeadquarter": row.isHeadquarter,
+        "swiftCode": row.swiftCode,
+    }
+
+
+def swift_code_content(db_code, branches=()) -> dict:
+    """HeadquarterSwiftCodeResponse (with branches) or BranchSwiftCodeResponse content"""
+    content = {**code_fields(db_code), "countryName": db_code.countryName}
+    if db_code.isHeadquarter:
+        content["branches"] = [code_fields(branch) for branch in branches]
+    return content
+
+
+def record_snapshot_lookup(amount: int = 1):
+    """Counts lookups for the snapshot hit ratio, only when the snapshot is configured"""
+    if SNAPSHOT_ENABLED:
+        record_cache_lookup("snapshot", snapshot.loaded, amount=amount)
+
 
 @router.get(
     "/{swiftCode}",
@@ -29,74 +82,245 @@ router = APIRouter(prefix="/v1/swift-codes")
 )
 async def get_swift_code(swiftCode: str, db: SessionDep):
     swiftCode = validate_with_logging(validate_swift_code_format, swiftCode, "SWIFT code")
-    logger.info(f"SWIFT code: {swiftCode} is valid")
+    logger.debug("SWIFT code: %s is valid", swiftCode)
 
-    db_code = db.get(SwiftCode, swiftCode)
+    # Snapshot (when loaded) is authoritative, a miss there is a miss in the database too
+    record_snapshot_lookup()
+    db_code = snapshot.get(swiftCode) if snapshot.loaded else await db.get(SwiftCode, swiftCode)
     if not db_code:
-        logger.warning(f"SWIFT code not found: {swiftCode}")
+        logger.warning("SWIFT code not found: %s", swiftCode)
         raise HTTPException(status_code=404, detail="SWIFT code not found")
 
     if db_code.isHeadquarter:
-        logger.info(f"SWIFT code {swiftCode} is a headquarter code")
-        branches = db.exec(
-            select(SwiftCode).where(
-                SwiftCode.swiftCode.startswith(swiftCode[:8]),
-                SwiftCode.swiftCode != swiftCode,
-            )
-        ).all()  # Temporary query to get branches TODO
-
-        branches_converted = [
-            SwiftCodeBase.model_validate(branch.model_dump()) for branch in branches
-        ]
+        logger.debug("SWIFT code %s is a headquarter code", swiftCode)
+        if snapshot.loaded:
+            branches = snapshot.get_branches(swiftCode)
+        else:
+            branches = (
+                await db.exec(
+                    select(*CODE_COLUMNS).where(
+                        SwiftCode.bankCode == swiftCode[:8],
+                        SwiftCode.swiftCode != swiftCode,
+                    )
+                )
+            ).all()
 
-        return HeadquarterSwiftCodeResponse.model_validate(
-            {**db_code.model_dump(), "branches": branches_converted}
-        )
+        # Stored rows are valid, the content is encoded once without response_model validation
+        return JSONResponse(swift_code_content(db_code, branches))
     else:
-        logger.info(f"SWIFT code {swiftCode} is a branch code")
-        return BranchSwiftCodeResponse.model_validate(db_code.model_dump())
+        logger.debug("SWIFT code %s is a branch code", swiftCode)
+        return JSONResponse(swift_code_content(db_code))
 
 
 @router.get(
     "/country/{countryISO2code}",
-    response_model=CountrySwiftCodesResponse,
+    response_model=Union[CountrySwiftCodesResponse, CountrySwiftCodesPageResponse],
 )
-async def get_country_swift_codes(countryISO2code: str, db: SessionDep):
+async def get_country_swift_codes(
+    countryISO2code: str,
+    db: SessionDep,
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_PAGE_SIZE)] = None,
+    cursor: Optional[str] = None,
+    stream: Optional[Literal["ndjson", "json"]] = None,
+):
+    """
+    Lists SWIFT codes of a country ordered by SWIFT code.
+
+    - Without `limit` returns all codes at once
+    - With `limit` returns one page and `nextCursor` to pass as `cursor` for the next one
+    - With `stream` sends all codes as they are read from the database, either as
+      NDJSON (one SWIFT code object per line) or as the regular JSON response body
+    """
 
     countryISO2code = validate_with_logging(
         validate_countryISO2code_format, countryISO2code, "countryISO2code"
     )
 
-    db_codes = db.exec(select(SwiftCode).where(SwiftCode.countryISO2 == countryISO2code)).all()
+    paginated = limit is not None or cursor is not None
+    if stream is not None:
+        if paginated:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="stream cannot be combined with limit or cursor",
+            )
+        return await stream_country_swift_codes(db, countryISO2code, stream)
+
+    query = (
+        select(*CODE_COLUMNS, SwiftCode.countryName)
+        .where(SwiftCode.countryISO2 == countryISO2code)
+        .order_by(SwiftCode.swiftCode)
+    )
+    if cursor is not None:
+        query = query.where(SwiftCode.swiftCode > decode_cursor(cursor))
+    if paginated:
+        limit = limit or MAX_PAGE_SIZE
+        query = query.limit(limit + 1)  # One extra row tells if there is a next page
+
+    db_codes = (await db.exec(query)).all()
 
-    country_codes_converted = [code.model_dump() for code in db_codes]
+    next_cursor = None
+    if paginated and len(db_codes) > limit:
+        db_codes = db_codes[:limit]
+        next_cursor = encode_cursor(db_codes[-1].swiftCode)
 
-    if not country_codes_converted:
-        logger.warning(f"No SWIFT codes found for country code: {countryISO2code}")
+    if not db_codes and cursor is not None:
+        # Past the last page (rows could be deleted between requests), 404 only for unknown countries
+        country_name = (
+            await db.exec(
+                select(SwiftCode.countryName).where(SwiftCode.countryISO2 == countryISO2code).limit(1)
+            )
+        ).first()
+        if country_name is not None:
+            return JSONResponse(
+                {
+                    "countryISO2": countryISO2code,
+                    "countryName": country_name,
+                    "swiftCodes": [],
+                    "nextCursor": None,
+                }
+            )
+
+    if not db_codes:
+        logger.warning("No SWIFT codes found for country code: %s", countryISO2code)
         raise HTTPException(status_code=404, detail="No SWIFT codes found for this country code")
 
-    countryName = country_codes_converted[0]["countryName"]
+    logger.info("Found %s SWIFT codes for country code: %s", len(db_codes), countryISO2code)
 
-    logger.info(
-        f"Found {len(country_codes_converted)} SWIFT codes for country code: {countryISO2code}"
-    )
+    # Rows go straight into the response body, encoded once (see get_swift_code)
+    response = {
+        "countryISO2": countryISO2code,
+        "countryName": db_codes[0].countryName,
+        "swiftCodes": [code_fields(code) for code in db_codes],
+    }
+    if paginated:
+        response["nextCursor"] = next_cursor
+    return JSONResponse(response)
+
+
+async def stream_country_swift_codes(
+    db: AsyncSession, countryISO2code: str, stream_format: str
+) -> StreamingResponse:
+    # Dependency session is closed before the response body is sent,
+    # so the stream reads through its own session bound to the same engine
+    session = AsyncSession(db.bind)
+    try:
+        result = await session.stream(
+            select(*CODE_COLUMNS, SwiftCode.countryName)
+            .where(SwiftCode.countryISO2 == countryISO2code)
+            .order_by(SwiftCode.swiftCode)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        batches = result.partitions()
+        first_batch = await anext(batches, None)
+    except Exception:
+        await session.close()
+        raise
+
+    if not first_batch:
+        await session.close()
+        logger.warning("No SWIFT codes found for country code: %s", countryISO2code)
+        raise HTTPException(status_code=404, detail="No SWIFT codes found for this country code")
+
+    logger.info("Streaming SWIFT codes for country code: %s as %s", countryISO2code, stream_format)
+
+    def encode_rows(rows: List) -> List[str]:
+        return [json.dumps(code_fields(row)) for row in rows]
+
+    async def generate() -> AsyncIterator[str]:
+        try:
+            if stream_format == "ndjson":
+                yield "".join(line + "\n" for line in encode_rows(first_batch))
+                async for batch in batches:
+                    yield "".join(line + "\n" for line in encode_rows(batch))
+            else:
+                header = json.dumps(
+                    {"countryISO2": countryISO2code, "countryName": first_batch[0].countryName}
+                )
+                yield header[:-1] + ', "swiftCodes": [' + ",".join(encode_rows(first_batch))
+                async for batch in batches:
+                    yield "," + ",".join(encode_rows(batch))
+                yield "]}"
+        finally:
+            await session.close()
+
+    return StreamingResponse(generate(), media_type=STREAM_MEDIA_TYPES[stream_format])
+
+
+@router.post("/lookup", response_model=SwiftCodeLookupResponse)
+async def lookup_swift_codes(request: SwiftCodeLookupRequest, db: SessionDep):
+    """
+    Resolves many SWIFT codes in one request.
+
+    - Every code gets either a result (same as GET /v1/swift-codes/{swift-code}) or an error
+    - Codes are fetched with one query, branches of all found HQs with one more
+    """
+
+    normalized, invalid = validate_swift_codes(request.swiftCodes)
+    # Code as given -> normalized code
+    validated = {code: valid for code, valid in zip(request.swiftCodes, normalized) if valid}
+    errors = {request.swiftCodes[idx]: message for idx, message in invalid.items()}
+    validation_failures.inc("SWIFT code", amount=len(invalid))
+
+    wanted = set(validated.values())
+    branches_by_bank = defaultdict(list)
+    record_snapshot_lookup(amount=len(wanted))
+
+    if snapshot.loaded:
+        found = {code: snapshot.get(code) for code in wanted if snapshot.get(code)}
+        for code, db_code in found.items():
+            if db_code.isHeadquarter:
+                branches_by_bank[code[:8]] = snapshot.get_branches(code)
+    else:
+        found = {}
+        if wanted:
+            found = {
+                db_code.swiftCode: db_code
+                for db_code in (
+                    await db.exec(
+                        select(*CODE_COLUMNS, SwiftCode.countryName).where(
+                            SwiftCode.swiftCode.in_(wanted)
+                        )
+                    )
+                ).all()
+            }
 
-    return CountrySwiftCodesResponse.model_validate(
-        {
-            "countryISO2": countryISO2code,
-            "countryName": countryName,
-            "swiftCodes": country_codes_converted,
-        }
+        hq_bank_codes = {code[:8] for code, db_code in found.items() if db_code.isHeadquarter}
+        if hq_bank_codes:
+            branches = (
+                await db.exec(
+                    select(*CODE_COLUMNS).where(
+                        SwiftCode.bankCode.in_(hq_bank_codes),
+                        SwiftCode.isHeadquarter.is_(False),
+                    )
+                )
+            ).all()
+            for branch in branches:
+                branches_by_bank[branch.swiftCode[:8]].append(branch)
+
+    results = {}
+    for code, normalized in validated.items():
+        db_code = found.get(normalized)
+        if db_code is None:
+            errors[code] = "SWIFT code not found"
+        else:
+            results[code] = swift_code_content(db_code, branches_by_bank[normalized[:8]])
+
+    logger.info(
+        "Lookup of %s SWIFT codes: %s found, %s errors",
+        len(request.swiftCodes),
+        len(results),
+        len(errors),
     )
+    return JSONResponse({"results": results, "errors": errors})
 
 
 @router.post("/", response_model=MessageResponse, status_code=status.HTTP_201_CREATED)
 async def create_swift_code(swiftCode: SwiftCodeCreate, db: SessionDep):
     # Schema automatically validates the SWIFT code format
-    logger.info(f"Received request to create SWIFT code: {swiftCode.swiftCode}")
+    logger.info("Received request to create SWIFT code: %s", swiftCode.swiftCode)
 
-    if db.get(SwiftCode, swiftCode.swiftCode):
-        logger.warning(f"SWIFT code {swiftCode.swiftCode} already exists in the database")
+    if await db.get(SwiftCode, swiftCode.swiftCode):
+        logger.warning("SWIFT code %s already exists in the database", swiftCode.swiftCode)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="SWIFT code already exists"
         )
@@ -104,32 +328,216 @@ async def create_swift_code(swiftCode: SwiftCodeCreate, db: SessionDep):
     # For branches, verify headquarters exists
     if not swiftCode.isHeadquarter:
         hq_code = swiftCode.swiftCode[:8] + "XXX"
-        if not db.get(SwiftCode, hq_code):
+        if not await db.get(SwiftCode, hq_code):
             logger.error(
-                f"Headquarter SWIFT code {hq_code} not found for branch {swiftCode.swiftCode}"
+                "Headquarter SWIFT code %s not found for branch %s", hq_code, swiftCode.swiftCode
             )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Corresponding headquarter not found. Add headquarter first",
             )
         else:
-            logger.info(f"Headquarter SWIFT code {hq_code} exists for branch {swiftCode.swiftCode}")
+            logger.debug(
+                "Headquarter SWIFT code %s exists for branch %s", hq_code, swiftCode.swiftCode
+            )
 
     try:
-        logger.info(f"Creating new SWIFT code: {swiftCode.swiftCode}")
+        logger.info("Creating new SWIFT code: %s", swiftCode.swiftCode)
         db_swift = SwiftCode(**swiftCode.model_dump())
         db.add(db_swift)
-        db.commit()
-        logger.info(f"SWIFT code {swiftCode.swiftCode} created successfully")
+        await db.commit()
+        snapshot.add(SwiftCode(**swiftCode.model_dump()))
+        logger.info("SWIFT code %s created successfully", swiftCode.swiftCode)
         return MessageResponse(message=f"SWIFT code {swiftCode.swiftCode} created successfully")
     except Exception as e:
-        logger.exception(f"Failed to create SWIFT code {swiftCode.swiftCode}: {e}")
-        db.rollback()
+        logger.exception("Failed to create SWIFT code %s: %s", swiftCode.swiftCode, e)
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database operation failed"
         )
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkOperationResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_207_MULTI_STATUS: {"model": BulkOperationResponse}},
+)
+async def bulk_create_swift_codes(
+    request: SwiftCodeBulkCreateRequest, db: SessionDep, response: Response
+):
+    """
+    Creates many SWIFT codes in one transaction.
+
+    - Same rules as POST /v1/swift-codes, checked for the whole batch with one query
+    - Branch may be created together with its HQ in the same batch
+    - Items breaking the rules are reported and skipped, the rest is inserted HQs first
+    - 201 when every item is created, 207 when some are rejected
+    """
+
+    items = request.swiftCodes
+    hq_codes = {item.swiftCode[:8] + "XXX" for item in items if not item.isHeadquarter}
+    existing = set(
+        (
+            await db.exec(
+                select(SwiftCode.swiftCode).where(
+                    SwiftCode.swiftCode.in_({item.swiftCode for item in items} | hq_codes)
+                )
+            )
+        ).all()
+    )
+
+    errors = {}  # Index in request -> reason
+    accepted = {}  # SWIFT code -> index of first occurrence
+    for idx, item in enumerate(items):
+        if item.swiftCode in accepted:
+            errors[idx] = "Duplicate SWIFT code in request"
+        elif item.swiftCode in existing:
+            errors[idx] = "SWIFT code already exists"
+        else:
+            accepted[item.swiftCode] = idx
+
+    for code, idx in list(accepted.items()):
+        hq_code = code[:8] + "XXX"
+        if not items[idx].isHeadquarter and hq_code not in existing and hq_code not in accepted:
+            errors[idx] = "Corresponding headquarter not found. Add headquarter first"
+            del accepted[code]
+
+    to_create = sorted(
+        (items[idx] for idx in accepted.values()), key=lambda item: not item.isHeadquarter
+    )
+
+    if to_create:
+        try:
+            db.add_all(
+                SwiftCode(**item.model_dump(), bankCode=item.swiftCode[:8]) for item in to_create
+            )
+            await db.commit()
+        except Exception as e:
+            logger.exception("Bulk creation of %s SWIFT codes failed: %s", len(to_create), e)
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Database operation failed"
+            )
+        for item in to_create:
+            snapshot.add(SwiftCode(**item.model_dump()))
+
+    logger.info("Bulk create: %s SWIFT codes created, %s rejected", len(to_create), len(errors))
+    if errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+
+    return BulkOperationResponse(
+        results=[
+            BulkItemResult(
+                swiftCode=item.swiftCode,
+                success=idx not in errors,
+                message=errors.get(idx, f"SWIFT code {item.swiftCode} created successfully"),
+            )
+            for idx, item in enumerate(items)
+        ],
+        succeeded=len(to_create),
+        failed=len(errors),
+    )
+
+
+@router.post(
+    "/bulk/delete",
+    response_model=BulkOperationResponse,
+    responses={status.HTTP_207_MULTI_STATUS: {"model": BulkOperationResponse}},
+)
+async def bulk_delete_swift_codes(
+    request: SwiftCodeBulkDeleteRequest, db: SessionDep, response: Response
+):
+    """
+    Deletes many SWIFT codes with a single statement in one transaction.
+
+    - Same rules as DELETE /v1/swift-codes/{swift-code}, checked for the whole batch
+    - HQ can be deleted together with all its branches in the same batch
+    - Items breaking the rules are reported and skipped, the rest is deleted
+    - 200 when every item is deleted, 207 when some are rejected
+    """
+
+    normalized, errors = validate_swift_codes(request.swiftCodes)  # errors: index -> reason
+    validation_failures.inc("SWIFT code", amount=len(errors))
+    requested = {}  # Normalized SWIFT code -> index of first occurrence
+    for idx, code in enumerate(normalized):
+        if code is None:
+            continue
+        if code in requested:
+            errors[idx] = "Duplicate SWIFT code in request"
+        else:
+            requested[code] = idx
+
+    existing = {}
+    if requested:
+        existing = dict(
+            (
+                await db.exec(
+                    select(SwiftCode.swiftCode, SwiftCode.isHeadquarter).where(
+                        SwiftCode.swiftCode.in_(list(requested))
+                    )
+                )
+            ).all()
+        )
+    for code, idx in list(requested.items()):
+        if code not in existing:
+            errors[idx] = "SWIFT code not found"
+            del requested[code]
+
+    # Banks whose HQ is to be deleted but which keep some branches after this batch
+    hq_bank_codes = {code[:8] for code in requested if existing[code]}
+    banks_with_branches = set()
+    if hq_bank_codes:
+        banks_with_branches = set(
+            (
+                await db.exec(
+                    select(SwiftCode.bankCode)
+                    .where(
+                        SwiftCode.bankCode.in_(hq_bank_codes),
+                        SwiftCode.isHeadquarter.is_(False),
+                        SwiftCode.swiftCode.not_in(list(requested)),
+                    )
+                    .distinct()
+                )
+            ).all()
+        )
+    for code, idx in list(requested.items()):
+        if existing[code] and code[:8] in banks_with_branches:
+            errors[idx] = "Cannot delete headquarters with existing branches"
+            del requested[code]
+
+    if requested:
+        try:
+            await db.exec(delete(SwiftCode).where(SwiftCode.swiftCode.in_(list(requested))))
+            await db.commit()
+        except Exception as e:
+            logger.exception("Bulk deletion of %s SWIFT codes failed: %s", len(requested), e)
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Deletion failed due to unexpected error: {e}",
+            )
+        for code in requested:
+            snapshot.remove(code)
+
+    logger.info("Bulk delete: %s SWIFT codes deleted, %s rejected", len(requested), len(errors))
+    if errors:
+        response.status_code = status.HTTP_207_MULTI_STATUS
+
+    return BulkOperationResponse(
+        results=[
+            BulkItemResult(
+                swiftCode=code,
+                success=idx not in errors,
+                message=errors.get(idx, f"SWIFT code {code} deleted successfully"),
+            )
+            for idx, code in enumerate(request.swiftCodes)
+        ],
+        succeeded=len(requested),
+        failed=len(errors),
+    )
+
+
 @router.delete("/{swift_code}", response_model=MessageResponse)
 async def delete_swift_code(swift_code: str, db: SessionDep):
     """
@@ -142,38 +550,41 @@ async def delete_swift_code(swift_code: str, db: SessionDep):
 
     swift_code = validate_with_logging(validate_swift_code_format, swift_code, "SWIFT code")
 
-    db_code = db.get(SwiftCode, swift_code)
+    db_code = await db.get(SwiftCode, swift_code)
     if not db_code:
-        logger.warning(f"SWIFT code not found: {swift_code}")
+        logger.warning("SWIFT code not found: %s", swift_code)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="SWIFT code not found"
         )
 
     # Check for headquarter branches
     if db_code.isHeadquarter:
-        branches_exist = db.exec(
-            select(SwiftCode).where(
-                SwiftCode.swiftCode.startswith(swift_code[:8]),
-                SwiftCode.swiftCode != swift_code,
+        branches_exist = (
+            await db.exec(
+                select(SwiftCode.swiftCode).where(
+                    SwiftCode.bankCode == swift_code[:8],
+                    SwiftCode.swiftCode != swift_code,
+                )
             )
-        ).first()  # Temporary query to check branches TODO 
+        ).first()
 
         if branches_exist:
-            logger.error(f"Cannot delete headquarters with existing branches ({swift_code})")
+            logger.error("Cannot delete headquarters with existing branches (%s)", swift_code)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete headquarters with existing branches",
             )
     try:
-        db.delete(db_code)
-        db.commit()
+        await db.delete(db_code)
+        await db.commit()
+        snapshot.remove(swift_code)
 
-        logger.info(f"Deleted SWIFT code: {swift_code}")
+        logger.info("Deleted SWIFT code: %s", swift_code)
         return MessageResponse(message=f"SWIFT code {swift_code} deleted successfully")
 
     except Exception as e:
-        logger.exception(f"Deletion failed for {swift_code}: {str(e)}")
-        db.rollback()
+        logger.exception("Deletion failed for %s: %s", swift_code, e)
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Deletion failed due to unexpected error: {e}",
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, field_validator, model_validator
-from typing import List
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from typing import Dict, List, Optional, Union
 from app.validators import (
     SwiftCodeValidationError,
     validate_address,
@@ -8,7 +8,10 @@ from app.validators import (
     validate_bank_name,
     validate_country_name,
 )
-from app.logger import logger
+from app.logger import get_logger
+from app.metrics import validation_failures
+
+logger = get_logger(__name__)
 
 
 class SwiftCodeBase(BaseModel):
@@ -64,14 +67,16 @@ class SwiftCodeCreate(BaseModel):
     @model_validator(mode="wrap")
     @classmethod
     def log_and_validate(cls, values, handler):
-        logger.info(f"Before SwiftCode validation: {values}")
         try:
             validated_values = handler(values)
-            logger.info(f"After SwiftCode validation: {validated_values}")
-            return validated_values
         except Exception as e:
-            logger.error(f"SwiftCode validation error: {e}")
+            logger.error("SwiftCode validation error: %s", e)
+            if isinstance(e, ValidationError):
+                for error in e.errors():
+                    validation_failures.inc(str(error["loc"][0]) if error["loc"] else "payload")
             raise
+        logger.debug("Validated SwiftCode payload: %s", validated_values)
+        return validated_values
 
 
 class HeadquarterSwiftCodeResponse(SwiftCodeBase):
@@ -89,9 +94,69 @@ class CountrySwiftCodesResponse(BaseModel):
     swiftCodes: List[SwiftCodeBase]
 
 
+class CountrySwiftCodesPageResponse(CountrySwiftCodesResponse):
+    nextCursor: Optional[str]  # None on the last page
+
+
+MAX_LOOKUP_CODES = 1000
+
+
+class SwiftCodeLookupRequest(BaseModel):
+    swiftCodes: List[str] = Field(min_length=1, max_length=MAX_LOOKUP_CODES)
+
+
+class SwiftCodeLookupResponse(BaseModel):
+    # Both keyed by SWIFT code exactly as given in the request
+    results: Dict[str, Union[HeadquarterSwiftCodeResponse, BranchSwiftCodeResponse]]
+    errors: Dict[str, str]
+
+
+MAX_BULK_CODES = 1000
+
+
+class SwiftCodeBulkCreateRequest(BaseModel):
+    swiftCodes: List[SwiftCodeCreate] = Field(min_length=1, max_length=MAX_BULK_CODES)
+
+
+class SwiftCodeBulkDeleteRequest(BaseModel):
+    swiftCodes: List[str] = Field(min_length=1, max_length=MAX_BULK_CODES)
+
+
+class BulkItemResult(BaseModel):
+    swiftCode: str
+    success: bool
+    message: str
+
+
+class BulkOperationResponse(BaseModel):
+    # One result per requested item, in request order
+    results: List[BulkItemResult]
+    succeeded: int
+    failed: int
+
+
 class SwiftCodeCreateResponse(BaseModel):
     message: str
 
 
 class MessageResponse(BaseModel):
     message: str
+
+
+class PoolStatsResponse(BaseModel):
+    # Configuration
+    poolSize: int
+    maxOverflow: int
+    poolTimeout: float
+    poolRecycle: int
+    prePing: bool
+    # Live state
+    checkedOut: int
+    checkedIn: int
+    overflow: int
+    # Cumulative since startup
+    checkouts: int
+    timeouts: int
+    waitTotalSeconds: float
+    waitAvgSeconds: float
+    waitMaxSeconds: float
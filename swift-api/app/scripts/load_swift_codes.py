@@ -1,8 +1,8 @@
 import pandas as pd
 from pathlib import Path
-import os
-from dotenv import load_dotenv
-from sqlmodel import create_engine, Session
+from typing import Iterator, Optional
+from sqlalchemy import inspect
+from sqlmodel import create_engine, select, Session
 import argparse
 import sys
 
@@ -11,10 +11,27 @@ project_root = str(Path(__file__).parent.parent.parent)
 if project_root not in sys.path:
     sys.path.append(project_root)
 from app.models import SwiftCode
+from app.database import DATABASE_URL
+from app.loader.columnar import is_snapshot_file, read_snapshot_chunks, write_snapshot
+from app.loader.checkpoint import clear_checkpoint, file_hash, get_checkpoint, save_checkpoint
+from app.loader.readers import CHUNK_SIZE, read_chunks
+from app.loader.swap import (
+    PREVIOUS_TABLE,
+    STAGING_TABLE,
+    build_indexes,
+    count_rows,
+    create_staging_table,
+    generation_table,
+    remove_orphaned_branches,
+    rollback_tables,
+    swap_tables,
+)
+from app.loader.sync import SyncPlan, existing_hashes
+from app.loader.timing import StageTimer
+from app.loader.validation import COLUMNS, ValidatedChunk, excel_row, validate_chunks
+from app.loader.writers import delete_codes, upsert_rows, write_rows
 
-load_dotenv()
 DEFAULT_EXCEL_FILE_PATH = "app/data/Interns_2025_SWIFT_CODES.xlsx"
-DATABASE_URL = f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
 
 
 def validate_columns(df: pd.DataFrame):
@@ -33,11 +50,65 @@ def validate_columns(df: pd.DataFrame):
         raise KeyError(f"Missing required columns: {missing}")
 
 
-def load_swift_data(file_path: Path):
+def validated_chunks(
+    file_path: Path,
+    chunk_size: int,
+    workers: int,
+    seen: set,
+    timer: StageTimer,
+    skip_rows: int = 0,
+) -> Iterator[ValidatedChunk]:
+    """
+    Reads and validates the file chunk by chunk (see validate_chunks), timing both stages.
+    Rows at positions before `skip_rows` are skipped.
+    Columnar snapshots (.swiftsnap) hold validated rows and are only read.
+    """
+
+    def snapshot_chunks():
+        for rows in timer.timed(read_snapshot_chunks(file_path, chunk_size), "read"):
+            rows = rows[rows.index >= skip_rows]
+            if len(rows):
+                seen.update(rows["swiftCode"])
+                yield ValidatedChunk(len(rows), rows.index[-1] + 1, rows, [])
+
+    if is_snapshot_file(file_path):
+        return snapshot_chunks()
+
+    def chunks():
+        for chunk in read_chunks(file_path, chunk_size):
+            validate_columns(chunk)
+            chunk = chunk[chunk.index >= skip_rows]
+            if len(chunk):
+                yield chunk
+
+    validated = validate_chunks(timer.timed(chunks(), "read"), seen, workers)
+    return timer.timed(validated, "validate", size=lambda chunk: chunk.size)
+
+
+def load_swift_data(
+    file_path: Path,
+    database_url: str = DATABASE_URL,
+    fast: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    sync: bool = False,
+    workers: int = 1,
+    swap: bool = False,
+    resume: bool = False,
+):
     """Loads data from an Excel file and inserts it into the database"""
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(database_url)
 
     try:
+        if swap:
+            swap_load_swift_data(file_path, engine, chunk_size, workers, resume)
+            return
+        if sync:
+            sync_swift_data(file_path, engine, chunk_size, workers)
+            return
+        if fast:
+            fast_load_swift_data(file_path, engine, chunk_size, workers, resume=resume)
+            return
+
         df = pd.read_excel(file_path)
         validate_columns(df)
         print(f"Found {len(df)} records in the file")
@@ -53,6 +124,7 @@ def load_swift_data(file_path: Path):
                         countryISO2=row["COUNTRY ISO2 CODE"].upper(),
                         countryName=row["COUNTRY NAME"],
                         isHeadquarter=row["SWIFT CODE"].endswith("XXX"),
+                        bankCode=row["SWIFT CODE"][:8],
                     )
                 )
             except Exception as e:
@@ -76,6 +148,214 @@ def load_swift_data(file_path: Path):
         sys.exit(1)
 
 
+def fast_load_swift_data(
+    file_path: Path,
+    engine,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+    table=SwiftCode.__table__,
+    resume: bool = False,
+    timer: Optional[StageTimer] = None,
+    source_hash: Optional[str] = None,
+):
+    """
+    Reads the file in chunks (.xlsx, .csv or .parquet), validates whole columns at once
+    (see app.loader.validation), in `workers` processes, and writes valid rows of each
+    chunk in file order, with COPY on PostgreSQL. Invalid rows are reported and skipped.
+
+    Every chunk is committed together with a checkpoint (file hash + rows processed),
+    with `resume` the load continues after the last committed chunk.
+    Prints time per stage at the end unless `timer` is given by the caller.
+    """
+    report = timer is None
+    timer = timer or StageTimer()
+    source_hash = source_hash or file_hash(file_path)
+    total = loaded = position = 0
+    seen = set()
+
+    with engine.begin() as connection:
+        checkpoint = get_checkpoint(connection, source_hash, table.name)
+        if checkpoint and resume:
+            position = total = checkpoint.rowsProcessed
+            loaded = checkpoint.rowsLoaded
+            # Codes committed before the interruption, for the duplicate check
+            seen.update(connection.execute(select(table.c.swiftCode)).scalars())
+            print(f"Resuming from row {excel_row(position)}, {loaded} SWIFT codes already loaded")
+        elif checkpoint:
+            print(
+                f"Warning: previous load of this file stopped at row {excel_row(checkpoint.rowsProcessed)}, "
+                "use --resume to continue it",
+                file=sys.stderr,
+            )
+
+    try:
+        for chunk in validated_chunks(file_path, chunk_size, workers, seen, timer, position):
+            for row, message in chunk.errors:
+                print(f"Error in row {row}: {message}", file=sys.stderr)
+
+            with timer.stage("write"), engine.begin() as connection:
+                write_rows(connection, chunk.rows, table)
+                save_checkpoint(
+                    connection, source_hash, table.name, chunk.end, loaded + len(chunk.rows)
+                )
+            timer.count("write", len(chunk.rows))
+
+            total += chunk.size
+            loaded += len(chunk.rows)
+            position = chunk.end
+            print(f"Processed {total} records")
+    except Exception:
+        if position:
+            print(
+                f"Rows before {excel_row(position)} are committed, rerun with --resume to continue",
+                file=sys.stderr,
+            )
+        raise
+
+    with engine.begin() as connection:
+        clear_checkpoint(connection, source_hash, table.name)
+
+    print(f"\nSuccessfully loaded {loaded}/{total} SWIFT codes into the database")
+    if loaded != total:
+        print(f"Skipped {total - loaded} invalid records", file=sys.stderr)
+    if report:
+        print(f"\n{timer.report()}")
+
+
+def swap_load_swift_data(
+    file_path: Path, engine, chunk_size: int = CHUNK_SIZE, workers: int = 1, resume: bool = False
+):
+    """
+    Full reload that never touches the live table until the new data is ready:
+    loads into a staging table, drops branches without headquarter, builds indexes
+    and then swaps staging in by renaming, in one short transaction.
+    The replaced table is kept as previous generation for rollback_swift_data().
+    With `resume` an interrupted load into the staging table is continued.
+    """
+    timer = StageTimer()
+    source_hash = file_hash(file_path)
+
+    with engine.begin() as connection:
+        staging = generation_table(STAGING_TABLE)
+        resume = (
+            resume
+            and inspect(connection).has_table(STAGING_TABLE)
+            and get_checkpoint(connection, source_hash, STAGING_TABLE) is not None
+        )
+        if not resume:
+            staging = create_staging_table(connection)
+
+    fast_load_swift_data(
+        file_path, engine, chunk_size, workers, staging, resume, timer, source_hash
+    )
+
+    with engine.begin() as connection:
+        orphans = remove_orphaned_branches(connection, staging)
+        for code in orphans:
+            print(f"Error for {code}: Corresponding headquarter not found", file=sys.stderr)
+        if orphans:
+            print(f"Removed {len(orphans)} branches without headquarter", file=sys.stderr)
+
+        rows = count_rows(connection, staging)
+        if rows == 0:
+            raise RuntimeError("No valid SWIFT codes loaded, live table left unchanged")
+        with timer.stage("index"):
+            build_indexes(connection, staging)
+        timer.count("index", rows)
+
+    with engine.begin() as connection:
+        swap_tables(connection)
+    print(f"Swapped in new SWIFT codes, replaced data kept in {PREVIOUS_TABLE} (see --rollback)")
+    print(f"\n{timer.report()}")
+
+
+def emit_snapshot(
+    file_path: Path, output_path: Path, chunk_size: int = CHUNK_SIZE, workers: int = 1
+):
+    """
+    Validates the file and writes valid rows as a columnar snapshot (see app.loader.columnar),
+    which later loads and API warm-ups read instead of parsing the source again.
+    Doesn't touch the database.
+    """
+    timer = StageTimer()
+    parts = []
+    total = 0
+
+    try:
+        for chunk in validated_chunks(file_path, chunk_size, workers, set(), timer):
+            for row, message in chunk.errors:
+                print(f"Error in row {row}: {message}", file=sys.stderr)
+            parts.append(chunk.rows)
+            total += chunk.size
+
+        rows = pd.concat(parts) if parts else pd.DataFrame(columns=COLUMNS)
+        with timer.stage("write"):
+            write_snapshot(output_path, rows)
+        timer.count("write", len(rows))
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"\nWrote {len(rows)}/{total} SWIFT codes to {output_path} "
+        f"({output_path.stat().st_size:,} bytes)"
+    )
+    print(f"\n{timer.report()}")
+
+
+def rollback_swift_data(database_url: str = DATABASE_URL):
+    """Restores data replaced by the last --swap load"""
+    engine = create_engine(database_url)
+
+    try:
+        with engine.begin() as connection:
+            rollback_tables(connection)
+        print("Rolled back to previous SWIFT codes")
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def sync_swift_data(file_path: Path, engine, chunk_size: int = CHUNK_SIZE, workers: int = 1):
+    """
+    Makes the database a copy of the file touching only rows that differ:
+    inserts new codes, updates changed ones (compared by content hash) and deletes
+    codes missing from the file. Branches without HQ in the file are rejected.
+    """
+    timer = StageTimer()
+    total = 0
+    invalid = 0
+    seen = set()
+
+    with engine.begin() as connection:
+        plan = SyncPlan(existing_hashes(connection))
+
+        for chunk in validated_chunks(file_path, chunk_size, workers, seen, timer):
+            for row, message in chunk.errors:
+                print(f"Error in row {row}: {message}", file=sys.stderr)
+
+            plan.add_chunk(chunk.rows, chunk.rejected)
+            total += chunk.size
+            invalid += len(chunk.errors)
+
+        for code in sorted(plan.finalize()):
+            print(f"Error for {code}: Corresponding headquarter not found", file=sys.stderr)
+            invalid += 1
+
+        with timer.stage("write"):
+            upsert_rows(connection, plan.upserts)
+            delete_codes(connection, plan.deletes)
+        timer.count("write", len(plan.upserts) + len(plan.deletes))
+
+    print(
+        f"\nSynchronized {total - invalid}/{total} SWIFT codes: {plan.inserted} inserted, "
+        f"{plan.updated} updated, {len(plan.deletes)} deleted, {plan.unchanged} unchanged"
+    )
+    if invalid:
+        print(f"Skipped {invalid} invalid records", file=sys.stderr)
+    print(f"\n{timer.report()}")
+
+
 def main():
     argparser = argparse.ArgumentParser(description="Load SWIFT codes from Excel to database")
     argparser.add_argument(
@@ -83,10 +363,56 @@ def main():
         "--file",
         type=str,
         default=DEFAULT_EXCEL_FILE_PATH,
-        help=f"Path to Excel file (default: ${DEFAULT_EXCEL_FILE_PATH})",
+        help=f"Path to Excel file, --fast also reads .csv, .parquet and .swiftsnap (default: ${DEFAULT_EXCEL_FILE_PATH})",
+    )
+    argparser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Read in chunks, validate whole columns at once and bulk insert (COPY on PostgreSQL)",
+    )
+    argparser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=CHUNK_SIZE,
+        help=f"Rows read, validated and written at a time with --fast (default: {CHUNK_SIZE})",
+    )
+    argparser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes validating chunks in parallel, implies --fast unless --sync (default: 1)",
+    )
+    argparser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Apply only differences between the file and the database (insert, update, delete)",
+    )
+    argparser.add_argument(
+        "--swap",
+        action="store_true",
+        help="Full reload into a staging table swapped in when complete, API keeps serving old data until then",
+    )
+    argparser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted --fast or --swap load of the same file from its last checkpoint",
+    )
+    argparser.add_argument(
+        "--emit-snapshot",
+        metavar="PATH",
+        help="Validate the file and write valid rows as a .swiftsnap columnar snapshot instead of loading",
+    )
+    argparser.add_argument(
+        "--rollback",
+        action="store_true",
+        help="Swap back data replaced by the last --swap load and exit",
     )
 
     args = argparser.parse_args()
+    if args.rollback:
+        rollback_swift_data()
+        return
+
     file_path = Path(args.file)
 
     if not file_path.exists():
@@ -96,7 +422,19 @@ def main():
         print("2. Provide full path using --file argument", file=sys.stderr)
         sys.exit(1)
 
-    load_swift_data(file_path)
+    if args.emit_snapshot:
+        emit_snapshot(file_path, Path(args.emit_snapshot), args.chunk_size, args.workers)
+        return
+
+    load_swift_data(
+        file_path,
+        fast=args.fast or args.workers > 1 or args.resume or is_snapshot_file(file_path),
+        chunk_size=args.chunk_size,
+        sync=args.sync,
+        workers=args.workers,
+        swap=args.swap,
+        resume=args.resume,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+import os
+import asyncio
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import pandas as pd
+from sqlmodel import Session, select
+from app.models import SwiftCode
+from app.database import engine
+from app.loader.columnar import read_snapshot
+from app.loader.sync import content_hashes, existing_hashes
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_ENABLED = os.getenv("SWIFT_SNAPSHOT_ENABLED", "false").lower() in ("1", "true", "yes")
+SNAPSHOT_REFRESH_SECONDS = float(os.getenv("SWIFT_SNAPSHOT_REFRESH_SECONDS", "0"))
+# Columnar snapshot (.swiftsnap, see app.loader.columnar) to warm up from instead of the database
+SNAPSHOT_FILE = os.getenv("SWIFT_SNAPSHOT_FILE")
+
+
+def _detached_copy(record: SwiftCode) -> SwiftCode:
+    # Snapshot must not hold ORM instances bound to (and expired by) a request session
+    return SwiftCode(**record.model_dump())
+
+
+class SwiftCodeSnapshot:
+    """
+    In-memory copy of the SwiftCode table.
+
+    Holds a code -> record map and an 8-char bank prefix -> branches index.
+    While not loaded, every lookup must go to the database.
+    """
+
+    def __init__(self):
+        # (codes, branches) swapped as a single tuple so readers never see half a refresh
+        self._index: Tuple[Dict[str, SwiftCode], Dict[str, Dict[str, SwiftCode]]] = ({}, {})
+        self.loaded = False
+        # add()/remove() calls made while load_records() builds a new index (in a worker
+        # thread), replayed onto it after the swap so they aren't lost with the old one
+        self._pending: Optional[List[Union[SwiftCode, str]]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._index[0])
+
+    def load(self, session: Session):
+        """Replaces snapshot content with current state of the SwiftCode table"""
+        self.load_records(_detached_copy(record) for record in session.exec(select(SwiftCode)))
+
+    def load_file(self, file_path: Path):
+        """Replaces snapshot content with rows of a columnar snapshot file"""
+        self.load_rows(read_snapshot(file_path))
+
+    def load_rows(self, rows: pd.DataFrame):
+        """Replaces snapshot content with rows with SwiftCode columns"""
+        self.load_records(SwiftCode(**row) for row in rows.to_dict(orient="records"))
+
+    def load_records(self, records: Iterable[SwiftCode]):
+        codes: Dict[str, SwiftCode] = {}
+        branches: Dict[str, Dict[str, SwiftCode]] = {}
+        with self._lock:
+            self._pending = []
+
+        try:
+            for record in records:
+                codes[record.swiftCode] = record
+                if not record.isHeadquarter:
+                    branches.setdefault(record.swiftCode[:8], {})[record.swiftCode] = record
+        except BaseException:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            for change in self._pending:
+                if isinstance(change, SwiftCode):
+                    self._add((codes, branches), change)
+                else:
+                    self._remove((codes, branches), change)
+            self._pending = None
+            self._index = (codes, branches)
+            self.loaded = True
+        logger.info("SWIFT code snapshot loaded with %s records", len(codes))
+
+    def invalidate(self):
+        """Drops snapshot content, lookups fall back to the database until next load"""
+        self._index = ({}, {})
+        self.loaded = False
+        logger.info("SWIFT code snapshot invalidated")
+
+    def get(self, swift_code: str) -> Optional[SwiftCode]:
+        return self._index[0].get(swift_code)
+
+    def get_branches(self, swift_code: str) -> List[SwiftCode]:
+        return list(self._index[1].get(swift_code[:8], {}).values())
+
+    def add(self, record: SwiftCode):
+        record = _detached_copy(record)
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(record)
+            if self.loaded:
+                self._add(self._index, record)
+
+    def remove(self, swift_code: str):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(swift_code)
+            if self.loaded:
+                self._remove(self._index, swift_code)
+
+    @staticmethod
+    def _add(index, record: SwiftCode):
+        codes, branches = index
+        codes[record.swiftCode] = record
+        if not record.isHeadquarter:
+            branches.setdefault(record.swiftCode[:8], {})[record.swiftCode] = record
+
+    @staticmethod
+    def _remove(index, swift_code: str):
+        codes, branches = index
+        codes.pop(swift_code, None)
+        bank_branches = branches.get(swift_code[:8])
+        if bank_branches is not None:
+            bank_branches.pop(swift_code, None)
+            if not bank_branches:
+                del branches[swift_code[:8]]
+
+
+snapshot = SwiftCodeSnapshot()
+
+
+def load_snapshot():
+    with Session(engine) as session:
+        snapshot.load(session)
+
+
+def is_current(rows: pd.DataFrame) -> bool:
+    """Whether rows (e.g. of a snapshot file) have the same codes and content as the database"""
+    with engine.connect() as connection:
+        database = existing_hashes(connection)
+    return (content_hashes(rows).to_dict() if len(rows) else {}) == database
+
+
+def warm_up_snapshot():
+    """
+    First load on startup. Reads SNAPSHOT_FILE when configured, it's much faster than
+    the database for big tables. The file is only used when its rows match the database
+    (compared by content hash, see app.loader.sync), otherwise the database is loaded.
+    Periodic refreshes always read the database.
+    """
+    if SNAPSHOT_FILE:
+        try:
+            rows = read_snapshot(Path(SNAPSHOT_FILE))
+            if is_current(rows):
+                snapshot.load_rows(rows)
+                return
+            logger.warning("Snapshot file %s is out of date, loading from database", SNAPSHOT_FILE)
+        except Exception as e:
+            logger.warning("Can't read snapshot file %s, loading from database: %s", SNAPSHOT_FILE, e)
+    load_snapshot()
+
+
+async def refresh_snapshot_periodically(interval: float):
+    """
+    Reloads snapshot every `interval` seconds.
+    POST/DELETE keep the snapshot of their own process up to date, this picks up
+    changes made by other workers and by the loader script.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(load_snapshot)
+        except Exception as e:
+            logger.exception("SWIFT code snapshot refresh failed: %s", e)
@@ -1,15 +1,39 @@
+import base64
+import binascii
 from fastapi import HTTPException, status
-from app.logger import logger
+from app.logger import get_logger
+from app.metrics import validation_failures
+from app.validators import validate_swift_code_format
+
+logger = get_logger(__name__)
 
 
 def validate_with_logging(validator, value, name):
     try:
         validated = validator(value)
-        logger.info(f"Validation for {name} passed")
+        logger.debug("Validation for %s passed", name)
         return validated
     except ValueError as e:
-        logger.error(f"Validation failed for {name}: {e}")
+        logger.error("Validation failed for %s: %s", name, e)
+        validation_failures.inc(name)
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected error during validation of {name}: {e}")
+        logger.error("Unexpected error during validation of %s: %s", name, e)
+        validation_failures.inc(name)
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+
+def encode_cursor(swift_code: str) -> str:
+    """Opaque pagination cursor pointing right after given SWIFT code"""
+    return base64.urlsafe_b64encode(swift_code.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Returns SWIFT code stored in cursor or raises HTTPException (422)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return validate_swift_code_format(base64.urlsafe_b64decode(padded).decode())
+    except (ValueError, binascii.Error) as e:
+        logger.error("Invalid pagination cursor %r: %s", cursor, e)
+        validation_failures.inc("cursor")
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid cursor")
@@ -1,3 +1,7 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
 class SwiftCodeValidationError(ValueError):
     """Custom exception for SWIFT code validation"""
 
@@ -10,10 +14,21 @@ class CountryISO2CodeValidationError(ValueError):
     pass
 
 
+# Already normalized valid code, checked in a single pass. Anything else goes through
+# the rule by rule checks below, which also produce the error message
+SWIFT_CODE_PATTERN = re.compile(r"[A-Z]{6}[A-Z0-9]{5}")
+
+
 def validate_swift_code_format(swift_code: str) -> str:
     """
     Returns validated swift_code or raises SwiftCodeValidationError
     """
+    if SWIFT_CODE_PATTERN.fullmatch(swift_code):
+        return swift_code
+    return _check_swift_code_rules(swift_code)
+
+
+def _check_swift_code_rules(swift_code: str) -> str:
     swift_code = swift_code.upper().strip()
 
     if len(swift_code) != 11:
@@ -28,6 +43,28 @@ def validate_swift_code_format(swift_code: str) -> str:
     return swift_code
 
 
+def validate_swift_codes(swift_codes: Iterable[str]) -> Tuple[List[Optional[str]], Dict[int, str]]:
+    """
+    Validates many SWIFT codes at once.
+    Returns normalized codes in input order (None for invalid ones) and index -> error message
+    """
+    match = SWIFT_CODE_PATTERN.fullmatch
+    normalized: List[Optional[str]] = []
+    errors: Dict[int, str] = {}
+
+    for idx, swift_code in enumerate(swift_codes):
+        if match(swift_code):
+            normalized.append(swift_code)
+            continue
+        try:
+            normalized.append(_check_swift_code_rules(swift_code))
+        except SwiftCodeValidationError as e:
+            normalized.append(None)
+            errors[idx] = str(e)
+
+    return normalized, errors
+
+
 def validate_countryISO2code_format(country_code: str) -> str:
     """
     Returns validated country_code or raises ValueError
@@ -0,0 +1,215 @@
+"""
+Endpoint benchmark against a synthetic SWIFT directory.
+
+    python benchmarks/endpoints.py [--rows 1000000] [--requests 2000] [--json results.json]
+
+Generates a directory (see synthetic.py), loads it with app/scripts/load_swift_codes.py
+into a fresh SQLite database (or --database-url) and sends requests through in-process
+ASGI clients. The app logs at WARNING unless LOG_LEVEL is set.
+Reports throughput and latency percentiles per scenario:
+
+    get_code      GET /v1/swift-codes/{swift-code}, headquarters and branches
+    get_country   GET /v1/swift-codes/country/{country}, countries weighted by size
+    create        POST /v1/swift-codes, new branches of existing banks
+    delete        DELETE /v1/swift-codes/{swift-code}, the branches created before
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+import numpy as np
+import pandas as pd
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+from synthetic import ALPHANUMERIC, write_directory
+
+PERCENTILES = [50, 90, 99]
+
+
+def summarize(latencies: List[float], seconds: float, errors: int = 0) -> Dict[str, float]:
+    """Throughput and latency percentiles (ms) of requests that took `seconds` in total"""
+    summary = {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": seconds,
+        "requests_per_second": len(latencies) / seconds if seconds else 0.0,
+    }
+    if latencies:
+        values = np.percentile(np.array(latencies) * 1000, PERCENTILES)
+        summary.update({f"p{p}_ms": float(value) for p, value in zip(PERCENTILES, values)})
+        summary["max_ms"] = max(latencies) * 1000
+    return summary
+
+
+def print_summary(results: Dict[str, dict]):
+    width = max(len("Scenario"), *map(len, results)) + 2
+    print(f"{'Scenario':<{width}}{'Requests':>10}{'Errors':>8}{'Req/s':>10}" + "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES))
+    for name, result in results.items():
+        percentiles = "".join(f"{result.get(f'p{p}_ms', 0):>10.2f}" for p in PERCENTILES)
+        print(
+            f"{name:<{width}}{result['requests']:>10}{result['errors']:>8}"
+            f"{result['requests_per_second']:>10.1f}{percentiles}"
+        )
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def load_directory(file_path: Path, database_url: str, chunk_size: int) -> float:
+    """Creates the schema and loads the directory with the loader script, returns seconds taken"""
+    from sqlmodel import SQLModel, create_engine
+    from app.scripts.load_swift_codes import load_swift_data
+
+    engine = create_engine(database_url)
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+
+    start = time.perf_counter()
+    load_swift_data(file_path, database_url, fast=True, chunk_size=chunk_size)
+    return time.perf_counter() - start
+
+
+async def run_scenario(
+    send: Callable[[int], Awaitable], count: int, concurrency: int
+) -> Dict[str, float]:
+    """Sends requests 0..count-1 from `concurrency` concurrent clients"""
+    latencies, errors = [], 0
+    requests = iter(range(count))
+
+    async def client():
+        nonlocal errors
+        for n in requests:
+            start = time.perf_counter()
+            response = await send(n)
+            latencies.append(time.perf_counter() - start)
+            errors += response.status_code >= 400
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start, errors)
+
+
+async def run_benchmark(directory: pd.DataFrame, args) -> Dict[str, dict]:
+    import httpx
+    from app.main import app
+
+    rng = random.Random(args.seed)
+    codes = directory["SWIFT CODE"].tolist()
+    # Every code is equally likely, so countries are picked in proportion to their size
+    countries = directory["COUNTRY ISO2 CODE"].tolist()
+    # New branches of distinct banks, synthetic branch suffixes never start with Z
+    headquarters = directory[directory["SWIFT CODE"].str.endswith("XXX")]
+    new_branches = [
+        {
+            "swiftCode": hq["SWIFT CODE"][:8] + "Z" + "".join(rng.choices(ALPHANUMERIC, k=2)),
+            "bankName": hq["NAME"],
+            "address": "1 BENCHMARK STREET",
+            "countryISO2": hq["COUNTRY ISO2 CODE"],
+            "countryName": hq["COUNTRY NAME"],
+            "isHeadquarter": False,
+        }
+        for hq in headquarters.sample(
+            min(args.requests, len(headquarters)), random_state=args.seed
+        ).to_dict("records")
+    ]
+    country_query = f"?limit={args.country_limit}" if args.country_limit else ""
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        scenarios = {
+            "get_code": (
+                args.requests,
+                lambda n: client.get(f"/v1/swift-codes/{rng.choice(codes)}"),
+            ),
+            "get_country": (
+                args.requests,
+                lambda n: client.get(f"/v1/swift-codes/country/{rng.choice(countries)}{country_query}"),
+            ),
+            "create": (
+                len(new_branches),
+                lambda n: client.post("/v1/swift-codes/", json=new_branches[n]),
+            ),
+            "delete": (
+                len(new_branches),
+                lambda n: client.delete(f"/v1/swift-codes/{new_branches[n]['swiftCode']}"),
+            ),
+        }
+
+        results = {}
+        await scenarios["get_code"][1](0)  # Warm-up, first request sets up the connection pool
+        for name, (count, send) in scenarios.items():
+            results[name] = await run_scenario(send, count, args.concurrency)
+    return results
+
+
+def main():
+    argparser = argparse.ArgumentParser(description="Throughput and latency of the SWIFT code endpoints")
+    argparser.add_argument("--rows", type=int, default=1_000_000, help="SWIFT codes in the directory (default: 1000000)")
+    argparser.add_argument("--requests", type=int, default=2000, help="Requests per scenario (default: 2000)")
+    argparser.add_argument("--concurrency", type=int, default=10, help="Concurrent clients (default: 10)")
+    argparser.add_argument(
+        "--country-limit",
+        type=int,
+        default=1000,
+        help="Page size of country requests, 0 requests whole countries (default: 1000)",
+    )
+    argparser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    argparser.add_argument(
+        "--database-url", help="Database to load into, must be empty (default: SQLite in a temporary directory)"
+    )
+    argparser.add_argument("--chunk-size", type=int, default=50_000, help="Loader chunk size (default: 50000)")
+    argparser.add_argument("--snapshot", action="store_true", help="Serve lookups from the in-memory snapshot")
+    argparser.add_argument("--json", metavar="PATH", help="Also write results as JSON")
+    args = argparser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        database_url = args.database_url or f"sqlite:///{Path(work_dir) / 'benchmark.db'}"
+        # Read by app.database and app.logger on import, app modules are imported only after this
+        os.environ["DATABASE_URL"] = database_url
+        os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+        directory_path = write_directory(Path(work_dir) / "directory.csv", args.rows, args.seed)
+        print(f"Loading {args.rows} SWIFT codes")
+        load_seconds = load_directory(directory_path, database_url, args.chunk_size)
+        directory = pd.read_csv(directory_path, dtype=str, keep_default_na=False)
+
+        if args.snapshot:
+            from app.snapshot import load_snapshot
+
+            load_snapshot()
+        results = asyncio.run(run_benchmark(directory, args))
+
+    print()
+    print_summary(results)
+    if args.json:
+        report = {
+            "revision": git_revision(),
+            "rows": args.rows,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "country_limit": args.country_limit,
+            "snapshot": args.snapshot,
+            "load_seconds": load_seconds,
+            "results": results,
+        }
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Replays recorded traffic against an in-process app backed by a local SQLite database.
+
+    python benchmarks/replay.py logs/access.log [--speed 2] [--json results.json]
+
+Trace sources (lines of other loggers are ignored):
+    access.log   written with ACCESS_LOG_ENABLED=true (see app/access_log.py), exact
+                 requests including bodies
+    app.log      best effort: GET by code is only logged at DEBUG, created codes get
+                 placeholder bank data, lookups and bulk requests are not logged per code
+
+By default the bundled Excel file is loaded first, use --directory for another source
+file, --rows for a synthetic directory or --database-url for an existing database.
+--speed 1 keeps the original gaps between requests, 2 halves them, 0 sends them
+back to back from --concurrency clients.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+from endpoints import git_revision, load_directory, print_summary, summarize
+from synthetic import write_directory
+
+DEFAULT_DIRECTORY = Path(project_root) / "app/data/Interns_2025_SWIFT_CODES.xlsx"
+
+LOG_LINE = re.compile(
+    r"^(?P<time>\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d{3}) - (?P<logger>\S+) - \w+ - (?P<message>.*)$"
+)
+ACCESS_MESSAGE = re.compile(
+    r"^(?P<method>[A-Z]+) (?P<target>\S+) \d{3} [\d.]+ ms (?P<body>-|\".*\")$"
+)
+# app.log message -> request, the code or country is the first group
+APP_MESSAGES = [
+    (re.compile(r"^SWIFT code: (\w{11}) is valid$"), "GET", "/v1/swift-codes/{}"),
+    (re.compile(r"^Found \d+ SWIFT codes for country code: (\w+)$"), "GET", "/v1/swift-codes/country/{}"),
+    (re.compile(r"^No SWIFT codes found for country code: (\w+)$"), "GET", "/v1/swift-codes/country/{}"),
+    (
+        re.compile(r"^Streaming SWIFT codes for country code: (\w+) as (\w+)$"),
+        "GET",
+        "/v1/swift-codes/country/{}?stream={}",
+    ),
+    (re.compile(r"^Received request to create SWIFT code: (\w{11})$"), "POST", "/v1/swift-codes/"),
+    (re.compile(r"^Deleted SWIFT code: (\w{11})$"), "DELETE", "/v1/swift-codes/{}"),
+    (
+        re.compile(r"^Cannot delete headquarters with existing branches \((\w{11})\)$"),
+        "DELETE",
+        "/v1/swift-codes/{}",
+    ),
+]
+
+
+class TraceEntry(NamedTuple):
+    time: float  # Seconds since epoch
+    method: str
+    target: str
+    body: Optional[str] = None
+
+
+def placeholder_body(swift_code: str) -> str:
+    """POST body for a code created according to app.log, which doesn't log the payload"""
+    return json.dumps(
+        {
+            "swiftCode": swift_code,
+            "bankName": "REPLAYED BANK",
+            "address": "REPLAYED ADDRESS",
+            "countryISO2": swift_code[4:6],
+            "countryName": "REPLAYED COUNTRY",
+            "isHeadquarter": swift_code.endswith("XXX"),
+        }
+    )
+
+
+def parse_access_message(timestamp: float, message: str) -> Optional[TraceEntry]:
+    match = ACCESS_MESSAGE.match(message)
+    if not match:
+        return None
+    body = None if match["body"] == "-" else json.loads(match["body"])
+    return TraceEntry(timestamp, match["method"], match["target"], body)
+
+
+def parse_app_message(timestamp: float, message: str) -> Optional[TraceEntry]:
+    for pattern, method, target in APP_MESSAGES:
+        match = pattern.match(message)
+        if match:
+            body = placeholder_body(match[1]) if method == "POST" else None
+            return TraceEntry(timestamp, method, target.format(*match.groups()), body)
+    return None
+
+
+def parse_trace(file_path: Path) -> List[TraceEntry]:
+    """
+    Requests recorded in a log file, ordered by time.
+    When the file has access log lines, app.log messages in it are ignored.
+    """
+    access, app = [], []
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            match = LOG_LINE.match(line.rstrip("\n"))
+            if not match:
+                continue
+            timestamp = datetime.strptime(match["time"], "%Y-%m-%d %H:%M:%S,%f").timestamp()
+            if match["logger"] == "swiftapi.access":
+                entry, entries = parse_access_message(timestamp, match["message"]), access
+            else:
+                entry, entries = parse_app_message(timestamp, match["message"]), app
+            if entry:
+                entries.append(entry)
+    return sorted(access or app, key=lambda entry: entry.time)
+
+
+def endpoint(entry: TraceEntry) -> str:
+    """Groups requests for the report, e.g. "GET /v1/swift-codes/country/{countryISO2code}" """
+    path = entry.target.split("?")[0].rstrip("/") or "/"
+    parts = path.split("/")
+    if path.startswith("/v1/swift-codes/country/"):
+        path = "/v1/swift-codes/country/{countryISO2code}"
+    elif len(parts) == 4 and parts[:3] == ["", "v1", "swift-codes"] and len(parts[3]) == 11:
+        path = "/v1/swift-codes/{swiftCode}"
+    return f"{entry.method} {path}"
+
+
+async def replay(trace: List[TraceEntry], speed: float, concurrency: int) -> Dict[str, dict]:
+    import httpx
+    from app.main import app
+
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    lags = []
+
+    async def send(client, entry: TraceEntry):
+        headers = {"content-type": "application/json"} if entry.body is not None else None
+        start = time.perf_counter()
+        response = await client.request(entry.method, entry.target, content=entry.body, headers=headers)
+        name = endpoint(entry)
+        latencies[name].append(time.perf_counter() - start)
+        # 4xx responses are part of recorded traffic (unknown codes, duplicates)
+        errors[name] += response.status_code >= 500
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://replay") as client:
+        start = time.perf_counter()
+        if speed > 0:
+            first = trace[0].time
+
+            async def scheduled(entry: TraceEntry):
+                due = start + (entry.time - first) / speed
+                await asyncio.sleep(max(due - time.perf_counter(), 0))
+                lags.append(time.perf_counter() - due)
+                await send(client, entry)
+
+            await asyncio.gather(*(scheduled(entry) for entry in trace))
+        else:
+            entries = iter(trace)
+
+            async def worker():
+                for entry in entries:
+                    await send(client, entry)
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        seconds = time.perf_counter() - start
+
+    all_latencies = [latency for values in latencies.values() for latency in values]
+    results = {"all": summarize(all_latencies, seconds, sum(errors.values()))}
+    for name in sorted(latencies):
+        results[name] = summarize(latencies[name], seconds, errors[name])
+    if lags:
+        results["all"]["p99_start_lag_ms"] = summarize(lags, seconds)["p99_ms"]
+    return results
+
+
+def main():
+    argparser = argparse.ArgumentParser(description="Replay access.log or app.log against a local app")
+    argparser.add_argument("log_file", help="access.log or app.log to replay")
+    argparser.add_argument(
+        "--speed", type=float, default=1.0, help="Speed-up of the original timing, 0 = no pauses (default: 1)"
+    )
+    argparser.add_argument("--concurrency", type=int, default=10, help="Clients with --speed 0 (default: 10)")
+    source = argparser.add_mutually_exclusive_group()
+    source.add_argument("--directory", type=Path, default=DEFAULT_DIRECTORY, help="Source file to load first")
+    source.add_argument("--rows", type=int, help="Load a synthetic directory of this many codes instead")
+    source.add_argument("--database-url", help="Replay against this database as it is, nothing is loaded")
+    argparser.add_argument("--json", metavar="PATH", help="Also write results as JSON")
+    args = argparser.parse_args()
+
+    trace = parse_trace(Path(args.log_file))
+    if not trace:
+        print(f"No requests found in {args.log_file}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Replaying {len(trace)} requests recorded over {trace[-1].time - trace[0].time:.1f}s")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        database_url = args.database_url or f"sqlite:///{Path(work_dir) / 'replay.db'}"
+        # Read by app.database and app.logger on import, app modules are imported only after this
+        os.environ["DATABASE_URL"] = database_url
+        os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+        if not args.database_url:
+            directory = args.directory
+            if args.rows:
+                directory = write_directory(Path(work_dir) / "directory.csv", args.rows)
+            load_directory(directory, database_url, chunk_size=50_000)
+        results = asyncio.run(replay(trace, args.speed, args.concurrency))
+
+    print()
+    print_summary(results)
+    if args.json:
+        report = {
+            "revision": git_revision(),
+            "log_file": args.log_file,
+            "speed": args.speed,
+            "results": results,
+        }
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Synthetic SWIFT directory in the format of the source spreadsheet, for benchmarks.
+
+    python benchmarks/synthetic.py --rows 1000000 --output directory.csv
+
+Mimics the shape of the real data: a few countries hold most codes, most banks are
+just a headquarter while a few have thousands of branches.
+"""
+
+import argparse
+import csv
+import random
+import string
+from pathlib import Path
+
+# (ISO2, name, time zone), most common first, weights follow Zipf's law
+COUNTRIES = [
+    ("US", "UNITED STATES", "America/New_York"),
+    ("DE", "GERMANY", "Europe/Berlin"),
+    ("GB", "UNITED KINGDOM", "Europe/London"),
+    ("FR", "FRANCE", "Europe/Paris"),
+    ("IT", "ITALY", "Europe/Rome"),
+    ("CN", "CHINA", "Asia/Shanghai"),
+    ("JP", "JAPAN", "Asia/Tokyo"),
+    ("ES", "SPAIN", "Europe/Madrid"),
+    ("CH", "SWITZERLAND", "Europe/Zurich"),
+    ("PL", "POLAND", "Europe/Warsaw"),
+    ("BR", "BRAZIL", "America/Sao_Paulo"),
+    ("IN", "INDIA", "Asia/Kolkata"),
+    ("NL", "NETHERLANDS", "Europe/Amsterdam"),
+    ("TR", "TURKEY", "Europe/Istanbul"),
+    ("RU", "RUSSIA", "Europe/Moscow"),
+    ("AT", "AUSTRIA", "Europe/Vienna"),
+    ("BE", "BELGIUM", "Europe/Brussels"),
+    ("CA", "CANADA", "America/Toronto"),
+    ("AU", "AUSTRALIA", "Australia/Sydney"),
+    ("SE", "SWEDEN", "Europe/Stockholm"),
+    ("MX", "MEXICO", "America/Mexico_City"),
+    ("KR", "KOREA, REPUBLIC OF", "Asia/Seoul"),
+    ("SG", "SINGAPORE", "Asia/Singapore"),
+    ("HK", "HONG KONG", "Asia/Hong_Kong"),
+    ("AE", "UNITED ARAB EMIRATES", "Asia/Dubai"),
+    ("ZA", "SOUTH AFRICA", "Africa/Johannesburg"),
+    ("CZ", "CZECHIA", "Europe/Prague"),
+    ("PT", "PORTUGAL", "Europe/Lisbon"),
+    ("GR", "GREECE", "Europe/Athens"),
+    ("NO", "NORWAY", "Europe/Oslo"),
+    ("DK", "DENMARK", "Europe/Copenhagen"),
+    ("FI", "FINLAND", "Europe/Helsinki"),
+    ("IE", "IRELAND", "Europe/Dublin"),
+    ("HU", "HUNGARY", "Europe/Budapest"),
+    ("RO", "ROMANIA", "Europe/Bucharest"),
+    ("BG", "BULGARIA", "Europe/Sofia"),
+    ("LT", "LITHUANIA", "Europe/Vilnius"),
+    ("LV", "LATVIA", "Europe/Riga"),
+    ("MT", "MALTA", "Europe/Malta"),
+    ("AL", "ALBANIA", "Europe/Tirane"),
+]
+COUNTRY_WEIGHTS = [1 / (rank + 1) ** 1.1 for rank in range(len(COUNTRIES))]
+
+HEADER = [
+    "COUNTRY ISO2 CODE",
+    "SWIFT CODE",
+    "CODE TYPE",
+    "NAME",
+    "ADDRESS",
+    "TOWN NAME",
+    "COUNTRY NAME",
+    "TIME ZONE",
+]
+
+ALPHANUMERIC = string.ascii_uppercase + string.digits
+# Branch suffixes never start with Z, benchmarks create new branches as ...Z??
+BRANCH_FIRST_CHARS = ALPHANUMERIC.replace("Z", "")
+MAX_BRANCHES = 5000
+
+
+def branch_count(rng: random.Random) -> int:
+    """Heavy-tailed, about half of the banks have no branches, a few have thousands"""
+    return min(int(rng.paretovariate(1.1)) - 1, MAX_BRANCHES)
+
+
+def branch_suffixes(rng: random.Random, count: int) -> list:
+    space = len(BRANCH_FIRST_CHARS) * len(ALPHANUMERIC) ** 2
+    suffixes = []
+    for n in rng.sample(range(space), count):
+        first, rest = divmod(n, len(ALPHANUMERIC) ** 2)
+        second, third = divmod(rest, len(ALPHANUMERIC))
+        suffixes.append(BRANCH_FIRST_CHARS[first] + ALPHANUMERIC[second] + ALPHANUMERIC[third])
+    return suffixes
+
+
+def generate_rows(rows: int, seed: int = 42) -> list:
+    """Returns `rows` source rows (see HEADER) in random order"""
+    rng = random.Random(seed)
+    bank_codes = set()
+    result = []
+
+    while len(result) < rows:
+        iso2, country_name, time_zone = rng.choices(COUNTRIES, COUNTRY_WEIGHTS)[0]
+        bank_code = "".join(rng.choices(string.ascii_uppercase, k=4)) + iso2 + "".join(rng.choices(ALPHANUMERIC, k=2))
+        if bank_code in bank_codes:
+            continue
+        bank_codes.add(bank_code)
+        bank_name = f"{''.join(rng.choices(string.ascii_uppercase, k=rng.randint(4, 12)))} BANK {iso2}"
+
+        branches = min(branch_count(rng), rows - len(result) - 1)
+        for suffix in ["XXX", *branch_suffixes(rng, branches)]:
+            town = f"CITY {rng.randint(1, 500)}"
+            result.append(
+                [
+                    iso2,
+                    bank_code + suffix,
+                    "BIC11",
+                    bank_name,
+                    f"{rng.randint(1, 300)} MAIN STREET {town}, {rng.randint(10000, 99999)}",
+                    town,
+                    country_name,
+                    time_zone,
+                ]
+            )
+
+    rng.shuffle(result)
+    return result
+
+
+def write_directory(file_path: Path, rows: int, seed: int = 42) -> Path:
+    """Writes a synthetic directory as CSV, readable by app/scripts/load_swift_codes.py"""
+    with open(file_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerows(generate_rows(rows, seed))
+    return file_path
+
+
+def main():
+    argparser = argparse.ArgumentParser(description="Generate a synthetic SWIFT code directory")
+    argparser.add_argument("--rows", type=int, default=1_000_000, help="Number of codes (default: 1000000)")
+    argparser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    argparser.add_argument("--output", required=True, metavar="PATH", help="CSV file to write")
+    args = argparser.parse_args()
+
+    write_directory(Path(args.output), args.rows, args.seed)
+    print(f"Wrote {args.rows} SWIFT codes to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
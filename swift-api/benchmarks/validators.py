@@ -0,0 +1,81 @@
+"""
+Micro-benchmark of SWIFT code validation throughput.
+
+    python benchmarks/validators.py [--count 100000] [--json results.json]
+
+Measures single-value validation (validate_swift_code_format, as used by GET/DELETE)
+and batch validation (validate_swift_codes, used by the lookup and bulk delete endpoints)
+on inputs that are already normalized, need normalizing, or are invalid.
+"""
+
+import argparse
+import json
+import random
+import string
+import sys
+import timeit
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+from app.validators import (
+    SwiftCodeValidationError,
+    validate_swift_code_format,
+    validate_swift_codes,
+)
+
+
+def generate_codes(count: int, kind: str) -> list:
+    rng = random.Random(42)
+    codes = []
+    for _ in range(count):
+        code = "".join(rng.choices(string.ascii_uppercase, k=6)) + "".join(
+            rng.choices(string.ascii_uppercase + string.digits, k=2)
+        ) + rng.choice(["XXX", "001", "WAW"])
+        if kind == "lowercase":
+            code = f" {code.lower()} "
+        elif kind == "invalid":
+            code = code[:8] + "$"
+        codes.append(code)
+    return codes
+
+
+def validate_one_by_one(codes: list):
+    for code in codes:
+        try:
+            validate_swift_code_format(code)
+        except SwiftCodeValidationError:
+            pass
+
+
+def run(count: int, repeat: int) -> dict:
+    results = {}
+    for kind in ["valid", "lowercase", "invalid"]:
+        codes = generate_codes(count, kind)
+        for name, function in [
+            ("single", validate_one_by_one),
+            ("batch", validate_swift_codes),
+        ]:
+            seconds = min(timeit.repeat(lambda: function(codes), number=1, repeat=repeat))
+            results[f"{name}/{kind}"] = {"seconds": seconds, "codes_per_second": count / seconds}
+    return results
+
+
+def main():
+    argparser = argparse.ArgumentParser(description="SWIFT code validation throughput")
+    argparser.add_argument("--count", type=int, default=100_000, help="Codes per run (default: 100000)")
+    argparser.add_argument("--repeat", type=int, default=5, help="Runs, best is reported (default: 5)")
+    argparser.add_argument("--json", metavar="PATH", help="Also write results as JSON")
+    args = argparser.parse_args()
+
+    results = run(args.count, args.repeat)
+    for name, result in results.items():
+        print(f"{name:<20}{result['codes_per_second']:>14,.0f} codes/s")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"count": args.count, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Initial schema (as created by SQLModel.metadata.create_all before migrations were introduced)
+
+Databases created by older versions of the app already have these tables,
+mark them as migrated with `alembic stamp 0001` instead of running this revision.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-04-20 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "message",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("content", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "swiftcode",
+        sa.Column("swiftCode", sa.String(length=11), nullable=False),
+        sa.Column("bankName", sa.String(length=100), nullable=False),
+        sa.Column("address", sa.String(length=250), nullable=False),
+        sa.Column("countryISO2", sa.String(length=2), nullable=False),
+        sa.Column("countryName", sa.String(length=60), nullable=False),
+        sa.Column("isHeadquarter", sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint("swiftCode"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("swiftcode")
+    op.drop_table("message")
@@ -0,0 +1,46 @@
+"""Add bankCode column and secondary indexes for branch and country lookups
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-04-20 12:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns returned by GET /v1/swift-codes/country/{countryISO2code}, stored in the index leaf
+# pages so the country listing is answered by an index-only scan on PostgreSQL
+COUNTRY_INDEX_INCLUDE = ["bankName", "address", "countryName", "isHeadquarter"]
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("swiftcode") as batch_op:
+        batch_op.add_column(sa.Column("bankCode", sa.String(length=8), nullable=True))
+
+    op.execute('UPDATE swiftcode SET "bankCode" = substr("swiftCode", 1, 8)')
+
+    with op.batch_alter_table("swiftcode") as batch_op:
+        batch_op.alter_column("bankCode", existing_type=sa.String(length=8), nullable=False)
+
+    op.create_index("ix_swiftcode_bankCode", "swiftcode", ["bankCode"])
+    op.create_index(
+        "ix_swiftcode_countryISO2_swiftCode",
+        "swiftcode",
+        ["countryISO2", "swiftCode"],
+        postgresql_include=COUNTRY_INDEX_INCLUDE,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_swiftcode_countryISO2_swiftCode", table_name="swiftcode")
+    op.drop_index("ix_swiftcode_bankCode", table_name="swiftcode")
+    with op.batch_alter_table("swiftcode") as batch_op:
+        batch_op.drop_column("bankCode")
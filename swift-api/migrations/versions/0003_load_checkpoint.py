@@ -0,0 +1,33 @@
+"""Add loadcheckpoint table for resumable loader runs
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-04-27 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "loadcheckpoint",
+        sa.Column("fileHash", sa.String(length=64), nullable=False),
+        sa.Column("tableName", sa.String(length=63), nullable=False),
+        sa.Column("rowsProcessed", sa.Integer(), nullable=False),
+        sa.Column("rowsLoaded", sa.Integer(), nullable=False),
+        sa.Column("updatedAt", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("fileHash", "tableName"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("loadcheckpoint")
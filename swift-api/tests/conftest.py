@@ -0,0 +1,10 @@
+import pytest
+from app.logger import listener
+
+
+@pytest.fixture(autouse=True)
+def drain_log_queue():
+    """Writes queued log records while output of the test is still captured"""
+    yield
+    listener.stop()
+    listener.start()
@@ -1,40 +1,75 @@
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import SQLModel, create_engine, Session
-from sqlmodel.pool import StaticPool
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.main import app
-from app.database import get_session
-
-import pytest
-from fastapi.testclient import TestClient
-from sqlmodel import SQLModel, create_engine, Session
-from sqlmodel.pool import StaticPool
-
-from app.main import app
-from app.database import get_session
+from app.database import get_session, to_async_url
+from app.query_log import capture_queries
 
 
-@pytest.fixture(scope="function", autouse=True)
-def setup_db():
+@pytest.fixture(name="engine")
+def engine_fixture(tmp_path):
+    """
+    Sync engine for seeding and checking test data.
+    File database, so the app's async engine (aiosqlite) sees the same data
+    """
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///{tmp_path / 'test.db'}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
     SQLModel.metadata.create_all(engine)
     yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def async_engine(engine):
+    # NullPool - TestClient may run requests in different event loops
+    return create_async_engine(
+        to_async_url(engine.url.render_as_string(hide_password=False)), poolclass=NullPool
+    )
+
 
 @pytest.fixture
-def session(setup_db):
-    with Session(setup_db) as session:
+def session_override(async_engine):
+    """Replacement for app.database.get_session using the test database"""
+
+    async def get_session_override():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    return get_session_override
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as session:
         yield session
 
+
 @pytest.fixture
-def client(session):
-    def get_session_override():
-        return session
-    
-    app.dependency_overrides[get_session] = get_session_override
+def client(session, session_override):
+    app.dependency_overrides[get_session] = session_override
     yield TestClient(app)
-    app.dependency_overrides.clear()
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def max_queries(async_engine):
+    """
+    `with max_queries(n): client.get(...)` fails when the block runs more than n
+    queries on the app's test database, so N+1 regressions break the suite.
+    """
+
+    @contextmanager
+    def assert_max_queries(limit: int):
+        with capture_queries(async_engine.sync_engine) as queries:
+            yield queries
+        statements = "\n".join(query.statement for query in queries)
+        assert len(queries) <= limit, f"{len(queries)} queries, expected at most {limit}:\n{statements}"
+
+    return assert_max_queries
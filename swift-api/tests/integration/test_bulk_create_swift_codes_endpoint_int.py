@@ -0,0 +1,99 @@
+"""
+Integration tests for POST /v1/swift-codes/bulk endpoint
+"""
+
+import pytest
+from fastapi import status
+from sqlmodel import select
+from app.models import SwiftCode
+from app.schemas import MAX_BULK_CODES
+
+
+def payload(swift_code: str) -> dict:
+    return {
+        "swiftCode": swift_code,
+        "bankName": "CITIBANK POLAND",
+        "address": "UL. CENTRALNA 1, WARSAW",
+        "countryISO2": "PL",
+        "countryName": "POLAND",
+        "isHeadquarter": swift_code.endswith("XXX"),
+    }
+
+
+class TestBulkCreateSwiftCodesIntegration:
+    def test_creates_branches_before_their_hq_in_request(self, client, session):
+        response = client.post(
+            "/v1/swift-codes/bulk",
+            json={
+                "swiftCodes": [
+                    payload("CITIPLPP123"),
+                    payload("CITIPLPP456"),
+                    payload("CITIPLPPXXX"),
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["succeeded"] == 3
+        assert data["failed"] == 0
+        assert [result["swiftCode"] for result in data["results"]] == [
+            "CITIPLPP123",
+            "CITIPLPP456",
+            "CITIPLPPXXX",
+        ]
+        assert all(result["success"] for result in data["results"])
+
+        stored = session.exec(select(SwiftCode).where(SwiftCode.bankCode == "CITIPLPP")).all()
+        assert len(stored) == 3
+
+    def test_reports_per_item_errors(self, client, session):
+        session.add(SwiftCode(**payload("CITIPLPPXXX")))
+        session.commit()
+
+        response = client.post(
+            "/v1/swift-codes/bulk",
+            json={
+                "swiftCodes": [
+                    payload("CITIPLPPXXX"),  # Already exists
+                    payload("CITIPLPP123"),  # HQ exists in database
+                    payload("CITIPLPP123"),  # Duplicate in request
+                    payload("BREXPLPW123"),  # No HQ anywhere
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        data = response.json()
+        assert data["succeeded"] == 1
+        assert data["failed"] == 3
+        assert [(r["success"], r["message"]) for r in data["results"]] == [
+            (False, "SWIFT code already exists"),
+            (True, "SWIFT code CITIPLPP123 created successfully"),
+            (False, "Duplicate SWIFT code in request"),
+            (False, "Corresponding headquarter not found. Add headquarter first"),
+        ]
+        assert session.get(SwiftCode, "BREXPLPW123") is None
+
+    def test_created_codes_are_readable(self, client):
+        client.post(
+            "/v1/swift-codes/bulk",
+            json={"swiftCodes": [payload("CITIPLPPXXX"), payload("CITIPLPP123")]},
+        )
+
+        response = client.get("/v1/swift-codes/CITIPLPPXXX")
+        assert [branch["swiftCode"] for branch in response.json()["branches"]] == ["CITIPLPP123"]
+
+    def test_invalid_item_rejects_request(self, client):
+        invalid = {**payload("CITIPLPP123"), "isHeadquarter": True}
+
+        response = client.post("/v1/swift-codes/bulk", json={"swiftCodes": [invalid]})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.parametrize("count", [0, MAX_BULK_CODES + 1])
+    def test_rejects_empty_or_too_large_batch(self, client, count):
+        response = client.post(
+            "/v1/swift-codes/bulk", json={"swiftCodes": [payload("CITIPLPPXXX")] * count}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
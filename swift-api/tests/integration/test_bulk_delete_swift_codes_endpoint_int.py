@@ -0,0 +1,82 @@
+"""
+Integration tests for POST /v1/swift-codes/bulk/delete endpoint
+"""
+
+import pytest
+from fastapi import status
+from app.models import SwiftCode
+from app.schemas import MAX_BULK_CODES
+
+
+@pytest.fixture(autouse=True)
+def seed_data(session):
+    for swift_code in ["CITIPLPPXXX", "CITIPLPP123", "CITIPLPP456", "BREXPLPWXXX"]:
+        session.add(
+            SwiftCode(
+                swiftCode=swift_code,
+                bankName="TEST BANK",
+                address="",
+                countryISO2="PL",
+                countryName="POLAND",
+                isHeadquarter=swift_code.endswith("XXX"),
+            )
+        )
+    session.commit()
+
+
+class TestBulkDeleteSwiftCodesIntegration:
+    def test_deletes_hq_together_with_all_branches(self, client, session):
+        response = client.post(
+            "/v1/swift-codes/bulk/delete",
+            json={"swiftCodes": ["CITIPLPPXXX", "CITIPLPP123", "citiplpp456"]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["succeeded"] == 3
+        assert data["failed"] == 0
+        session.expire_all()
+        assert session.get(SwiftCode, "CITIPLPPXXX") is None
+        assert session.get(SwiftCode, "CITIPLPP456") is None
+        assert session.get(SwiftCode, "BREXPLPWXXX") is not None
+
+    def test_reports_per_item_errors(self, client, session):
+        response = client.post(
+            "/v1/swift-codes/bulk/delete",
+            json={
+                "swiftCodes": [
+                    "CITIPLPPXXX",  # Branch CITIPLPP456 stays
+                    "CITIPLPP123",
+                    "CITIPLPP123",  # Duplicate in request
+                    "DEUTDEFFXXX",  # Not found
+                    "INVALID",
+                ]
+            },
+        )
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        data = response.json()
+        assert data["succeeded"] == 1
+        assert [(r["success"], r["message"]) for r in data["results"]] == [
+            (False, "Cannot delete headquarters with existing branches"),
+            (True, "SWIFT code CITIPLPP123 deleted successfully"),
+            (False, "Duplicate SWIFT code in request"),
+            (False, "SWIFT code not found"),
+            (False, "SWIFT code must be 11 characters long"),
+        ]
+        session.expire_all()
+        assert session.get(SwiftCode, "CITIPLPPXXX") is not None
+        assert session.get(SwiftCode, "CITIPLPP123") is None
+
+    def test_hq_without_branches(self, client):
+        response = client.post("/v1/swift-codes/bulk/delete", json={"swiftCodes": ["BREXPLPWXXX"]})
+
+        assert response.json()["results"][0]["success"] is True
+        assert client.get("/v1/swift-codes/BREXPLPWXXX").status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("count", [0, MAX_BULK_CODES + 1])
+    def test_rejects_empty_or_too_large_batch(self, client, count):
+        response = client.post(
+            "/v1/swift-codes/bulk/delete", json={"swiftCodes": ["CITIPLPP123"] * count}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -3,25 +3,15 @@ Integration tests for GET /v1/swift-codes/country/{countryISO2code} endpoint
 Testing country-specific SWIFT code retrieval with real database interactions
 """
 
+import json
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import SQLModel, create_engine, Session
-from sqlmodel.pool import StaticPool
+from sqlmodel import Session
 from app.main import app
+from app.routers import swift_codes
 from app.models import SwiftCode
 from app.database import get_session
-
-
-@pytest.fixture(name="engine")
-def engine_fixture():
-    """Create fresh in-memory database for each test"""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    return engine
+from app.utils import encode_cursor
 
 
 @pytest.fixture(name="session")
@@ -62,13 +52,10 @@ def session_fixture(engine):
 
 
 @pytest.fixture(name="client")
-def client_fixture(session):
+def client_fixture(session, session_override):
     """Test client with database dependency override"""
 
-    def get_session_override():
-        return session
-
-    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_session] = session_override
     with TestClient(app) as client:
         yield client
     app.dependency_overrides.clear()
@@ -177,3 +164,110 @@ def test_country_codes_uppercase_in_get_country_swift_codes(client: TestClient):
         assert swift_code[
             "countryISO2"
         ].isupper(), f"Expected uppercase, got {swift_code['countryISO2']}"
+
+
+class TestCountryPagination:
+    """Keyset pagination with limit and cursor"""
+
+    def test_pages_follow_swift_code_order(self, client: TestClient):
+        first = client.get("/v1/swift-codes/country/US", params={"limit": 1}).json()
+
+        assert [code["swiftCode"] for code in first["swiftCodes"]] == ["CITIUS33MIA"]
+        assert first["nextCursor"] is not None
+
+        second = client.get(
+            "/v1/swift-codes/country/US", params={"limit": 1, "cursor": first["nextCursor"]}
+        ).json()
+
+        assert [code["swiftCode"] for code in second["swiftCodes"]] == ["CITIUS33XXX"]
+        assert second["nextCursor"] is None
+
+    def test_page_past_the_last_one_keeps_country_name(self, client: TestClient):
+        response = client.get(
+            "/v1/swift-codes/country/US", params={"cursor": encode_cursor("CITIUS33ZZZ")}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "countryISO2": "US",
+            "countryName": "UNITED STATES",
+            "swiftCodes": [],
+            "nextCursor": None,
+        }
+
+    def test_cursor_for_unknown_country(self, client: TestClient):
+        response = client.get(
+            "/v1/swift-codes/country/ZZ", params={"cursor": encode_cursor("AAAAZZ00XXX")}
+        )
+
+        assert response.status_code == 404
+
+    def test_single_page_has_no_next_cursor(self, client: TestClient):
+        response = client.get("/v1/swift-codes/country/US", params={"limit": 10})
+
+        assert response.status_code == 200
+        assert len(response.json()["swiftCodes"]) == 2
+        assert response.json()["nextCursor"] is None
+
+    def test_unpaginated_response_has_no_cursor_field(self, client: TestClient):
+        response = client.get("/v1/swift-codes/country/US")
+        assert "nextCursor" not in response.json()
+
+    @pytest.mark.parametrize("limit", [0, -1, 1001])
+    def test_invalid_limit(self, client: TestClient, limit):
+        response = client.get("/v1/swift-codes/country/US", params={"limit": limit})
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "!!!", "QUJD"])
+    def test_invalid_cursor(self, client: TestClient, cursor):
+        response = client.get("/v1/swift-codes/country/US", params={"cursor": cursor})
+
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Invalid cursor"
+
+
+class TestCountryStreaming:
+    """Streaming response mode"""
+
+    def test_stream_ndjson(self, client: TestClient):
+        response = client.get("/v1/swift-codes/country/US", params={"stream": "ndjson"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["swiftCode"] for line in lines] == ["CITIUS33MIA", "CITIUS33XXX"]
+        assert set(lines[0].keys()) == {
+            "address",
+            "bankName",
+            "countryISO2",
+            "isHeadquarter",
+            "swiftCode",
+        }
+
+    def test_stream_json_matches_regular_response(self, client: TestClient):
+        streamed = client.get("/v1/swift-codes/country/US", params={"stream": "json"})
+        regular = client.get("/v1/swift-codes/country/US")
+
+        assert streamed.status_code == 200
+        assert streamed.json() == regular.json()
+
+    def test_stream_multiple_batches(self, client: TestClient, monkeypatch):
+        monkeypatch.setattr(swift_codes, "STREAM_BATCH_SIZE", 1)
+
+        ndjson = client.get("/v1/swift-codes/country/US", params={"stream": "ndjson"})
+        streamed = client.get("/v1/swift-codes/country/US", params={"stream": "json"})
+
+        assert len(ndjson.text.splitlines()) == 2
+        assert len(streamed.json()["swiftCodes"]) == 2
+
+    def test_stream_not_found(self, client: TestClient):
+        response = client.get("/v1/swift-codes/country/FR", params={"stream": "ndjson"})
+        assert response.status_code == 404
+
+    def test_stream_with_limit_rejected(self, client: TestClient):
+        response = client.get("/v1/swift-codes/country/US", params={"stream": "json", "limit": 1})
+        assert response.status_code == 422
+
+    def test_stream_invalid_format(self, client: TestClient):
+        response = client.get("/v1/swift-codes/country/US", params={"stream": "xml"})
+        assert response.status_code == 422
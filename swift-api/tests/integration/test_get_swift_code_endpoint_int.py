@@ -5,8 +5,7 @@ Testing the full HTTP request/response cycle with real database interactions
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import SQLModel, create_engine, Session
-from sqlmodel.pool import StaticPool
+from sqlmodel import Session
 
 # Import app directly to avoid factory pattern issues
 from app.main import app
@@ -14,18 +13,6 @@ from app.models import SwiftCode
 from app.database import get_session
 
 
-@pytest.fixture(name="engine")
-def engine_fixture():
-    """Fixture for creating a fresh database engine for each test"""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    SQLModel.metadata.create_all(engine)
-    return engine
-
-
 @pytest.fixture(name="session")
 def session_fixture(engine):
     """Fixture for database session with test data"""
@@ -55,13 +42,10 @@ def session_fixture(engine):
 
 
 @pytest.fixture(name="client")
-def client_fixture(session):
+def client_fixture(session, session_override):
     """Fixture for test client with overridden database dependency"""
 
-    def get_session_override():
-        return session
-
-    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_session] = session_override
     with TestClient(app) as client:
         yield client
     app.dependency_overrides.clear()
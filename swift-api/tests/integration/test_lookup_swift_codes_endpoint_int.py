@@ -0,0 +1,71 @@
+"""
+Integration tests for POST /v1/swift-codes/lookup endpoint
+"""
+
+import pytest
+from fastapi import status
+from app.models import SwiftCode
+from app.schemas import MAX_LOOKUP_CODES
+
+
+@pytest.fixture(autouse=True)
+def seed_data(session):
+    for swift_code, bank_name in [
+        ("CITIUS33XXX", "CITIBANK HQ"),
+        ("CITIUS33MIA", "CITIBANK MIAMI"),
+        ("CITIUS33NYC", "CITIBANK NEW YORK"),
+        ("BOFAUS3NXXX", "BANK OF AMERICA HQ"),
+    ]:
+        session.add(
+            SwiftCode(
+                swiftCode=swift_code,
+                bankName=bank_name,
+                address="",
+                countryISO2="US",
+                countryName="UNITED STATES",
+                isHeadquarter=swift_code.endswith("XXX"),
+            )
+        )
+    session.commit()
+
+
+class TestLookupSwiftCodesIntegration:
+    def test_mixed_results_and_errors(self, client):
+        response = client.post(
+            "/v1/swift-codes/lookup",
+            json={"swiftCodes": ["CITIUS33XXX", "citius33mia", "DEUTDEFFXXX", "INVALID"]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert set(data["results"].keys()) == {"CITIUS33XXX", "citius33mia"}
+        assert data["errors"] == {
+            "DEUTDEFFXXX": "SWIFT code not found",
+            "INVALID": "SWIFT code must be 11 characters long",
+        }
+
+    def test_hq_results_include_only_own_branches(self, client):
+        response = client.post(
+            "/v1/swift-codes/lookup", json={"swiftCodes": ["CITIUS33XXX", "BOFAUS3NXXX"]}
+        )
+
+        results = response.json()["results"]
+        assert {b["swiftCode"] for b in results["CITIUS33XXX"]["branches"]} == {
+            "CITIUS33MIA",
+            "CITIUS33NYC",
+        }
+        assert results["BOFAUS3NXXX"]["branches"] == []
+
+    def test_result_matches_single_lookup(self, client):
+        single = client.get("/v1/swift-codes/CITIUS33MIA").json()
+        batch = client.post("/v1/swift-codes/lookup", json={"swiftCodes": ["CITIUS33MIA"]})
+
+        assert batch.json()["results"]["CITIUS33MIA"] == single
+        assert "branches" not in single
+
+    @pytest.mark.parametrize("count", [0, MAX_LOOKUP_CODES + 1])
+    def test_rejects_empty_or_too_large_batch(self, client, count):
+        response = client.post(
+            "/v1/swift-codes/lookup", json={"swiftCodes": ["CITIUS33XXX"] * count}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
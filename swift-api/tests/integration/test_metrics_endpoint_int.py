@@ -0,0 +1,107 @@
+"""
+Integration tests for GET /metrics endpoint
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.main import app
+from app.metrics import (
+    cache_lookups,
+    db_queries,
+    http_request_duration,
+    http_requests,
+    instrument_engine,
+    registry,
+    validation_failures,
+)
+from app.models import SwiftCode
+from app.database import get_session
+from app.routers import swift_codes as swift_codes_router
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    with Session(engine) as session:
+        session.add(
+            SwiftCode(
+                swiftCode="CITIUS33XXX",
+                bankName="Citibank HQ",
+                address="New York",
+                countryISO2="US",
+                countryName="USA",
+                isHeadquarter=True,
+            )
+        )
+        session.commit()
+        yield session
+
+
+@pytest.fixture(name="client")
+def client_fixture(session, session_override, async_engine):
+    instrument_engine(async_engine.sync_engine)
+    registry.reset()
+    app.dependency_overrides[get_session] = session_override
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+def test_requests_are_counted_by_route_template(client: TestClient):
+    client.get("/v1/swift-codes/CITIUS33XXX")
+    client.get("/v1/swift-codes/DEUTDEFFXXX")
+
+    route = "/v1/swift-codes/{swiftCode}"
+    assert http_requests.value("GET", route, "200") == 1
+    assert http_requests.value("GET", route, "404") == 1
+    assert http_request_duration.count("GET", route) == 2
+    # HQ lookup also queries its branches
+    assert db_queries.count(route) == 2
+    assert db_queries.sum(route) == 3
+
+
+def test_unmatched_paths_share_one_label(client: TestClient):
+    client.get("/no/such/path")
+
+    assert http_requests.value("GET", "unmatched", "404") == 1
+
+
+def test_validation_failures_are_counted(client: TestClient):
+    client.get("/v1/swift-codes/INVALID")
+    client.post("/v1/swift-codes/lookup", json={"swiftCodes": ["CITIUS33XXX", "BAD", "ALSO BAD"]})
+
+    assert validation_failures.value("SWIFT code") == 3
+
+
+def test_cache_lookups_not_recorded_without_snapshot(client: TestClient):
+    client.get("/v1/swift-codes/CITIUS33XXX")
+
+    assert cache_lookups.value("snapshot", "miss") == 0
+    assert cache_lookups.value("snapshot", "hit") == 0
+    lines = client.get("/metrics").text.splitlines()
+    assert not [line for line in lines if line.startswith("snapshot_cache_hit_ratio")]
+
+
+def test_cache_lookups_before_snapshot_is_loaded_are_misses(client: TestClient, monkeypatch):
+    monkeypatch.setattr(swift_codes_router, "SNAPSHOT_ENABLED", True)
+
+    client.get("/v1/swift-codes/CITIUS33XXX")
+
+    assert cache_lookups.value("snapshot", "miss") == 1
+    assert cache_lookups.value("snapshot", "hit") == 0
+    assert "snapshot_cache_hit_ratio 0.0" in client.get("/metrics").text
+
+
+def test_metrics_endpoint_exposes_prometheus_text(client: TestClient):
+    client.get("/v1/swift-codes/CITIUS33XXX")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE http_requests_total counter" in body
+    assert 'http_requests_total{method="GET",route="/v1/swift-codes/{swiftCode}",status="200"} 1' in body
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert "# TYPE snapshot_cache_hit_ratio gauge" in body
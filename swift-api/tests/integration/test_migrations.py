@@ -0,0 +1,74 @@
+"""
+Integration tests for Alembic migrations
+Checking that migrated schema matches SQLModel models
+"""
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from alembic.util.exc import AutogenerateDiffsDetected
+from pathlib import Path
+from sqlalchemy import create_engine, inspect
+from app.loader.swap import PREVIOUS_TABLE, STAGING_TABLE, generation_table
+
+ALEMBIC_INI = Path(__file__).parent.parent.parent / "alembic.ini"
+
+
+@pytest.fixture
+def alembic_config(tmp_path):
+    config = Config(str(ALEMBIC_INI))
+    url = f"sqlite:///{tmp_path / 'migrations.db'}"
+    config.set_main_option("sqlalchemy.url", url)
+    return config, create_engine(url)
+
+
+def test_upgrade_head_matches_models(alembic_config):
+    """Test that migrated schema has no differences with models"""
+    config, engine = alembic_config
+    command.upgrade(config, "head")
+
+    try:
+        command.check(config)
+    except AutogenerateDiffsDetected as e:
+        pytest.fail(f"Models and migrations differ: {e}")
+
+    indexes = {index["name"] for index in inspect(engine).get_indexes("swiftcode")}
+    assert {"ix_swiftcode_bankCode", "ix_swiftcode_countryISO2_swiftCode"} <= indexes
+
+
+def test_bank_code_backfilled(alembic_config):
+    """Test that upgrading a pre-migration database fills bankCode for existing rows"""
+    config, engine = alembic_config
+    command.upgrade(config, "0001")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO swiftcode VALUES ('CITIUS33MIA', 'CITIBANK', '', 'US', 'USA', 0)"
+        )
+
+    command.upgrade(config, "head")
+
+    with engine.connect() as conn:
+        bank_code = conn.exec_driver_sql("SELECT \"bankCode\" FROM swiftcode").scalar_one()
+    assert bank_code == "CITIUS33"
+
+
+def test_swap_generations_ignored_by_autogenerate(alembic_config):
+    """Test that tables kept by the loader's --swap mode are not reported as differences"""
+    config, engine = alembic_config
+    command.upgrade(config, "head")
+    with engine.begin() as conn:
+        for name in (STAGING_TABLE, PREVIOUS_TABLE):
+            generation_table(name).create(conn)
+
+    try:
+        command.check(config)
+    except AutogenerateDiffsDetected as e:
+        pytest.fail(f"Swap tables reported as differences: {e}")
+
+
+def test_downgrade_to_base(alembic_config):
+    config, engine = alembic_config
+    command.upgrade(config, "head")
+    command.downgrade(config, "base")
+
+    assert "swiftcode" not in inspect(engine).get_table_names()
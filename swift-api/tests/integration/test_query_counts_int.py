@@ -0,0 +1,91 @@
+"""
+Query budgets of the SWIFT code endpoints.
+Budgets don't depend on the amount of data, more queries means an N+1 regression.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.main import app
+from app.models import SwiftCode
+from app.database import get_session
+
+BRANCHES = [f"CITIUS33{n:03d}" for n in range(20)]
+HEADQUARTERS = [f"BANKUS{n:02d}XXX" for n in range(10)]
+
+
+def make_code(swift_code: str) -> SwiftCode:
+    return SwiftCode(
+        swiftCode=swift_code,
+        bankName="BANK",
+        address="ADDRESS",
+        countryISO2="US",
+        countryName="UNITED STATES",
+        isHeadquarter=swift_code.endswith("XXX"),
+    )
+
+
+def item(swift_code: str) -> dict:
+    return make_code(swift_code).model_dump(exclude={"bankCode"})
+
+
+@pytest.fixture(name="client")
+def client_fixture(engine, session_override):
+    with Session(engine) as session:
+        session.add_all(make_code(code) for code in ["CITIUS33XXX", *BRANCHES, *HEADQUARTERS])
+        session.commit()
+
+    app.dependency_overrides[get_session] = session_override
+    with TestClient(app) as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+def test_get_headquarter_with_branches(client: TestClient, max_queries):
+    with max_queries(2):
+        response = client.get("/v1/swift-codes/CITIUS33XXX")
+    assert len(response.json()["branches"]) == len(BRANCHES)
+
+
+@pytest.mark.parametrize("query", ["", "?limit=5", "?stream=ndjson", "?stream=json"])
+def test_get_country(client: TestClient, max_queries, query):
+    with max_queries(1):
+        response = client.get(f"/v1/swift-codes/country/US{query}")
+    assert response.status_code == 200
+
+
+def test_lookup(client: TestClient, max_queries):
+    codes = ["CITIUS33XXX", *BRANCHES, *HEADQUARTERS]
+    with max_queries(2):
+        response = client.post("/v1/swift-codes/lookup", json={"swiftCodes": codes})
+    assert len(response.json()["results"]) == len(codes)
+
+
+def test_bulk_create_and_delete(client: TestClient, max_queries):
+    codes = ["DEUTDEFFXXX", *(f"DEUTDEFF{n:03d}" for n in range(20))]
+    with max_queries(2):
+        response = client.post("/v1/swift-codes/bulk", json={"swiftCodes": [item(c) for c in codes]})
+    assert response.status_code == 201
+    assert response.json()["succeeded"] == len(codes)
+
+    with max_queries(3):
+        response = client.post("/v1/swift-codes/bulk/delete", json={"swiftCodes": codes})
+    assert response.status_code == 200
+    assert response.json()["succeeded"] == len(codes)
+
+
+def test_create_and_delete(client: TestClient, max_queries):
+    with max_queries(3):
+        response = client.post("/v1/swift-codes/", json=item("CITIUS33LAX"))
+    assert response.status_code == 201
+
+    with max_queries(2):
+        response = client.delete("/v1/swift-codes/CITIUS33LAX")
+    assert response.status_code == 200
+
+
+def test_budget_exceeded_fails(client: TestClient, max_queries):
+    with pytest.raises(AssertionError, match="2 queries, expected at most 1"):
+        with max_queries(1):
+            client.get("/v1/swift-codes/CITIUS33XXX")
@@ -0,0 +1,49 @@
+import json
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.access_log import AccessLogMiddleware, access_logger
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Alembic's fileConfig() in the migration tests disables existing loggers
+    monkeypatch.setattr(access_logger, "disabled", False)
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware, max_body=100)
+
+    @app.get("/v1/swift-codes/{swiftCode}")
+    async def get_swift_code(swiftCode: str):
+        return {"swiftCode": swiftCode}
+
+    @app.post("/v1/swift-codes/lookup")
+    async def lookup(payload: dict):
+        return payload
+
+    return TestClient(app)
+
+
+def access_lines(caplog):
+    return [record.getMessage() for record in caplog.records if record.name == "swiftapi.access"]
+
+
+def test_request_line_with_query_and_status(client, caplog):
+    with caplog.at_level(logging.INFO, logger="swiftapi.access"):
+        client.get("/v1/swift-codes/CITIUS33XXX?limit=5")
+
+    (line,) = access_lines(caplog)
+    method, target, status, ms, unit, body = line.split(" ")
+    assert (method, target, status, unit, body) == ("GET", "/v1/swift-codes/CITIUS33XXX?limit=5", "200", "ms", "-")
+    assert float(ms) > 0
+
+
+def test_body_is_logged_as_json_string(client, caplog):
+    payload = {"swiftCodes": ["CITIUS33XXX"]}
+    with caplog.at_level(logging.INFO, logger="swiftapi.access"):
+        client.post("/v1/swift-codes/lookup", json=payload)
+        client.post("/v1/swift-codes/lookup", json={"swiftCodes": ["CITIUS33XXX"] * 20})
+
+    small, large = access_lines(caplog)
+    assert json.loads(json.loads(small.split(" ms ", 1)[1])) == payload
+    assert large.endswith(" ms -")  # Over max_body
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+from app.loader.columnar import (
+    MAGIC,
+    encode_dictionary,
+    read_snapshot,
+    read_snapshot_chunks,
+    write_snapshot,
+)
+from app.loader.validation import COLUMNS
+
+
+def make_rows(swift_codes):
+    rows = pd.DataFrame(
+        {
+            "swiftCode": swift_codes,
+            "bankName": ["CITIBANK", "CITIBANK", "ŁÓDZKI BANK"][: len(swift_codes)],
+            "address": ["5TH AVENUE", "", "PIOTRKOWSKA 1"][: len(swift_codes)],
+            "countryISO2": ["US", "US", "PL"][: len(swift_codes)],
+            "countryName": ["UNITED STATES", "UNITED STATES", "POLAND"][: len(swift_codes)],
+        }
+    )
+    rows["isHeadquarter"] = rows["swiftCode"].str.endswith("XXX")
+    rows["bankCode"] = rows["swiftCode"].str[:8]
+    return rows[COLUMNS]
+
+
+@pytest.fixture
+def rows():
+    return make_rows(["CITIUS33XXX", "CITIUS33MIA", "LODZPLPWXXX"])
+
+
+def test_round_trip(tmp_path, rows):
+    file_path = tmp_path / "codes.swiftsnap"
+
+    write_snapshot(file_path, rows)
+
+    pd.testing.assert_frame_equal(read_snapshot(file_path), rows)
+
+
+def test_chunks_keep_row_positions(tmp_path, rows):
+    file_path = tmp_path / "codes.swiftsnap"
+    write_snapshot(file_path, rows)
+
+    chunks = list(read_snapshot_chunks(file_path, chunk_size=2))
+
+    assert [list(chunk.index) for chunk in chunks] == [[0, 1], [2]]
+    assert chunks[1]["bankName"].tolist() == ["ŁÓDZKI BANK"]
+
+
+def test_empty_snapshot(tmp_path):
+    file_path = tmp_path / "empty.swiftsnap"
+
+    write_snapshot(file_path, pd.DataFrame(columns=COLUMNS))
+
+    assert read_snapshot(file_path).empty
+
+
+def test_file_layout(tmp_path, rows):
+    file_path = tmp_path / "codes.swiftsnap"
+    write_snapshot(file_path, rows)
+
+    content = file_path.read_bytes()
+
+    assert content.startswith(MAGIC)
+    assert b"CITIUS33XXXCITIUS33MIALODZPLPWXXX" in content  # Fixed width codes, back to back
+    assert content.count(b"UNITED STATES") == 1  # Dictionary encoded
+
+
+def test_dictionary_codes_use_smallest_type():
+    encoded = encode_dictionary(pd.Series(["A", "B", "A"]))
+
+    assert encoded["codes"].dtype == np.dtype("<u1")
+    assert encoded["codes"].tolist() == [0, 1, 0]
+    assert encoded["offsets"].tolist() == [0, 1, 2]
+
+
+def test_rejects_other_files(tmp_path):
+    file_path = tmp_path / "codes.swiftsnap"
+    file_path.write_bytes(b"PK\x03\x04 not a snapshot")
+
+    with pytest.raises(ValueError, match="Not a SWIFT code snapshot file"):
+        read_snapshot(file_path)
@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 from fastapi import HTTPException, status
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models import SwiftCode
 from app.routers.swift_codes import create_swift_code
 from app.schemas import SwiftCodeCreate, MessageResponse
@@ -11,7 +11,9 @@ from app.database import SessionDep
 class TestCreateSwiftCodeUnit:
     @pytest.fixture
     def mock_db(self):
-        return MagicMock(spec=Session)
+        mock = MagicMock(spec=AsyncSession)
+        mock.exec.return_value = MagicMock()  # Awaited query result, its methods are sync
+        return mock
 
     @pytest.fixture
     def valid_hq_data(self):
@@ -82,10 +84,10 @@ class TestCreateResponseStructure:
 
     @pytest.fixture
     def mock_db(self):
-        mock = MagicMock(spec=Session)
+        mock = MagicMock(spec=AsyncSession)
         mock.get.return_value = None  # Simulate no existing code
         mock.add = MagicMock()
-        mock.commit = MagicMock()
+        mock.commit = AsyncMock()
         return mock
 
     @pytest.mark.asyncio
@@ -0,0 +1,85 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app import database
+from app.routers import internal
+from app.database import InstrumentedAsyncQueuePool, PoolStats, pool_options, to_async_url
+from app.main import app
+
+
+@pytest.mark.parametrize(
+    "url,expected",
+    [
+        ("postgresql://user:pass@db/swiftdb", "postgresql+asyncpg://user:pass@db/swiftdb"),
+        ("postgresql+psycopg2://user:pass@db/swiftdb", "postgresql+asyncpg://user:pass@db/swiftdb"),
+        ("sqlite:///swift.db", "sqlite+aiosqlite:///swift.db"),
+    ],
+)
+def test_to_async_url(url, expected):
+    assert to_async_url(url) == expected
+
+
+def test_to_async_url_unsupported_backend():
+    with pytest.raises(KeyError):
+        to_async_url("mysql://user:pass@db/swiftdb")
+
+
+@pytest.mark.parametrize(
+    "url,create", [("sqlite://", create_engine), ("sqlite+aiosqlite://", create_async_engine)]
+)
+def test_in_memory_sqlite_gets_no_queue_options(url, create):
+    options = pool_options(url)
+
+    assert options.keys() == {"pool_recycle", "pool_pre_ping"}
+    create(url, **options)  # Queue options would raise TypeError
+
+
+@pytest.mark.parametrize("url", ["sqlite:///swift.db", "postgresql+asyncpg://user:pass@db/swiftdb"])
+def test_queue_pool_options(url):
+    assert pool_options(url) == database.POOL_OPTIONS
+
+
+class TestPoolStats:
+    def test_record_checkout(self):
+        stats = PoolStats()
+        stats.record_checkout(0.5)
+        stats.record_checkout(0.1, timed_out=True)
+
+        assert stats.checkouts == 2
+        assert stats.timeouts == 1
+        assert stats.wait_total == pytest.approx(0.6)
+        assert stats.wait_max == 0.5
+
+    async def test_instrumented_pool_records_checkouts(self, tmp_path, monkeypatch):
+        stats = PoolStats()
+        monkeypatch.setattr(database, "pool_stats", stats)
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedAsyncQueuePool
+        )
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert engine.pool.checkedout() == 1
+        await engine.dispose()
+
+        assert stats.checkouts == 1
+        assert stats.timeouts == 0
+
+
+def test_pool_stats_endpoint():
+    response = TestClient(app).get("/internal/pool")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["poolSize"] == database.POOL_SIZE
+    assert data["checkedOut"] == 0
+    assert {"checkouts", "timeouts", "waitAvgSeconds", "waitMaxSeconds", "overflow"} <= data.keys()
+
+
+def test_pool_stats_endpoint_without_queue_pool(monkeypatch):
+    monkeypatch.setattr(internal, "async_engine", create_async_engine("sqlite+aiosqlite://"))
+
+    response = TestClient(app).get("/internal/pool")
+
+    assert response.status_code == 404
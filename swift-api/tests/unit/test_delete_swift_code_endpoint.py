@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from fastapi import HTTPException, status
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models import SwiftCode
 from app.routers.swift_codes import delete_swift_code
 from app.schemas import MessageResponse
@@ -9,7 +9,9 @@ from app.schemas import MessageResponse
 class TestDeleteSwiftCodeUnit:
     @pytest.fixture
     def mock_db(self):
-        return MagicMock(spec=Session)
+        mock = MagicMock(spec=AsyncSession)
+        mock.exec.return_value = MagicMock()  # Awaited query result, its methods are sync
+        return mock
 
     async def test_successful_branch_deletion(self, mock_db):
         mock_branch = SwiftCode(
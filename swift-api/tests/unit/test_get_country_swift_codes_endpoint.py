@@ -3,6 +3,7 @@ Unit tests for GET /v1/swift-codes/country/{countryISO2code} endpoint
 Testing the country-specific SWIFT code retrieval logic in isolation
 """
 
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import HTTPException
@@ -23,7 +24,7 @@ class TestGetCountrySwiftCodesEndpoint:
         # Setup execute chain mock
         mock_exec_result = MagicMock()
         mock_exec_result.all.return_value = []
-        mock.exec = MagicMock(return_value=mock_exec_result)
+        mock.exec = AsyncMock(return_value=mock_exec_result)
 
         return mock
 
@@ -56,8 +57,8 @@ class TestGetCountrySwiftCodesEndpoint:
         # Test
         response = await get_country_swift_codes("US", mock_db)
 
-        # Verify
-        assert isinstance(response, CountrySwiftCodesResponse)
+        # Verify, body is encoded directly and must still match the response schema
+        response = CountrySwiftCodesResponse.model_validate_json(response.body)
         assert response.countryISO2 == "US"
         assert response.countryName == "UNITED STATES"
         assert len(response.swiftCodes) == 2
@@ -114,7 +115,7 @@ class TestGetCountrySwiftCodesEndpoint:
         response = await get_country_swift_codes("  us  ", mock_db)
 
         mock_validate.assert_called_with("  us  ")
-        assert response.countryISO2 == "US"
+        assert json.loads(response.body)["countryISO2"] == "US"
 
     @pytest.mark.asyncio
     async def test_response_structure(self, mock_db):
@@ -131,7 +132,9 @@ class TestGetCountrySwiftCodesEndpoint:
         ]
         mock_db.exec.return_value.all.return_value = mock_codes
 
-        response = await get_country_swift_codes("US", mock_db)
+        response = CountrySwiftCodesResponse.model_validate_json(
+            (await get_country_swift_codes("US", mock_db)).body
+        )
 
         assert hasattr(response, "countryISO2")
         assert hasattr(response, "countryName")
@@ -220,7 +223,9 @@ class TestGetCountrySwiftCodesEndpoint:
 
         mock_db.exec.side_effect = mock_exec
 
-        response = await get_country_swift_codes("US", mock_db)
+        response = CountrySwiftCodesResponse.model_validate_json(
+            (await get_country_swift_codes("US", mock_db)).body
+        )
 
         # print([code.countryISO2 for code in response.swiftCodes])
         # Verify only US codes returned
@@ -236,7 +241,7 @@ class TestCountryResponseStructures:
         mock = MagicMock()
         mock_exec_result = MagicMock()
         mock_exec_result.all.return_value = []
-        mock.exec = MagicMock(return_value=mock_exec_result)
+        mock.exec = AsyncMock(return_value=mock_exec_result)
         return mock
 
     @pytest.mark.asyncio
@@ -262,17 +267,16 @@ class TestCountryResponseStructures:
 
         mock_db.exec.return_value.all.return_value = mock_codes
 
-        response = await get_country_swift_codes("US", mock_db)
+        response = json.loads((await get_country_swift_codes("US", mock_db)).body)
 
         # Verify top-level response structure
-        assert set(response.model_dump().keys()) == {"countryISO2", "countryName", "swiftCodes"}
+        assert set(response.keys()) == {"countryISO2", "countryName", "swiftCodes"}
 
         # Verify each SWIFT code entry has exactly these fields
         assert all(
-            set(code.model_dump().keys())
-            == {"address", "bankName", "countryISO2", "isHeadquarter", "swiftCode"}
-            for code in response.swiftCodes
+            set(code.keys()) == {"address", "bankName", "countryISO2", "isHeadquarter", "swiftCode"}
+            for code in response["swiftCodes"]
         )
 
         # Verify countryName is not present in individual SWIFT code entries
-        assert all("countryName" not in code for code in response.swiftCodes)
+        assert all("countryName" not in code for code in response["swiftCodes"])
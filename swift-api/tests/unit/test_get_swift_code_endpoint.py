@@ -1,7 +1,8 @@
+import json
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import HTTPException
-from app.routers.swift_codes import get_swift_code
+from app.routers.swift_codes import get_swift_code, swift_code_content
 from app.models import SwiftCode
 from app.schemas import HeadquarterSwiftCodeResponse, BranchSwiftCodeResponse
 from sqlalchemy.sql import Select
@@ -13,10 +14,10 @@ class TestGetSwiftCodeEndpoint:
     @pytest.fixture
     def mock_db(self) -> MagicMock:
         mock = MagicMock()
-        mock.get = MagicMock(return_value=None)
+        mock.get = AsyncMock(return_value=None)
         mock_exec_result = MagicMock()
         mock_exec_result.all.return_value = []
-        mock.exec = MagicMock(return_value=mock_exec_result)
+        mock.exec = AsyncMock(return_value=mock_exec_result)
         return mock
 
     @pytest.mark.asyncio
@@ -49,7 +50,8 @@ class TestGetSwiftCodeEndpoint:
 
         response = await get_swift_code("CITIUS33XXX", mock_db)
 
-        assert isinstance(response, HeadquarterSwiftCodeResponse)
+        # Body is encoded directly, it must still match the response schema
+        response = HeadquarterSwiftCodeResponse.model_validate_json(response.body)
         assert response.swiftCode == "CITIUS33XXX"
         assert response.isHeadquarter is True
         assert len(response.branches) == 1, f"Expected 1 branch, got {len(response.branches)}"
@@ -71,10 +73,11 @@ class TestGetSwiftCodeEndpoint:
 
         response = await get_swift_code("CITIUS33MIA", mock_db)
 
-        assert isinstance(response, BranchSwiftCodeResponse)
-        assert response.swiftCode == "CITIUS33MIA"
-        assert response.isHeadquarter is False
-        assert not hasattr(response, "branches")
+        body = json.loads(response.body)
+        BranchSwiftCodeResponse.model_validate(body)
+        assert body["swiftCode"] == "CITIUS33MIA"
+        assert body["isHeadquarter"] is False
+        assert "branches" not in body
         mock_db.exec.assert_not_called()
 
     @pytest.mark.asyncio
@@ -93,10 +96,11 @@ class TestGetSwiftCodeEndpoint:
 
         response = await get_swift_code("CITIUS33MIA", mock_db)
 
-        assert isinstance(response, BranchSwiftCodeResponse)
-        assert response.swiftCode == "CITIUS33MIA"
-        assert response.isHeadquarter is False
-        assert not hasattr(response, "branches")
+        body = json.loads(response.body)
+        BranchSwiftCodeResponse.model_validate(body)
+        assert body["swiftCode"] == "CITIUS33MIA"
+        assert body["isHeadquarter"] is False
+        assert "branches" not in body
 
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
@@ -141,9 +145,9 @@ class TestGetSwiftCodeEndpoint:
         response = await get_swift_code(valid_code, mock_db)
 
         if valid_code.endswith("XXX"):
-            assert isinstance(response, HeadquarterSwiftCodeResponse)
+            response = HeadquarterSwiftCodeResponse.model_validate_json(response.body)
         else:
-            assert isinstance(response, BranchSwiftCodeResponse)
+            response = BranchSwiftCodeResponse.model_validate_json(response.body)
         assert response.swiftCode == valid_code
 
     @pytest.mark.asyncio
@@ -181,10 +185,10 @@ class TestResponseStructures:
     @pytest.fixture
     def mock_db(self):
         mock = MagicMock()
-        mock.get = MagicMock(return_value=None)
+        mock.get = AsyncMock(return_value=None)
         mock_exec_result = MagicMock()
         mock_exec_result.all.return_value = []
-        mock.exec = MagicMock(return_value=mock_exec_result)
+        mock.exec = AsyncMock(return_value=mock_exec_result)
         return mock
 
     @pytest.mark.asyncio
@@ -211,10 +215,10 @@ class TestResponseStructures:
         mock_db.get.return_value = hq_data
         mock_db.exec.return_value.all.return_value = branch_data
 
-        response = await get_swift_code("CITIUS33XXX", mock_db)
+        response = json.loads((await get_swift_code("CITIUS33XXX", mock_db)).body)
 
         # Verify HQ response has exactly these fields
-        assert set(response.model_dump().keys()) == {
+        assert set(response.keys()) == {
             "address",
             "bankName",
             "countryISO2",
@@ -226,9 +230,8 @@ class TestResponseStructures:
 
         # Verify each branch has exactly these fields (no countryName)
         assert all(
-            set(branch.model_dump().keys())  # Use model_dump() to get the dictionary representation
-            == {"address", "bankName", "countryISO2", "isHeadquarter", "swiftCode"}
-            for branch in response.branches
+            set(branch.keys()) == {"address", "bankName", "countryISO2", "isHeadquarter", "swiftCode"}
+            for branch in response["branches"]
         )
 
     @pytest.mark.asyncio
@@ -245,10 +248,10 @@ class TestResponseStructures:
 
         mock_db.get.return_value = branch_data
 
-        response = await get_swift_code("CITIUS33MIA", mock_db)
+        response = json.loads((await get_swift_code("CITIUS33MIA", mock_db)).body)
 
         # Verify branch response has exactly these fields (no branches field)
-        assert set(response.model_dump().keys()) == {
+        assert set(response.keys()) == {
             "address",
             "bankName",
             "countryISO2",
@@ -256,3 +259,28 @@ class TestResponseStructures:
             "isHeadquarter",
             "swiftCode",
         }
+
+    def test_encoded_content_matches_response_models(self):
+        """Content built from rows is what the response models would serialize"""
+        hq = SwiftCode(
+            swiftCode="CITIUS33XXX",
+            bankName="Citibank",
+            address="New York",
+            countryISO2="US",
+            countryName="USA",
+            isHeadquarter=True,
+        )
+        branch = SwiftCode(
+            swiftCode="CITIUS33MIA",
+            bankName="Citibank Miami",
+            address="Miami",
+            countryISO2="US",
+            countryName="USA",
+            isHeadquarter=False,
+        )
+
+        hq_content = swift_code_content(hq, [branch])
+        branch_content = swift_code_content(branch)
+
+        assert HeadquarterSwiftCodeResponse.model_validate(hq_content).model_dump() == hq_content
+        assert BranchSwiftCodeResponse.model_validate(branch_content).model_dump() == branch_content
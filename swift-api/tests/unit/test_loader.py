@@ -0,0 +1,469 @@
+import csv
+import re
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlmodel import SQLModel, Session, select
+from app.loader.readers import read_chunks
+from app.loader.validation import COLUMNS, validate_chunks, validate_frame
+from app.loader.writers import copy_rows, write_rows
+from app.loader.timing import StageTimer
+from app.models import LoadCheckpoint, SwiftCode
+from app.scripts import load_swift_codes
+from app.scripts.load_swift_codes import emit_snapshot, load_swift_data, rollback_swift_data
+
+
+def source_row(swift_code, bank_name="CITIBANK", country_code="us", country_name="United States"):
+    return {
+        "COUNTRY ISO2 CODE": country_code,
+        "SWIFT CODE": swift_code,
+        "CODE TYPE": "BIC11",
+        "NAME": bank_name,
+        "ADDRESS": " 5th Avenue ",
+        "TOWN NAME": "NEW YORK",
+        "COUNTRY NAME": country_name,
+        "TIME ZONE": "America/New_York",
+    }
+
+
+@pytest.fixture
+def source_df():
+    return pd.DataFrame(
+        [
+            source_row("CITIUS33XXX"),
+            source_row(" citius33mia "),
+            source_row("CITIUS33"),  # Too short
+            source_row("CITIUS33NYC", bank_name=None),  # Empty bank name
+            source_row("CITIUS33BOS", country_code="USA"),
+            source_row("CITIUS33MIA"),  # Duplicate
+        ]
+    )
+
+
+@pytest.fixture
+def database_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'loader.db'}"
+    SQLModel.metadata.create_all(create_engine(url))
+    return url
+
+
+class TestValidateFrame:
+    def test_valid_rows_are_normalized(self, source_df):
+        rows, _ = validate_frame(source_df)
+
+        assert list(rows.columns) == COLUMNS
+        assert rows.to_dict(orient="records") == [
+            {
+                "swiftCode": "CITIUS33XXX",
+                "bankName": "CITIBANK",
+                "address": " 5th Avenue ",
+                "countryISO2": "US",
+                "countryName": "United States",
+                "isHeadquarter": True,
+                "bankCode": "CITIUS33",
+            },
+            {
+                "swiftCode": "CITIUS33MIA",
+                "bankName": "CITIBANK",
+                "address": " 5th Avenue ",
+                "countryISO2": "US",
+                "countryName": "United States",
+                "isHeadquarter": False,
+                "bankCode": "CITIUS33",
+            },
+        ]
+
+    def test_errors_have_excel_row_numbers(self, source_df):
+        _, errors = validate_frame(source_df)
+
+        assert errors == [
+            (4, "SWIFT code must be 11 characters long"),
+            (5, "Bank name cannot be empty"),
+            (6, "Country code must be exactly 2 characters long"),
+            (7, "Duplicate SWIFT code in file"),
+        ]
+
+    def test_overlong_values_are_rejected(self):
+        df = pd.DataFrame(
+            [
+                source_row("CITIUS33XXX", bank_name="B" * 101),
+                source_row("CITIUS33MIA", country_name="C" * 61),
+                source_row("CITIUS33NYC", bank_name="B" * 100, country_name="C" * 60),
+            ]
+        )
+        df.loc[2, "ADDRESS"] = "A" * 251
+
+        rows, errors = validate_frame(df)
+
+        assert rows.empty
+        assert errors == [
+            (2, "Bank name must be at most 100 characters long"),
+            (3, "Country name must be at most 60 characters long"),
+            (4, "Address must be at most 250 characters long"),
+        ]
+
+    def test_invalid_first_copy_is_not_a_duplicate(self):
+        df = pd.DataFrame([source_row("CITIUS33XXX", bank_name=""), source_row("CITIUS33XXX")])
+
+        rows, errors = validate_frame(df)
+
+        assert rows["swiftCode"].tolist() == ["CITIUS33XXX"]
+        assert errors == [(2, "Bank name cannot be empty")]
+
+    def test_duplicates_across_chunks(self, source_df):
+        seen = set()
+        validate_frame(source_df.iloc[:2], seen)
+
+        _, errors = validate_frame(source_df.iloc[5:], seen)
+
+        assert seen == {"CITIUS33XXX", "CITIUS33MIA"}
+        assert errors == [(7, "Duplicate SWIFT code in file")]
+
+
+class TestValidateChunks:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_results_in_input_order(self, source_df, workers):
+        chunks = [source_df.iloc[i : i + 2] for i in range(0, len(source_df), 2)]
+        seen = set()
+
+        results = list(validate_chunks(chunks, seen, workers=workers))
+
+        assert [chunk.size for chunk in results] == [2, 2, 2]
+        assert [chunk.end for chunk in results] == [2, 4, 6]
+        assert [chunk.rows["swiftCode"].tolist() for chunk in results] == [
+            ["CITIUS33XXX", "CITIUS33MIA"],
+            [],
+            [],
+        ]
+        assert [chunk.errors for chunk in results] == [
+            [],
+            [(4, "SWIFT code must be 11 characters long"), (5, "Bank name cannot be empty")],
+            [
+                (6, "Country code must be exactly 2 characters long"),
+                (7, "Duplicate SWIFT code in file"),
+            ],
+        ]
+        assert seen == {"CITIUS33XXX", "CITIUS33MIA"}
+
+
+class TestReadChunks:
+    @pytest.mark.parametrize("suffix", [".xlsx", ".csv", ".parquet"])
+    def test_chunks_keep_row_positions(self, tmp_path, source_df, suffix):
+        file_path = tmp_path / f"codes{suffix}"
+        if suffix == ".xlsx":
+            source_df.to_excel(file_path, index=False)
+        elif suffix == ".csv":
+            source_df.to_csv(file_path, index=False)
+        else:
+            pytest.importorskip("pyarrow")
+            source_df.to_parquet(file_path, index=False)
+
+        chunks = list(read_chunks(file_path, chunk_size=4))
+
+        assert [len(chunk) for chunk in chunks] == [4, 2]
+        assert list(chunks[1].index) == [4, 5]
+        assert chunks[0]["SWIFT CODE"].tolist() == source_df["SWIFT CODE"].iloc[:4].tolist()
+
+    def test_unsupported_file_type(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported input file type"):
+            read_chunks(tmp_path / "codes.json")
+
+
+def test_write_rows(database_url, source_df):
+    rows, _ = validate_frame(source_df)
+    engine = create_engine(database_url)
+
+    with engine.begin() as connection:
+        write_rows(connection, rows, batch_size=1)
+
+    with Session(engine) as session:
+        assert len(session.exec(select(SwiftCode)).all()) == 2
+
+
+class CopyCursor:
+    """Reads COPY ... FROM STDIN (FORMAT csv) input the way PostgreSQL does, minus quoting"""
+
+    def __init__(self):
+        self.rows = []
+
+    def copy_expert(self, statement, buffer):
+        null = re.search(r"NULL '([^']*)'", statement)
+        null = null[1] if null else ""  # Default of the CSV format
+        for fields in csv.reader(buffer):
+            self.rows.append([None if field == null else field for field in fields])
+
+    def close(self):
+        pass
+
+
+def test_copy_rows_keeps_empty_text(source_df, monkeypatch):
+    source_df["ADDRESS"] = ""
+    rows, _ = validate_frame(source_df)
+    cursor = CopyCursor()
+    connection = type("Connection", (), {"connection": type("DBAPIConnection", (), {})()})()
+    monkeypatch.setattr(connection.connection, "cursor", lambda: cursor, raising=False)
+
+    copy_rows(connection, rows, SwiftCode.__table__, batch_size=1)
+
+    addresses = [row[COLUMNS.index("address")] for row in cursor.rows]
+    assert addresses == ["", ""]
+
+
+def test_fast_load_csv_in_chunks(tmp_path, database_url, source_df, capsys):
+    file_path = tmp_path / "codes.csv"
+    source_df.to_csv(file_path, index=False)
+
+    load_swift_data(file_path, database_url, fast=True, chunk_size=2)
+
+    with Session(create_engine(database_url)) as session:
+        assert len(session.exec(select(SwiftCode)).all()) == 2
+    assert "Error in row 7: Duplicate SWIFT code in file" in capsys.readouterr().err
+
+
+def test_fast_load_with_workers(tmp_path, database_url, source_df):
+    file_path = tmp_path / "codes.csv"
+    source_df.to_csv(file_path, index=False)
+
+    load_swift_data(file_path, database_url, fast=True, chunk_size=1, workers=2)
+
+    with Session(create_engine(database_url)) as session:
+        codes = session.exec(select(SwiftCode.swiftCode)).all()
+        assert sorted(codes) == ["CITIUS33MIA", "CITIUS33XXX"]
+
+
+def test_emit_and_load_snapshot(tmp_path, database_url, source_df, capsys):
+    file_path = tmp_path / "codes.csv"
+    source_df.to_csv(file_path, index=False)
+    snapshot_path = tmp_path / "codes.swiftsnap"
+
+    emit_snapshot(file_path, snapshot_path)
+
+    assert "Wrote 2/6 SWIFT codes" in capsys.readouterr().out
+    load_swift_data(snapshot_path, database_url, fast=True, chunk_size=1)
+    with Session(create_engine(database_url)) as session:
+        branch = session.get(SwiftCode, "CITIUS33MIA")
+        assert branch.address == " 5th Avenue "
+        assert branch.bankCode == "CITIUS33"
+
+
+@pytest.mark.parametrize("fast", [False, True])
+def test_load_swift_data(tmp_path, database_url, fast):
+    file_path = tmp_path / "codes.xlsx"
+    pd.DataFrame([source_row("CITIUS33XXX"), source_row("CITIUS33MIA")]).to_excel(
+        file_path, index=False
+    )
+
+    load_swift_data(file_path, database_url, fast=fast)
+
+    with Session(create_engine(database_url)) as session:
+        branch = session.get(SwiftCode, "CITIUS33MIA")
+        assert branch.bankCode == "CITIUS33"
+        assert branch.isHeadquarter is False
+        # Both loaders store text values as they are in the file
+        assert (branch.address, branch.countryName) == (" 5th Avenue ", "United States")
+
+
+def test_sync_swift_data(tmp_path, database_url, capsys):
+    engine = create_engine(database_url)
+    with Session(engine) as session:
+        for code, bank_name in [
+            ("CITIUS33XXX", "CITIBANK"),
+            ("CITIUS33MIA", "OLD NAME"),
+            ("CITIUS33BOS", "CITIBANK"),
+        ]:
+            session.add(
+                SwiftCode(
+                    swiftCode=code,
+                    bankName=bank_name,
+                    address=" 5th Avenue ",
+                    countryISO2="US",
+                    countryName="United States",
+                    isHeadquarter=code.endswith("XXX"),
+                    bankCode=code[:8],
+                )
+            )
+        session.commit()
+
+    file_path = tmp_path / "codes.csv"
+    pd.DataFrame(
+        [
+            source_row("CITIUS33XXX"),
+            source_row("CITIUS33MIA"),  # Updated
+            source_row("CITIUS33NYC"),  # Inserted
+            source_row("DEUTDEFFMUC"),  # No HQ
+        ]
+    ).to_csv(file_path, index=False)
+
+    load_swift_data(file_path, database_url, sync=True)
+
+    output = capsys.readouterr()
+    assert "1 inserted, 1 updated, 1 deleted, 1 unchanged" in output.out
+    assert "DEUTDEFFMUC: Corresponding headquarter not found" in output.err
+    with Session(engine) as session:
+        codes = {c.swiftCode: c for c in session.exec(select(SwiftCode)).all()}
+        assert set(codes) == {"CITIUS33XXX", "CITIUS33MIA", "CITIUS33NYC"}
+        assert codes["CITIUS33MIA"].bankName == "CITIBANK"
+        assert codes["CITIUS33NYC"].bankCode == "CITIUS33"
+
+    load_swift_data(file_path, database_url, sync=True)
+
+    assert "0 inserted, 0 updated, 0 deleted, 3 unchanged" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sync_keeps_bank_of_invalid_hq_row(tmp_path, database_url, capsys, workers):
+    engine = create_engine(database_url)
+    with Session(engine) as session:
+        for code in ["CITIUS33XXX", "CITIUS33MIA", "CITIUS33BOS"]:
+            session.add(
+                SwiftCode(
+                    swiftCode=code,
+                    bankName="CITIBANK",
+                    address="5TH AVENUE",
+                    countryISO2="US",
+                    countryName="UNITED STATES",
+                    isHeadquarter=code.endswith("XXX"),
+                    bankCode=code[:8],
+                )
+            )
+        session.commit()
+
+    file_path = tmp_path / "codes.csv"
+    pd.DataFrame(
+        [
+            source_row("citius33xxx", bank_name=None),  # Invalid HQ row
+            source_row("CITIUS33MIA"),
+            source_row("CITIUS33BOS"),
+        ]
+    ).to_csv(file_path, index=False)
+
+    load_swift_data(file_path, database_url, sync=True, workers=workers)
+
+    output = capsys.readouterr()
+    assert "0 deleted" in output.out
+    assert "Corresponding headquarter not found" not in output.err
+    with Session(engine) as session:
+        codes = session.exec(select(SwiftCode.swiftCode)).all()
+        assert sorted(codes) == ["CITIUS33BOS", "CITIUS33MIA", "CITIUS33XXX"]
+
+
+class TestSwapLoad:
+    def write_file(self, tmp_path, *swift_codes):
+        file_path = tmp_path / "codes.csv"
+        pd.DataFrame([source_row(code) for code in swift_codes]).to_csv(file_path, index=False)
+        return file_path
+
+    def live_codes(self, database_url):
+        with Session(create_engine(database_url)) as session:
+            return sorted(session.exec(select(SwiftCode.swiftCode)).all())
+
+    def test_swap_and_rollback(self, tmp_path, database_url, capsys):
+        load_swift_data(self.write_file(tmp_path, "CITIUS33XXX"), database_url, fast=True)
+
+        file_path = self.write_file(tmp_path, "DEUTDEFFXXX", "DEUTDEFFMUC", "CITIUS33MIA")
+        load_swift_data(file_path, database_url, swap=True)
+
+        assert self.live_codes(database_url) == ["DEUTDEFFMUC", "DEUTDEFFXXX"]
+        assert "CITIUS33MIA: Corresponding headquarter not found" in capsys.readouterr().err
+        inspector = inspect(create_engine(database_url))
+        assert "swiftcode_staging" not in inspector.get_table_names()
+        assert {index["name"] for index in inspector.get_indexes("swiftcode")} == {
+            index.name for index in SwiftCode.__table__.indexes
+        }
+
+        rollback_swift_data(database_url)
+        assert self.live_codes(database_url) == ["CITIUS33XXX"]
+
+        rollback_swift_data(database_url)
+        assert self.live_codes(database_url) == ["DEUTDEFFMUC", "DEUTDEFFXXX"]
+
+    def test_repeated_swaps(self, tmp_path, database_url):
+        for code in ["CITIUS33XXX", "DEUTDEFFXXX", "BPKOPLPWXXX"]:
+            load_swift_data(self.write_file(tmp_path, code), database_url, swap=True)
+
+        assert self.live_codes(database_url) == ["BPKOPLPWXXX"]
+        rollback_swift_data(database_url)
+        assert self.live_codes(database_url) == ["DEUTDEFFXXX"]
+
+    def test_no_valid_rows_keeps_live_table(self, tmp_path, database_url):
+        load_swift_data(self.write_file(tmp_path, "CITIUS33XXX"), database_url, fast=True)
+
+        with pytest.raises(SystemExit):
+            load_swift_data(self.write_file(tmp_path, "CITIUS33"), database_url, swap=True)
+
+        assert self.live_codes(database_url) == ["CITIUS33XXX"]
+
+    def test_rollback_without_previous_generation(self, database_url):
+        with pytest.raises(SystemExit):
+            rollback_swift_data(database_url)
+
+
+class TestResume:
+    @pytest.fixture
+    def file_path(self, tmp_path):
+        file_path = tmp_path / "codes.csv"
+        codes = ["CITIUS33XXX", "DEUTDEFFXXX", "BPKOPLPWXXX", "CITIUS33"]
+        pd.DataFrame([source_row(code) for code in codes]).to_csv(file_path, index=False)
+        return file_path
+
+    @pytest.fixture
+    def failing_write(self, monkeypatch):
+        """Fails writing the second chunk"""
+        calls = []
+
+        def write_rows(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise RuntimeError("Connection lost")
+            return original(*args)
+
+        original = load_swift_codes.write_rows
+        monkeypatch.setattr(load_swift_codes, "write_rows", write_rows)
+
+    def test_resume_after_failure(self, file_path, database_url, failing_write, capsys):
+        with pytest.raises(SystemExit):
+            load_swift_data(file_path, database_url, fast=True, chunk_size=2)
+
+        engine = create_engine(database_url)
+        with Session(engine) as session:
+            assert session.exec(select(SwiftCode.swiftCode)).all() == ["CITIUS33XXX", "DEUTDEFFXXX"]
+            checkpoint = session.exec(select(LoadCheckpoint)).one()
+            assert (checkpoint.rowsProcessed, checkpoint.rowsLoaded) == (2, 2)
+        assert "rerun with --resume" in capsys.readouterr().err
+
+        load_swift_data(file_path, database_url, fast=True, chunk_size=2, resume=True)
+
+        output = capsys.readouterr().out
+        assert "Resuming from row 4" in output
+        assert "Successfully loaded 3/4 SWIFT codes" in output
+        with Session(engine) as session:
+            assert len(session.exec(select(SwiftCode)).all()) == 3
+            assert session.exec(select(LoadCheckpoint)).all() == []
+
+    def test_swap_resume(self, file_path, database_url, failing_write):
+        with pytest.raises(SystemExit):
+            load_swift_data(file_path, database_url, swap=True, chunk_size=2)
+
+        load_swift_data(file_path, database_url, swap=True, chunk_size=2, resume=True)
+
+        with Session(create_engine(database_url)) as session:
+            assert len(session.exec(select(SwiftCode)).all()) == 3
+
+    def test_timing_report(self, file_path, database_url, capsys):
+        load_swift_data(file_path, database_url, fast=True, chunk_size=2)
+
+        report = capsys.readouterr().out
+        for stage in ["read", "validate", "write", "total"]:
+            assert f"\n{stage} " in report
+
+
+def test_stage_timer_excludes_nested_stages(monkeypatch):
+    clock = iter([0.0, 1.0, 3.0, 4.0])
+    monkeypatch.setattr("app.loader.timing.time.perf_counter", lambda: next(clock))
+    timer = StageTimer()
+
+    with timer.stage("validate"):
+        with timer.stage("read"):
+            pass
+
+    assert timer.seconds == {"validate": 2.0, "read": 2.0}
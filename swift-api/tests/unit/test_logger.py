@@ -0,0 +1,84 @@
+import atexit
+import logging
+import threading
+import pytest
+from logging.handlers import QueueHandler
+from app.logger import get_logger, parse_levels, setup_logging
+
+
+def test_parse_levels():
+    assert parse_levels(" swiftapi.routers=warning, sqlalchemy.engine=INFO,") == {
+        "swiftapi.routers": "WARNING",
+        "sqlalchemy.engine": "INFO",
+    }
+    assert parse_levels("") == {}
+
+
+def test_parse_levels_rejects_missing_level():
+    with pytest.raises(ValueError, match="expected name=LEVEL"):
+        parse_levels("swiftapi.routers")
+
+
+def test_module_loggers_are_under_swiftapi():
+    assert get_logger("app.routers.swift_codes").name == "swiftapi.routers.swift_codes"
+
+
+@pytest.fixture
+def root_logger():
+    """Restores root logger configuration replaced by setup_logging()"""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    root.handlers, root.level = handlers, level
+
+
+def test_records_are_written_by_listener_thread(root_logger, monkeypatch):
+    written = []
+
+    class RecordingHandler(logging.Handler):
+        def emit(self, record):
+            written.append((threading.current_thread().name, self.format(record)))
+
+    monkeypatch.setattr(logging, "FileHandler", lambda path, **kwargs: RecordingHandler())
+    listener = setup_logging()
+    try:
+        assert [type(h) for h in root_logger.handlers] == [QueueHandler]
+        get_logger("app.tests").warning("SWIFT code %s not found", "CITIUS33XXX")
+    finally:
+        listener.stop()  # Drains the queue
+        atexit.unregister(listener.stop)
+
+    assert len(written) == 1
+    thread_name, message = written[0]
+    assert thread_name != threading.current_thread().name
+    assert message.endswith("swiftapi.tests - WARNING - SWIFT code CITIUS33XXX not found")
+
+
+def test_access_log_only_in_its_own_file(root_logger, monkeypatch):
+    written = {}
+
+    class RecordingHandler(logging.Handler):
+        def __init__(self, name):
+            super().__init__()
+            self.name = name
+
+        def emit(self, record):
+            written.setdefault(self.name, []).append(record.getMessage())
+
+    monkeypatch.setattr(logging, "FileHandler", lambda path, **kwargs: RecordingHandler(path.name))
+    monkeypatch.setattr(logging, "StreamHandler", lambda: RecordingHandler("console"))
+    # Alembic's fileConfig() in the migration tests disables existing loggers
+    monkeypatch.setattr(get_logger("access"), "disabled", False)
+    listener = setup_logging()
+    try:
+        get_logger("access").info("GET /v1/swift-codes/CITIUS33XXX 200 1.00 ms -")
+        get_logger("app.tests").warning("SWIFT code %s not found", "CITIUS33XXX")
+    finally:
+        listener.stop()
+        atexit.unregister(listener.stop)
+
+    assert written == {
+        "app.log": ["SWIFT code CITIUS33XXX not found"],
+        "console": ["SWIFT code CITIUS33XXX not found"],
+        "access.log": ["GET /v1/swift-codes/CITIUS33XXX 200 1.00 ms -"],
+    }
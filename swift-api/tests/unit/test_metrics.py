@@ -0,0 +1,102 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import create_engine
+from app.metrics import (
+    Counter,
+    GaugeFunction,
+    Histogram,
+    Registry,
+    RequestStats,
+    current_request,
+    instrument_engine,
+)
+
+
+def test_counter_renders_labelled_samples():
+    counter = Counter("requests_total", "Requests", ["route", "status"])
+    counter.inc("/a", "200")
+    counter.inc("/a", "200", amount=2)
+    counter.inc("/b", "404")
+
+    assert counter.render() == [
+        "# HELP requests_total Requests",
+        "# TYPE requests_total counter",
+        'requests_total{route="/a",status="200"} 3',
+        'requests_total{route="/b",status="404"} 1',
+    ]
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", "Latency", ["route"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value, "/a")
+
+    assert histogram.count("/a") == 4
+    assert histogram.sum("/a") == pytest.approx(2.65)
+    assert histogram.render()[2:] == [
+        'latency_seconds_bucket{route="/a",le="0.1"} 2',
+        'latency_seconds_bucket{route="/a",le="1.0"} 3',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 4',
+        'latency_seconds_sum{route="/a"} 2.65',
+        'latency_seconds_count{route="/a"} 4',
+    ]
+
+
+def test_label_values_are_escaped():
+    counter = Counter("errors_total", "Errors", ["field"])
+    counter.inc('bad "field"\n')
+
+    assert counter.render()[-1] == 'errors_total{field="bad \\"field\\"\\n"} 1'
+
+
+def test_registry_renders_all_metrics():
+    registry = Registry()
+    registry.register(Counter("a_total", "A")).inc()
+    registry.register(GaugeFunction("ratio", "Ratio", lambda: 0.5))
+    registry.register(GaugeFunction("unknown", "Not available yet", lambda: None))
+
+    rendered = registry.render()
+
+    assert "a_total 1\n" in rendered
+    assert "ratio 0.5\n" in rendered
+    assert rendered.endswith("# TYPE unknown gauge\n")  # No sample without a value
+
+
+def test_instrumented_engine_counts_queries_of_current_request():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    instrument_engine(engine)  # Listeners are registered once
+
+    stats = RequestStats()
+    token = current_request.set(stats)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+    finally:
+        current_request.reset(token)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 3"))  # Outside of a request, not attributed
+
+    assert stats.queries == 2
+    assert stats.query_seconds > 0
+
+
+def test_failed_queries_leave_no_timing_state():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+
+    stats = RequestStats()
+    token = current_request.set(stats)
+    try:
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+            connection.execute(text("SELECT 1"))
+            assert connection.info == {}
+    finally:
+        current_request.reset(token)
+
+    assert stats.queries == 1
@@ -0,0 +1,81 @@
+import pstats
+import threading
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.profiler import CProfileSession, ProfilerMiddleware, profile_path
+
+
+def make_client(tmp_path, **options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware, directory=tmp_path, **options)
+
+    @app.get("/v1/swift-codes/{swiftCode}")
+    async def get_swift_code(swiftCode: str):
+        return {"swiftCode": swiftCode}
+
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def cprofile_only(monkeypatch):
+    # Same output whether pyinstrument is installed or not
+    monkeypatch.setattr("app.profiler._profiler_class", lambda: CProfileSession)
+
+
+def test_request_with_token_is_profiled(tmp_path):
+    client = make_client(tmp_path, token="secret", sample_rate=0)
+
+    assert client.get("/v1/swift-codes/CITIUS33XXX", headers={"X-Profile": "secret"}).status_code == 200
+
+    (profile,) = tmp_path.iterdir()
+    assert "-GET-v1_swift_codes_CITIUS33XXX-" in profile.name
+    assert profile.suffix == ".prof"
+    functions = {name for _, _, name in pstats.Stats(str(profile)).stats}
+    assert "get_swift_code" in functions
+
+
+def test_request_without_or_with_wrong_token_is_not_profiled(tmp_path):
+    client = make_client(tmp_path, token="secret", sample_rate=0)
+
+    client.get("/v1/swift-codes/CITIUS33XXX")
+    client.get("/v1/swift-codes/CITIUS33XXX", headers={"X-Profile": "guess"})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sampled_requests_are_profiled(tmp_path):
+    client = make_client(tmp_path, token="", sample_rate=1.0)
+
+    client.get("/v1/swift-codes/CITIUS33XXX")
+    client.get("/v1/swift-codes/CITIUS33MIA")
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_profile_is_written_off_the_event_loop(tmp_path, monkeypatch):
+    threads = {}
+
+    class RecordingSession(CProfileSession):
+        def stop(self):
+            threads["stop"] = threading.current_thread()
+            super().stop()
+
+        def write(self, file_path):
+            threads["write"] = threading.current_thread()
+            super().write(file_path)
+
+    monkeypatch.setattr("app.profiler._profiler_class", lambda: RecordingSession)
+    client = make_client(tmp_path, token="", sample_rate=1.0)
+
+    client.get("/v1/swift-codes/CITIUS33XXX")
+
+    assert threads["write"] is not threads["stop"]
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_profile_path_is_safe_for_any_url(tmp_path):
+    path = profile_path("GET", "/../etc/passwd", ".prof", tmp_path)
+
+    assert path.parent == tmp_path
+    assert "-GET-etc_passwd-" in path.name
@@ -0,0 +1,113 @@
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import create_engine
+from app import query_log
+from app.query_log import (
+    QueryLogMiddleware,
+    capture_queries,
+    instrument_queries,
+    request_id,
+    request_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_queries(engine)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE codes (code VARCHAR PRIMARY KEY)"))
+    yield engine
+    engine.dispose()
+
+
+def test_queries_are_recorded_under_request_id(engine):
+    queries = []
+    id_token, queries_token = request_id.set("req-1"), request_queries.set(queries)
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT * FROM codes WHERE code = :code"), {"code": "CITIUS33XXX"})
+    finally:
+        request_queries.reset(queries_token)
+        request_id.reset(id_token)
+
+    assert len(queries) == 1
+    assert queries[0].request_id == "req-1"
+    assert queries[0].statement == "SELECT * FROM codes WHERE code = ?"
+    assert queries[0].parameters == ("CITIUS33XXX",)
+    assert queries[0].duration > 0
+
+
+def test_failed_queries_leave_no_timing_state(engine):
+    queries = []
+    token = request_queries.set(queries)
+    try:
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+            connection.execute(text("SELECT 1"))
+            assert connection.info == {}
+    finally:
+        request_queries.reset(token)
+
+    assert [query.statement for query in queries] == ["SELECT 1"]
+
+
+def test_slow_queries_are_logged_with_plan(engine, monkeypatch, caplog):
+    monkeypatch.setattr(query_log, "SLOW_QUERY_MS", 0)
+    # Alembic's fileConfig() in the migration tests disables existing loggers
+    monkeypatch.setattr(query_log.slow_query_logger, "disabled", False)
+
+    with caplog.at_level(logging.WARNING, logger="swiftapi.slow_queries"):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT * FROM codes WHERE code = :code"), {"code": "CITIUS33XXX"})
+
+    (record,) = caplog.records
+    assert record.name == "swiftapi.slow_queries"
+    assert "Slow query" in record.message
+    assert "SEARCH codes USING" in record.message  # EXPLAIN QUERY PLAN output
+
+
+def test_failed_explain_keeps_transaction(engine):
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        connection.execute(text("INSERT INTO codes VALUES ('CITIUS33XXX')"))
+
+        plan = query_log.explain(connection, "SELECT * FROM missing", ())
+
+        assert plan.startswith("EXPLAIN failed")
+        assert connection.execute(text("SELECT count(*) FROM codes")).scalar() == 1
+        transaction.rollback()
+        assert connection.execute(text("SELECT count(*) FROM codes")).scalar() == 0
+
+
+def test_capture_queries_collects_only_inside_block(engine):
+    with capture_queries(engine) as queries:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 2"))
+
+    assert [query.statement for query in queries] == ["SELECT 1"]
+
+
+def test_middleware_sets_request_id():
+    app = FastAPI()
+    app.add_middleware(QueryLogMiddleware)
+
+    @app.get("/")
+    def read_request_id():
+        return {"requestId": request_id.get()}
+
+    client = TestClient(app)
+
+    response = client.get("/", headers={"X-Request-ID": "abc"})
+    assert response.json() == {"requestId": "abc"}
+    assert response.headers["x-request-id"] == "abc"
+
+    generated = client.get("/")
+    assert generated.json()["requestId"] == generated.headers["x-request-id"] != "-"
@@ -0,0 +1,241 @@
+import json
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.pool import StaticPool
+from app.models import SwiftCode
+from app.routers import swift_codes
+from app.routers.swift_codes import get_swift_code, lookup_swift_codes
+from app.schemas import (
+    HeadquarterSwiftCodeResponse,
+    BranchSwiftCodeResponse,
+    SwiftCodeLookupRequest,
+    SwiftCodeLookupResponse,
+)
+from app import snapshot as snapshot_module
+from app.loader.columnar import write_snapshot
+from app.loader.validation import COLUMNS
+from app.snapshot import SwiftCodeSnapshot, warm_up_snapshot
+
+
+def make_code(swift_code: str) -> SwiftCode:
+    return SwiftCode(
+        swiftCode=swift_code,
+        bankName="CITIBANK",
+        address="NEW YORK",
+        countryISO2="US",
+        countryName="UNITED STATES",
+        isHeadquarter=swift_code.endswith("XXX"),
+    )
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            [make_code("CITIUS33XXX"), make_code("CITIUS33MIA"), make_code("CITIUS33NYC")]
+        )
+        session.commit()
+        yield session
+
+
+@pytest.fixture
+def loaded_snapshot(session, monkeypatch):
+    snap = SwiftCodeSnapshot()
+    snap.load(session)
+    monkeypatch.setattr(swift_codes, "snapshot", snap)
+    return snap
+
+
+class TestSwiftCodeSnapshot:
+    def test_not_loaded_by_default(self):
+        snap = SwiftCodeSnapshot()
+        assert snap.loaded is False
+        assert snap.get("CITIUS33XXX") is None
+
+    def test_load(self, session):
+        snap = SwiftCodeSnapshot()
+        snap.load(session)
+
+        assert snap.loaded is True
+        assert len(snap) == 3
+        assert snap.get("CITIUS33XXX").bankName == "CITIBANK"
+        assert {b.swiftCode for b in snap.get_branches("CITIUS33XXX")} == {
+            "CITIUS33MIA",
+            "CITIUS33NYC",
+        }
+
+    def test_add_and_remove(self, session):
+        snap = SwiftCodeSnapshot()
+        snap.load(session)
+
+        snap.add(make_code("CITIUS33LAX"))
+        assert snap.get("CITIUS33LAX") is not None
+        assert len(snap.get_branches("CITIUS33XXX")) == 3
+
+        snap.remove("CITIUS33LAX")
+        snap.remove("CITIUS33MIA")
+        assert snap.get("CITIUS33LAX") is None
+        assert [b.swiftCode for b in snap.get_branches("CITIUS33XXX")] == ["CITIUS33NYC"]
+
+    def test_add_ignored_when_not_loaded(self):
+        snap = SwiftCodeSnapshot()
+        snap.add(make_code("CITIUS33LAX"))
+        assert snap.get("CITIUS33LAX") is None
+
+    def test_changes_during_load_are_kept(self, session):
+        snap = SwiftCodeSnapshot()
+        snap.load(session)
+
+        def records():
+            # read before the changes below were committed
+            yield make_code("CITIUS33XXX")
+            yield make_code("CITIUS33MIA")
+            snap.add(make_code("CITIUS33LAX"))
+            snap.remove("CITIUS33MIA")
+
+        snap.load_records(records())
+
+        assert snap.get("CITIUS33LAX") is not None
+        assert snap.get("CITIUS33MIA") is None
+        assert [b.swiftCode for b in snap.get_branches("CITIUS33XXX")] == ["CITIUS33LAX"]
+
+        snap.add(make_code("CITIUS33NYC"))
+        snap.load_records([make_code("CITIUS33XXX")])
+        assert snap.get("CITIUS33NYC") is None
+
+    def test_invalidate(self, session):
+        snap = SwiftCodeSnapshot()
+        snap.load(session)
+        snap.invalidate()
+
+        assert snap.loaded is False
+        assert len(snap) == 0
+
+
+class TestSnapshotFile:
+    @pytest.fixture
+    def snapshot_file(self, tmp_path):
+        rows = pd.DataFrame(
+            [make_code(code).model_dump() for code in ["CITIUS33XXX", "CITIUS33MIA"]]
+        )
+        rows["bankCode"] = rows["swiftCode"].str[:8]
+        file_path = tmp_path / "codes.swiftsnap"
+        write_snapshot(file_path, rows[COLUMNS])
+        return file_path
+
+    def test_load_file(self, snapshot_file):
+        snap = SwiftCodeSnapshot()
+        snap.load_file(snapshot_file)
+
+        assert snap.loaded is True
+        assert snap.get("CITIUS33XXX").isHeadquarter is True
+        assert [b.swiftCode for b in snap.get_branches("CITIUS33XXX")] == ["CITIUS33MIA"]
+
+    @pytest.fixture
+    def database(self, monkeypatch):
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        SQLModel.metadata.create_all(engine)
+        monkeypatch.setattr(snapshot_module, "engine", engine)
+        with Session(engine) as session:
+            session.add_all([make_code("CITIUS33XXX"), make_code("CITIUS33MIA")])
+            session.commit()
+            yield session
+
+    @pytest.fixture
+    def load_snapshot(self, snapshot_file, monkeypatch):
+        snap = SwiftCodeSnapshot()
+        load_snapshot = MagicMock()
+        monkeypatch.setattr(snapshot_module, "snapshot", snap)
+        monkeypatch.setattr(snapshot_module, "load_snapshot", load_snapshot)
+        monkeypatch.setattr(snapshot_module, "SNAPSHOT_FILE", str(snapshot_file))
+        return load_snapshot
+
+    def test_warm_up_from_file(self, database, load_snapshot):
+        warm_up_snapshot()
+
+        assert len(snapshot_module.snapshot) == 2
+        load_snapshot.assert_not_called()
+
+    def test_stale_file_not_served(self, database, load_snapshot):
+        # CITIUS33NYC created after the file was written
+        database.add(make_code("CITIUS33NYC"))
+        database.commit()
+
+        warm_up_snapshot()
+
+        assert snapshot_module.snapshot.loaded is False
+        load_snapshot.assert_called_once()
+
+    def test_changed_row_not_served(self, database, load_snapshot):
+        # same codes, but the bank was renamed after the file was written
+        database.get(SwiftCode, "CITIUS33MIA").bankName = "CITIBANK N.A."
+        database.commit()
+
+        warm_up_snapshot()
+
+        assert snapshot_module.snapshot.loaded is False
+        load_snapshot.assert_called_once()
+
+    def test_warm_up_falls_back_to_database(self, tmp_path, monkeypatch):
+        load_snapshot = MagicMock()
+        monkeypatch.setattr(snapshot_module, "load_snapshot", load_snapshot)
+        monkeypatch.setattr(snapshot_module, "SNAPSHOT_FILE", str(tmp_path / "missing.swiftsnap"))
+
+        warm_up_snapshot()
+
+        load_snapshot.assert_called_once()
+
+
+class TestGetSwiftCodeFromSnapshot:
+    async def test_hq_served_without_db(self, loaded_snapshot):
+        mock_db = MagicMock()
+
+        response = HeadquarterSwiftCodeResponse.model_validate_json(
+            (await get_swift_code("CITIUS33XXX", mock_db)).body
+        )
+
+        assert len(response.branches) == 2
+        mock_db.get.assert_not_called()
+        mock_db.exec.assert_not_called()
+
+    async def test_branch_served_without_db(self, loaded_snapshot):
+        mock_db = MagicMock()
+
+        response = await get_swift_code("CITIUS33MIA", mock_db)
+
+        body = json.loads(response.body)
+        BranchSwiftCodeResponse.model_validate(body)
+        assert "branches" not in body
+        mock_db.get.assert_not_called()
+
+    async def test_snapshot_miss_is_not_found(self, loaded_snapshot):
+        mock_db = MagicMock()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_swift_code("DEUTDEFFXXX", mock_db)
+
+        assert exc_info.value.status_code == 404
+        mock_db.get.assert_not_called()
+
+    async def test_lookup_served_without_db(self, loaded_snapshot):
+        mock_db = MagicMock()
+
+        response = await lookup_swift_codes(
+            SwiftCodeLookupRequest(swiftCodes=["CITIUS33XXX", "CITIUS33MIA", "DEUTDEFFXXX"]),
+            mock_db,
+        )
+
+        response = SwiftCodeLookupResponse.model_validate_json(response.body)
+        assert len(response.results["CITIUS33XXX"].branches) == 2
+        assert isinstance(response.results["CITIUS33MIA"], BranchSwiftCodeResponse)
+        assert response.errors == {"DEUTDEFFXXX": "SWIFT code not found"}
+        mock_db.exec.assert_not_called()
@@ -1,4 +1,6 @@
 import pytest
+from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.pool import StaticPool
 from app.models import SwiftCode
 from app.schemas import SwiftCodeCreate
 
@@ -61,3 +63,24 @@ def test_countryISO2code_validation():
             countryName="USA",
             isHeadquarter=True,
         )
+
+
+def test_bank_code_filled_on_insert():
+    """Test that bankCode is derived from swiftCode when not given explicitly"""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(
+            SwiftCode(
+                swiftCode="CITIUS33MIA",
+                bankName="Citibank Miami",
+                address="Miami",
+                countryISO2="US",
+                countryName="UNITED STATES",
+                isHeadquarter=False,
+            )
+        )
+        session.commit()
+
+        assert session.get(SwiftCode, "CITIUS33MIA").bankCode == "CITIUS33"
@@ -5,6 +5,7 @@ from app.validators import (
     CountryISO2CodeValidationError,
     validate_countryISO2code_format,
     validate_swift_code_format,
+    validate_swift_codes,
     SwiftCodeValidationError,
 )
 
@@ -67,6 +68,62 @@ class TestValidateSwiftCodeFormat:
             validate_swift_code_format(code)
 
 
+class TestValidateSwiftCodes:
+    def test_normalized_codes_and_errors_by_index(self):
+        normalized, errors = validate_swift_codes(
+            ["AAISALTRXXX", " bchiclr10r2 ", "AAISALTR", "123456TRXXX"]
+        )
+
+        assert normalized == ["AAISALTRXXX", "BCHICLR10R2", None, None]
+        assert errors == {
+            2: "SWIFT code must be 11 characters long",
+            3: "First 6 characters must be alphabetic",
+        }
+
+    def test_accepts_any_iterable(self):
+        normalized, errors = validate_swift_codes(code for code in ["AAISALTRXXX"])
+
+        assert normalized == ["AAISALTRXXX"]
+        assert errors == {}
+
+    def test_mixed_batch_same_as_single_validator(self):
+        codes = [
+            "AAISALTRXXX",
+            "\taaisaltrxxx ",
+            "  ",
+            "",
+            "ÀAISALTRXXX",
+            "AAIS ALTRXXX",
+            "AAISALTR?XX",
+            " AAISALTR-XX",
+            "ßAISALTRXX",
+            "BCHICLR10R2",
+        ]
+
+        normalized, errors = validate_swift_codes(codes)
+
+        for idx, code in enumerate(codes):
+            try:
+                assert normalized[idx] == validate_swift_code_format(code)
+                assert idx not in errors
+            except SwiftCodeValidationError as e:
+                assert (normalized[idx], errors[idx]) == (None, str(e))
+        assert list(errors) == sorted(errors)
+
+    @pytest.mark.parametrize(
+        "code", ["aaisaltrxxx", "AAISALTRXX ", "ÀAISALTRXXX", "AAISALTR#XX", "AAISALTRXXX\n"]
+    )
+    def test_same_result_as_single_validator(self, code):
+        normalized, errors = validate_swift_codes([code])
+
+        try:
+            expected = validate_swift_code_format(code)
+        except SwiftCodeValidationError as e:
+            assert (normalized, errors) == ([None], {0: str(e)})
+        else:
+            assert (normalized, errors) == ([expected], {})
+
+
 class TestCountryISO2CodeFormat:
     VALID_COUNTRY_ISO2_CODES = ["US", "PL", "AU"]
 